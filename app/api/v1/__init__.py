@@ -8,6 +8,8 @@ from .film_routes import router as films_router
 from .customer_routes import router as customers_router
 from .ai_routes import router as ai_chat_router
 from .auth_routes import router as auth_router
+from .metrics_routes import router as metrics_router
+from .admin_routes import router as admin_router
 # from .streaming import router as streaming_router      # When created
 
 # Main API router for version 1
@@ -20,4 +22,6 @@ api_router.include_router(films_router)
 api_router.include_router(customers_router)
 api_router.include_router(ai_chat_router)
 api_router.include_router(auth_router)
+api_router.include_router(metrics_router)
+api_router.include_router(admin_router)
 # api_router.include_router(streaming_router)     # When created 
\ No newline at end of file
@@ -0,0 +1,170 @@
+"""
+Admin API endpoints (bearer ADMIN_TOKEN required).
+"""
+
+from typing import Any, Dict, Optional
+
+from fastapi import APIRouter, BackgroundTasks, Depends, Header, HTTPException, Path, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
+
+from core.logging import get_logger
+from core.security import RequireAdminToken
+from core.streaming import ContextStreamingResponse, accepts_gzip, gzip_stream
+from domain.caches import film_cache, reference_cache
+from domain.catalog import category_index, reference_data
+from domain.services.deps import get_film_import_service, get_snapshot_service, get_table_export_service
+from domain.services.film_import_service import IMPORT_FORMATS, FilmImportService, new_import_id
+from domain.services.snapshot_service import SNAPSHOT_FORMATS, SnapshotService, new_snapshot_id
+from domain.services.table_export_service import EXPORT_TABLES, TableExportService
+
+logger = get_logger(__name__)
+
+router = APIRouter(prefix="/admin", tags=["Admin"], dependencies=[RequireAdminToken])
+
+
+@router.get("/export/{table}.csv", response_class=StreamingResponse)
+async def export_table_csv(
+    table: str = Path(..., pattern=f"^({'|'.join(EXPORT_TABLES)})$", description="Table to export"),
+    accept_encoding: Optional[str] = Header(None),
+    export_service: TableExportService = Depends(get_table_export_service)
+) -> StreamingResponse:
+    """Stream a whole table as CSV via Postgres COPY (gzip-encoded if the client accepts it)."""
+    headers = {
+        "Cache-Control": "no-store",
+        "Content-Disposition": f'attachment; filename="{table}.csv"',
+        "Vary": "Accept-Encoding",
+    }
+    transform = None
+
+    if accepts_gzip(accept_encoding):
+        transform = gzip_stream
+        headers["Content-Encoding"] = "gzip"
+
+    return ContextStreamingResponse(
+        lambda: export_service.csv(table), transform=transform, media_type="text/csv", headers=headers
+    )
+
+
+async def _run_snapshot(snapshot_service: SnapshotService, snapshot_id: str, file_format: str) -> None:
+    try:
+        await snapshot_service.create_snapshot(snapshot_id, file_format)
+    except Exception as e:
+        logger.error("Snapshot failed", snapshot_id=snapshot_id, error=str(e), exc_info=True)
+
+
+@router.post("/snapshots", status_code=status.HTTP_202_ACCEPTED)
+async def create_snapshot(
+    background_tasks: BackgroundTasks,
+    file_format: str = Query("parquet", alias="format", pattern=f"^({'|'.join(SNAPSHOT_FORMATS)})$"),
+    snapshot_service: SnapshotService = Depends(get_snapshot_service)
+) -> Dict[str, Any]:
+    """Start a columnar snapshot of film, inventory, rental and payment; poll GET /admin/snapshots/{id}."""
+    try:
+        snapshot_service.check_available()
+    except ImportError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(e)
+        )
+
+    snapshot_id = new_snapshot_id()
+    background_tasks.add_task(_run_snapshot, snapshot_service, snapshot_id, file_format)
+    return {"snapshot_id": snapshot_id, "format": file_format, "status": "running"}
+
+
+@router.get("/snapshots/{snapshot_id}")
+async def get_snapshot(
+    response: Response,
+    snapshot_id: str = Path(..., pattern=r"^[A-Za-z0-9_-]+$"),
+    snapshot_service: SnapshotService = Depends(get_snapshot_service)
+) -> Dict[str, Any]:
+    """Manifest of a completed snapshot (202 while it is still being written)."""
+    manifest = snapshot_service.get_manifest(snapshot_id)
+    if manifest is not None:
+        return {**manifest, "status": "complete"}
+
+    if snapshot_service.exists(snapshot_id):
+        response.status_code = status.HTTP_202_ACCEPTED
+        return {"snapshot_id": snapshot_id, "status": "running"}
+
+    raise HTTPException(
+        status_code=status.HTTP_404_NOT_FOUND,
+        detail=f"Snapshot {snapshot_id} not found"
+    )
+
+
+async def _run_import(import_service: FilmImportService, job_id: str, path: Optional[str] = None, file_format: Optional[str] = None) -> None:
+    try:
+        await import_service.run(job_id, path, file_format)
+    except Exception as e:
+        logger.error("Film import failed", job_id=job_id, error=str(e), exc_info=True)
+
+
+@router.post("/imports", status_code=status.HTTP_202_ACCEPTED)
+async def start_import(
+    request: Request,
+    background_tasks: BackgroundTasks,
+    file_format: str = Query(..., alias="format", pattern=f"^({'|'.join(IMPORT_FORMATS)})$"),
+    import_service: FilmImportService = Depends(get_film_import_service)
+) -> Dict[str, Any]:
+    """
+    Upload a film catalog (the raw request body: CSV with a header row, or
+    JSON Lines) and import it in the background; poll GET /admin/imports/{id}.
+    """
+    job_id = new_import_id()
+    path, size = await import_service.save_upload(job_id, file_format, request.stream())
+    background_tasks.add_task(_run_import, import_service, job_id, path, file_format)
+    return {"job_id": job_id, "format": file_format, "bytes": size, "status": "running"}
+
+
+@router.get("/imports/{job_id}")
+async def get_import(
+    job_id: str = Path(..., pattern=r"^[A-Za-z0-9_-]+$"),
+    import_service: FilmImportService = Depends(get_film_import_service)
+) -> Dict[str, Any]:
+    """Checkpoint of an import job, with progress and throughput while it runs in this process."""
+    job = await import_service.get_job(job_id)
+    if job is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Import job {job_id} not found"
+        )
+    return job
+
+
+@router.post("/imports/{job_id}/resume", status_code=status.HTTP_202_ACCEPTED)
+async def resume_import(
+    background_tasks: BackgroundTasks,
+    job_id: str = Path(..., pattern=r"^[A-Za-z0-9_-]+$"),
+    import_service: FilmImportService = Depends(get_film_import_service)
+) -> Dict[str, Any]:
+    """Resume a failed or interrupted import from its last committed chunk."""
+    job = await import_service.get_job(job_id)
+    if job is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Import job {job_id} not found"
+        )
+    if job["status"] == "completed" or import_service.is_running(job_id):
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Import job {job_id} is {job['status']}"
+        )
+
+    background_tasks.add_task(_run_import, import_service, job_id)
+    return {"job_id": job_id, "status": "running", "resume_from": job["rows_committed"]}
+
+
+@router.post("/reference-data/invalidate")
+async def invalidate_reference_data() -> Dict[str, Any]:
+    """
+    Reload languages, categories and stores on every worker, e.g. after
+    editing those tables by hand. Cached films carry the language name, so
+    the film cache is retired too, and the category index is rebuilt so
+    hand-edited film_category links reach category filters and facets.
+    """
+    await reference_data.invalidate()
+    await category_index.invalidate()
+    await film_cache.invalidate()
+    logger.info("Reference data invalidated", version=reference_cache.version.value)
+    return {"version": reference_cache.version.value}
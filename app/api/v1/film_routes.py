@@ -2,36 +2,218 @@
 Films API endpoints.
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from typing import Optional
+from fastapi import APIRouter, Depends, Header, HTTPException, Response, status, Query
+from fastapi.responses import StreamingResponse
+from datetime import datetime
+from typing import Optional, Sequence, Tuple
 
 from core.security import RequireAdminToken
+from core.etag import etag_matches, not_modified
+from core.response_cache import set_surrogate_keys
+from core.responses import model_response, sparse_response
+from core.streaming import ContextStreamingResponse, accepts_gzip, gzip_stream
+from domain.catalog.cache_keys import FILMS_LIST, film_key
+from domain.catalog.versions import catalog_versions
 from domain.services.film_service import FilmService
-from domain.models.requests.film import CreateFilmRequest, UpdateFilmRequest
-from domain.models.responses.film import FilmResponse, FilmListResponse, FilmCreateResponse
-from domain.services.deps import get_film_service
+from domain.models.requests.film import CreateFilmRequest, UpdateFilmRequest, FilmBatchRequest, FilmBulkRequest, FilmFilter
+from domain.models.responses.film import FilmResponse, FilmListResponse, FilmCreateResponse, FilmBatchResponse, FilmFacetsResponse, FilmDetailResponse, FilmBulkResponse
+from domain.services.deps import get_film_service, get_film_export_service
+from domain.services.film_export_service import FilmExportService
+from domain.utils.fieldsets import FILM_FIELDS, parse_film_fields
 
 router = APIRouter(prefix="/films", tags=["Films"])
 
+FIELDS_QUERY = Query(
+    None,
+    description=f"Comma-separated film fields to return (film_id is always included): {', '.join(FILM_FIELDS)}"
+)
+
+
+def get_fields(fields: Optional[str] = FIELDS_QUERY) -> Optional[Tuple[str, ...]]:
+    """Parse the sparse fieldset parameter."""
+    try:
+        return parse_film_fields(fields)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
+
+def get_film_filter(
+    rating: Optional[str] = Query(None, description="Comma-separated MPAA ratings; films with any of them match"),
+    language_id: Optional[int] = Query(None, description="Language ID"),
+    min_length: Optional[int] = Query(None, description="Minimum length in minutes"),
+    max_length: Optional[int] = Query(None, description="Maximum length in minutes"),
+    min_rental_rate: Optional[float] = Query(None, description="Minimum rental rate"),
+    max_rental_rate: Optional[float] = Query(None, description="Maximum rental rate"),
+    min_release_year: Optional[int] = Query(None, description="Earliest release year"),
+    max_release_year: Optional[int] = Query(None, description="Latest release year"),
+    special_features: Optional[str] = Query(None, description="Comma-separated special features; films with all of them match"),
+    streaming_available: Optional[bool] = Query(None, description="Available for streaming")
+) -> Optional[FilmFilter]:
+    """Build the film filter from query parameters (None when no criterion is given)."""
+    try:
+        film_filter = FilmFilter(
+            ratings=[value.strip() for value in rating.split(",") if value.strip()] if rating else None,
+            language_id=language_id,
+            min_length=min_length,
+            max_length=max_length,
+            min_rental_rate=min_rental_rate,
+            max_rental_rate=max_rental_rate,
+            min_release_year=min_release_year,
+            max_release_year=max_release_year,
+            special_features=[value.strip() for value in special_features.split(",") if value.strip()] if special_features else None,
+            streaming_available=streaming_available,
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    return None if film_filter.is_empty() else film_filter
+
+
 @router.get("/", response_model=FilmListResponse)
 async def get_films(
+    response: Response,
     page: int = Query(1, ge=1, description="Page number (1-based)"),
     page_size: int = Query(10, ge=1, le=100, description="Number of records per page"),
-    category: Optional[str] = Query(None, description="Filter by category name (case-insensitive partial match)"),
+    category: Optional[str] = Query(None, description="Filter by category ID or exact category name (case-insensitive)"),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from a previous response's next_cursor (takes precedence over page)"),
+    include_total: bool = Query(False, description="Also count the matching films on cursor pages (page-based responses always include the total)"),
+    fields: Optional[Sequence[str]] = Depends(get_fields),
+    film_filter: Optional[FilmFilter] = Depends(get_film_filter),
+    if_none_match: Optional[str] = Header(None),
     service: FilmService = Depends(get_film_service)
 ) -> FilmListResponse:
-    """Get paginated list of films with optional category filter."""
-    response = await service.get_films(page=page, page_size=page_size, category=category)
+    """Get paginated list of films, optionally filtered by category and film attributes."""
+    # Listings change only through film writes, which bump the catalog version
+    etag = await catalog_versions.list_etag(
+        f"page={page}&page_size={page_size}&category={category or ''}&cursor={cursor or ''}"
+        f"&include_total={include_total}&fields={','.join(fields or ())}&{film_filter.cache_key() if film_filter else ''}"
+    )
+    if etag_matches(if_none_match, etag):
+        catalog_versions.not_modified += 1
+        return not_modified(etag)
+    
+    try:
+        films = await service.get_films(
+            page=page, page_size=page_size, category=category, cursor=cursor, fields=fields,
+            film_filter=film_filter, include_total=include_total
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
     
-    return response
+    response.headers["ETag"] = etag
+    set_surrogate_keys(response, FILMS_LIST)
+    return sparse_response(films, response) if fields else model_response(films, FilmListResponse, response)
+
+
+@router.get("/search", response_model=FilmListResponse)
+async def search_films(
+    response: Response,
+    q: str = Query(..., min_length=1, max_length=200, description="Search query (fulltext mode supports \"quoted phrases\", or, -exclusions)"),
+    page: int = Query(1, ge=1, description="Page number (1-based)"),
+    page_size: int = Query(10, ge=1, le=100, description="Number of records per page"),
+    mode: str = Query("fulltext", pattern="^(fulltext|index)$", description="fulltext (Postgres) or index (in-process BM25, search-as-you-type)"),
+    service: FilmService = Depends(get_film_service)
+) -> FilmListResponse:
+    """Ranked search over films."""
+    films = await service.search_films(q, page=page, page_size=page_size, mode=mode)
+    set_surrogate_keys(response, FILMS_LIST)
+    return model_response(films, FilmListResponse, response)
+
+
+@router.get("/facets", response_model=FilmFacetsResponse)
+async def get_film_facets(
+    response: Response,
+    category: Optional[str] = Query(None, description="Filter by category ID or exact category name (case-insensitive)"),
+    film_filter: Optional[FilmFilter] = Depends(get_film_filter),
+    service: FilmService = Depends(get_film_service)
+) -> FilmFacetsResponse:
+    """Film counts per rating, category, language and streaming availability, honouring the listing filters."""
+    facets = await service.get_facets(category=category, film_filter=film_filter)
+    set_surrogate_keys(response, FILMS_LIST)
+    return model_response(facets, FilmFacetsResponse, response)
+
+
+@router.get("/export", response_class=StreamingResponse, dependencies=[RequireAdminToken])
+async def export_films(
+    since: Optional[datetime] = Query(None, description="Only films with last_update at or after this time (ISO 8601)"),
+    accept_encoding: Optional[str] = Header(None),
+    export_service: FilmExportService = Depends(get_film_export_service)
+) -> StreamingResponse:
+    """Stream the film catalog as NDJSON (gzip-encoded if the client accepts it)."""
+    headers = {"Cache-Control": "no-store", "Vary": "Accept-Encoding"}
+    transform = None
+    
+    if accepts_gzip(accept_encoding):
+        transform = gzip_stream
+        headers["Content-Encoding"] = "gzip"
+    
+    return ContextStreamingResponse(
+        lambda: export_service.ndjson(since), transform=transform, media_type="application/x-ndjson", headers=headers
+    )
+
+
+@router.post("/batch", response_model=FilmBatchResponse)
+async def get_films_batch(
+    request: FilmBatchRequest,
+    response: Response,
+    fields: Optional[Sequence[str]] = Depends(get_fields),
+    service: FilmService = Depends(get_film_service)
+) -> FilmBatchResponse:
+    """Get up to FILM_BATCH_MAX_IDS films by ID in one request, in request order."""
+    films = await service.get_films_by_ids(request.film_ids, fields=fields)
+    return sparse_response(films, response) if fields else model_response(films, FilmBatchResponse, response)
+
+
+@router.post("/bulk", response_model=FilmBulkResponse, dependencies=[RequireAdminToken])
+async def create_films_bulk(
+    request: FilmBulkRequest,
+    response: Response,
+    service: FilmService = Depends(get_film_service)
+) -> FilmBulkResponse:
+    """
+    Create (or, with film_id, replace) up to FILM_BULK_MAX_ITEMS films.
+    
+    Items that cannot be written are listed in ``errors`` by position; the
+    others are written regardless.
+    """
+    result = await service.create_films(request.films)
+    return model_response(result, FilmBulkResponse, response)
 
 
 @router.get("/{film_id}", response_model=FilmResponse)
 async def get_film(
     film_id: int,
+    response: Response,
+    fields: Optional[Sequence[str]] = Depends(get_fields),
+    if_none_match: Optional[str] = Header(None),
     service: FilmService = Depends(get_film_service)
 ) -> FilmResponse:
     """Get a film by ID."""
+    if fields:
+        film = await service.get_film(film_id, fields=fields)
+        if not film:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Film with ID {film_id} not found"
+            )
+        set_surrogate_keys(response, film_key(film_id))
+        return sparse_response(film, response)
+    
+    # Films seen before are revalidated from the ETag map, without the database
+    etag = await catalog_versions.film_etag(film_id)
+    if etag_matches(if_none_match, etag):
+        catalog_versions.not_modified += 1
+        return not_modified(etag)
+    
+    generation = catalog_versions.generation
     film = await service.get_film(film_id)
     
     if not film:
@@ -40,13 +222,40 @@ async def get_film(
             detail=f"Film with ID {film_id} not found"
         )
     
-    return film
+    etag = catalog_versions.film_tag(film.film_id, film.last_update)
+    catalog_versions.remember_film(film_id, etag, generation)
+    if etag_matches(if_none_match, etag):
+        catalog_versions.not_modified += 1
+        return not_modified(etag)
+    
+    response.headers["ETag"] = etag
+    set_surrogate_keys(response, film_key(film_id))
+    return model_response(film, FilmResponse, response)
 
 @router.get("/search/{film_search_title}", response_model=FilmResponse | None)
 async def get_film_by_title(
     film_search_title: str,
+    response: Response,
     service: FilmService = Depends(get_film_service)
 ) -> FilmResponse | None:
     """Get a film by title."""
     film = await service.get_film_by_title_search(film_search_title.upper())
-    return film
+    set_surrogate_keys(response, FILMS_LIST)
+    return model_response(film, FilmResponse, response)
+
+@router.get("/{film_id}/full", response_model=FilmDetailResponse)
+async def get_film_detail(
+    film_id: int,
+    response: Response,
+    service: FilmService = Depends(get_film_service)
+) -> FilmDetailResponse:
+    """Get a film with its actors and categories (one database query)."""
+    film = await service.get_film_detail(film_id)
+    if not film:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Film with ID {film_id} not found"
+        )
+    
+    set_surrogate_keys(response, film_key(film_id))
+    return model_response(film, FilmDetailResponse, response)
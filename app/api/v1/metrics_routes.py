@@ -0,0 +1,17 @@
+"""
+Metrics API endpoints.
+"""
+
+from typing import Any, Dict
+
+from fastapi import APIRouter
+
+from core.metrics import collect_metrics
+
+router = APIRouter(prefix="/metrics", tags=["metrics"])
+
+
+@router.get("/")
+async def get_metrics() -> Dict[str, Dict[str, Any]]:
+    """Current in-process metrics (caches, indexes, background jobs)."""
+    return collect_metrics()
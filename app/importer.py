@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Import a film catalog file (CSV with a header row, or JSON Lines) into the film table.
+
+Rows are validated like POST /films and committed in chunks; an interrupted
+import resumes from its last committed chunk when run again with --resume.
+
+Usage:
+    python -m app.importer films.csv [--format csv|jsonl] [--chunk-size 5000] [--job-id ID]
+    python -m app.importer --resume ID
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+
+from core.config import settings
+from core.logging import configure_logging
+from domain.services.film_import_service import IMPORT_FORMATS, FilmImportService, new_import_id
+
+
+def main():
+    """Parse arguments, run (or resume) the import and print its summary."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("path", nargs="?", help="File to import")
+    parser.add_argument("--format", choices=list(IMPORT_FORMATS), help="File format (default: from the file extension)")
+    parser.add_argument("--chunk-size", type=int, default=settings.import_chunk_size, help="Rows per committed chunk")
+    parser.add_argument("--job-id", help="ID of the new import job (default: UTC timestamp)")
+    parser.add_argument("--resume", metavar="JOB_ID", help="Resume a failed import from its last committed chunk")
+    args = parser.parse_args()
+
+    if bool(args.path) == bool(args.resume):
+        parser.error("give either a file to import or --resume JOB_ID")
+
+    file_format = args.format
+    if args.path and file_format is None:
+        file_format = os.path.splitext(args.path)[1].lstrip(".").lower()
+        if file_format not in IMPORT_FORMATS:
+            parser.error(f"cannot tell the format of {args.path}; pass --format")
+
+    configure_logging()
+    job_id = args.resume or args.job_id or new_import_id()
+    print(f"Import job {job_id}", file=sys.stderr)
+
+    service = FilmImportService()
+    summary = asyncio.run(service.run(job_id, args.path, file_format, args.chunk_size))
+    print(json.dumps(summary, indent=2, default=str))
+
+
+if __name__ == "__main__":
+    main()
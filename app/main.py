@@ -4,14 +4,19 @@ Main entry point for the mini-pagilla-api application.
 """
 import time
 from fastapi import FastAPI
+from fastapi.responses import JSONResponse
 import uvicorn
 from contextlib import asynccontextmanager
 
 from app.api.v1 import api_router
 from core.config import settings
 from core.middleware import DebugMiddleware
+from core.response_cache import ResponseCacheMiddleware
+from core.responses import FastJSONResponse
 from core.logging import configure_logging, get_logger
 from core.ai_kernel import kernel_lifespan
+from core.catalog import catalog_lifespan
+from core.cache import close_cache_backend
 
 # Configure structured logging
 configure_logging()
@@ -24,7 +29,7 @@ async def lifespan(app: FastAPI):
     
     try:
         # Initialize AI kernel using the dedicated lifespan manager
-        async with kernel_lifespan() as kernel:
+        async with kernel_lifespan() as kernel, catalog_lifespan():
             app.state.kernel = kernel
             
             init_duration = time.time() - start_time
@@ -38,15 +43,21 @@ async def lifespan(app: FastAPI):
     finally:
         # Cleanup
         logger.info("Shutting down application")
+        await close_cache_backend()
 
 # Create FastAPI app instance
 app = FastAPI(
     title=settings.app_name,
     version=settings.app_version,
     debug=settings.debug,
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=FastJSONResponse if settings.fast_json_responses else JSONResponse
 )
 
+# Serve tagged GET responses from the in-process response cache
+if settings.response_cache_enabled:
+    app.add_middleware(ResponseCacheMiddleware)
+
 # Add debug middleware (only in debug mode)
 if settings.debug:
     app.add_middleware(DebugMiddleware)
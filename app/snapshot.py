@@ -0,0 +1,33 @@
+#!/usr/bin/env python3
+"""
+Write a columnar analytics snapshot (film, inventory, rental, payment).
+
+Usage:
+    python -m app.snapshot [--format parquet|arrow] [--output snapshots] [--tables rental payment]
+"""
+import argparse
+import asyncio
+import json
+
+from core.config import settings
+from core.logging import configure_logging
+from domain.services.snapshot_service import SNAPSHOT_FORMATS, SNAPSHOT_TABLES, SnapshotService
+
+
+def main():
+    """Parse arguments, write the snapshot and print its manifest."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--format", choices=list(SNAPSHOT_FORMATS), default=settings.snapshot_format)
+    parser.add_argument("--output", default=settings.snapshot_dir, help="Directory to write the snapshot under")
+    parser.add_argument("--tables", nargs="+", choices=list(SNAPSHOT_TABLES), help="Tables to include (default: all)")
+    parser.add_argument("--snapshot-id", help="Snapshot directory name (default: UTC timestamp)")
+    args = parser.parse_args()
+
+    configure_logging()
+    service = SnapshotService(snapshot_dir=args.output)
+    manifest = asyncio.run(service.create_snapshot(args.snapshot_id, args.format, args.tables))
+    print(json.dumps(manifest, indent=2))
+
+
+if __name__ == "__main__":
+    main()
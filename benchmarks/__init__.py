@@ -0,0 +1,7 @@
+"""
+Performance benchmarks for mini-pagilla-api.
+
+Run a benchmark as a module from the project root, e.g.:
+
+    python -m benchmarks.bench_film_pagination
+"""
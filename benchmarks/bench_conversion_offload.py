@@ -0,0 +1,177 @@
+"""
+Benchmark: async response conversion strategies and event-loop lag.
+
+No database needed. A probe task sleeps 1 ms at a time and records how late
+it wakes up; its wake-up delays are how long the conversion kept every
+other request on the event loop waiting. The worst delay of large runs
+includes full garbage collections over the live objects, which no
+scheduling strategy avoids; the median shows what slicing bounds.
+
+Part 1 converts synthetic ``Film`` entities to ``FilmResponse`` lists for
+several input sizes:
+
+- ``thread_chunks``: the previous ``convert_many_async`` (1000-entity
+  chunks through ``asyncio.to_thread``), kept here as the baseline
+- ``inline``: ``convert_many`` in one go
+- ``sliced``: the current ``convert_many_async`` (inline up to
+  ``CONVERT_INLINE_MAX_ROWS``, then slices of ``CONVERT_SLICE_ROWS`` with a
+  yield to the event loop between them)
+
+Part 2 serialises plain row tuples to NDJSON, as a large export does, on
+the event loop (``inline``, a yield per batch) and through the conversion
+process pool (``process``, one batch in flight per worker).
+
+Usage:
+    python -m benchmarks.bench_conversion_offload [--rows 100000] [--workers 4]
+"""
+
+import argparse
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Tuple
+
+from core.config import settings
+from domain.models.responses.film import FilmResponse
+from domain.utils.conversion_pool import conversion_pool, render_json_lines
+from domain.utils.fieldsets import FILM_FIELDS
+from domain.utils.model_converter import ModelConverter
+from benchmarks.bench_model_converter import extra_fields, synthetic_films
+from benchmarks.common import print_table
+
+
+class LoopLagProbe:
+    """Records event-loop wake-up delays while it runs."""
+
+    def __init__(self, interval: float = 0.001):
+        self.interval = interval
+        self.lags: List[float] = []
+        self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            start = time.perf_counter()
+            await asyncio.sleep(self.interval)
+            self.lags.append(time.perf_counter() - start - self.interval)
+
+    def percentile(self, fraction: float) -> float:
+        lags = sorted(self.lags)
+        return lags[min(len(lags) - 1, int(len(lags) * fraction))] if lags else 0.0
+
+    async def __aenter__(self) -> "LoopLagProbe":
+        self._task = asyncio.create_task(self._run())
+        # Let the probe take its first timestamp before the work starts
+        await asyncio.sleep(self.interval)
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        self._task.cancel()
+
+
+def ms(seconds: float) -> float:
+    return round(seconds * 1000, 1)
+
+
+async def thread_chunks(converter: ModelConverter, films: List[Any]) -> List[FilmResponse]:
+    chunk_size = 1000
+    if len(films) <= chunk_size:
+        return converter.convert_many(films, extra_fields)
+    tasks = [
+        asyncio.create_task(asyncio.to_thread(converter.convert_many, films[i:i + chunk_size], extra_fields))
+        for i in range(0, len(films), chunk_size)
+    ]
+    return [item for chunk in await asyncio.gather(*tasks) for item in chunk]
+
+
+async def measure(work: Callable[[], Awaitable[Any]]) -> Tuple[float, float, float]:
+    """Run ``work`` under a lag probe; returns (seconds, median lag, worst lag) in seconds."""
+    async with LoopLagProbe() as probe:
+        start = time.perf_counter()
+        await work()
+        elapsed = time.perf_counter() - start
+        # Pick up a wake-up that was due while the work held the loop
+        await asyncio.sleep(0)
+    return elapsed, probe.percentile(0.5), probe.percentile(1.0)
+
+
+async def bench_conversion(sizes: List[int]) -> None:
+    converter = ModelConverter(FilmResponse, trusted=False)
+    strategies: Dict[str, Callable[[List[Any]], Awaitable[Any]]] = {
+        "thread_chunks": lambda films: thread_chunks(converter, films),
+        "inline": lambda films: asyncio.sleep(0, converter.convert_many(films, extra_fields)),
+        "sliced": lambda films: converter.convert_many_async(films, extra_fields),
+    }
+
+    rows = []
+    for size in sizes:
+        films = synthetic_films(size)
+        converter.convert_many(films[:10], extra_fields)
+        for label, strategy in strategies.items():
+            elapsed, median, worst = await measure(lambda: strategy(films))
+            rows.append([label, size, round(elapsed / size * 1_000_000, 2), round(elapsed * 1000, 1), ms(median), ms(worst)])
+
+    print("convert_many_async strategies (FilmResponse from ORM entities)")
+    print_table(["strategy", "rows", "us_per_row", "total_ms", "median_lag_ms", "max_lag_ms"], rows)
+
+
+async def render_inline(rows: List[tuple], batch_size: int) -> int:
+    size = 0
+    for start in range(0, len(rows), batch_size):
+        size += len(render_json_lines(FilmResponse, FILM_FIELDS, rows[start:start + batch_size]))
+        await asyncio.sleep(0)
+    return size
+
+
+async def render_in_pool(rows: List[tuple], batch_size: int, workers: int) -> int:
+    size = 0
+    in_flight = []
+    for start in range(0, len(rows), batch_size):
+        in_flight.append(asyncio.ensure_future(
+            conversion_pool.render_json_lines(FilmResponse, FILM_FIELDS, rows[start:start + batch_size])
+        ))
+        if len(in_flight) > workers:
+            size += len(await in_flight.pop(0))
+    for future in in_flight:
+        size += len(await future)
+    return size
+
+
+async def bench_export(row_count: int, batch_size: int, workers: int) -> None:
+    films = synthetic_films(row_count)
+    converter = ModelConverter(FilmResponse, trusted=True)
+    row_tuples = [tuple(getattr(response, name) for name in FILM_FIELDS) for response in converter.convert_many(films, extra_fields)]
+
+    settings.convert_process_workers = workers
+    # Start the workers (spawn and imports) outside the timed runs
+    await render_in_pool(row_tuples[:workers * batch_size], batch_size, workers)
+
+    results = []
+    for label, work in (
+        ("inline", lambda: render_inline(row_tuples, batch_size)),
+        ("process", lambda: render_in_pool(row_tuples, batch_size, workers)),
+    ):
+        elapsed, median, worst = await measure(work)
+        results.append([label, workers if label == "process" else 0, row_count, round(row_count / elapsed), ms(median), ms(worst)])
+
+    print(f"NDJSON export serialisation ({batch_size}-row batches)")
+    print_table(["strategy", "workers", "rows", "rows_per_second", "median_lag_ms", "max_lag_ms"], results)
+
+
+async def run(row_count: int, batch_size: int, workers: int) -> None:
+    sizes = sorted({100, 1000, settings.convert_inline_max_rows, 10000, row_count})
+    await bench_conversion(sizes)
+    print()
+    await bench_export(row_count, batch_size, workers)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=100000, help="Largest conversion and export size")
+    parser.add_argument("--batch-size", type=int, default=settings.film_export_batch_size, help="Rows per export batch")
+    parser.add_argument("--workers", type=int, default=4, help="Conversion process pool workers")
+    args = parser.parse_args()
+
+    asyncio.run(run(args.rows, args.batch_size, args.workers))
+
+
+if __name__ == "__main__":
+    main()
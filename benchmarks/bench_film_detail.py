@@ -0,0 +1,118 @@
+"""
+Benchmark: film detail (film, actors, categories) as one JSON query versus
+chained selectinload.
+
+For a sample of existing films, builds ``FilmDetailResponse`` two ways and
+reports latency and SQL statements per film:
+
+- ``selectinload``: ``select(Film)`` with ``selectinload`` chains for the
+  language, ``film_actors -> actor`` and ``film_categories -> category``,
+  then the response is assembled from the entities
+- ``json_agg``: ``FilmRepository.get_film_detail_json`` (one statement) and
+  ``FilmDetailResponse.model_validate_json``
+
+Usage:
+    python -m benchmarks.bench_film_detail [--films 100]
+"""
+
+import argparse
+import asyncio
+
+from sqlalchemy import event, select
+from sqlalchemy.orm import selectinload
+
+from domain.entities.film import Film, FilmActor, FilmCategory
+from domain.models.responses.film import ActorSummary, CategorySummary, FilmDetailResponse
+from domain.repositories.film_repository import FilmRepository
+from domain.utils.model_converter import film_converter
+from benchmarks.common import measure, print_table, rollback_session
+
+
+async def selectinload_detail(session, film_id: int) -> FilmDetailResponse:
+    result = await session.execute(
+        select(Film)
+        .where(Film.film_id == film_id)
+        .options(
+            selectinload(Film.language),
+            selectinload(Film.film_actors).selectinload(FilmActor.actor),
+            selectinload(Film.film_categories).selectinload(FilmCategory.category),
+        )
+    )
+    film = result.scalar_one()
+    response = film_converter.convert_single(film, language_name=film.language.name.strip())
+    return FilmDetailResponse(
+        **response.model_dump(),
+        actors=[
+            ActorSummary(actor_id=link.actor.actor_id, first_name=link.actor.first_name, last_name=link.actor.last_name)
+            for link in sorted(film.film_actors, key=lambda link: (link.actor.last_name, link.actor.first_name))
+        ],
+        categories=sorted(
+            (CategorySummary(category_id=link.category.category_id, name=link.category.name) for link in film.film_categories),
+            key=lambda category: category.name
+        ),
+    )
+
+
+async def json_detail(repository: FilmRepository, film_id: int) -> FilmDetailResponse:
+    return FilmDetailResponse.model_validate_json(await repository.get_film_detail_json(film_id))
+
+
+async def run(film_count: int, repeat: int) -> None:
+    rows = []
+
+    async with rollback_session() as session:
+        film_ids = list((await session.execute(select(Film.film_id).order_by(Film.film_id).limit(film_count))).scalars())
+        repository = FilmRepository(session)
+
+        statements = 0
+
+        def count_statement(*args):
+            nonlocal statements
+            statements += 1
+
+        sync_engine = session.bind.sync_engine
+        event.listen(sync_engine, "before_cursor_execute", count_statement)
+        try:
+            for label, detail in (
+                ("selectinload", lambda film_id: selectinload_detail(session, film_id)),
+                ("json_agg", lambda film_id: json_detail(repository, film_id)),
+            ):
+                # The two paths must agree before their timings mean anything
+                for film_id in film_ids[:10]:
+                    session.expunge_all()
+                    assert await selectinload_detail(session, film_id) == await json_detail(repository, film_id)
+
+                async def all_details():
+                    session.expunge_all()
+                    for film_id in film_ids:
+                        await detail(film_id)
+
+                statements = 0
+                await all_details()
+                per_film = statements / max(len(film_ids), 1)
+
+                stats = await measure(all_details, repeat)
+                rows.append([
+                    label,
+                    len(film_ids),
+                    round(per_film, 1),
+                    round(stats["median_ms"] / max(len(film_ids), 1), 3),
+                    round(stats["p95_ms"] / max(len(film_ids), 1), 3),
+                ])
+        finally:
+            event.remove(sync_engine, "before_cursor_execute", count_statement)
+
+    print_table(["path", "films", "statements_per_film", "median_ms_per_film", "p95_ms_per_film"], rows)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--films", type=int, default=100, help="Existing films to fetch per run")
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    asyncio.run(run(args.films, args.repeat))
+
+
+if __name__ == "__main__":
+    main()
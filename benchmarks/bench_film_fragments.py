@@ -0,0 +1,153 @@
+"""
+Benchmark: assembling film responses from cached JSON fragments.
+
+No database needed. Reports, for synthetic film responses:
+
+- hot page: rendering one ``FilmListResponse`` with the model serializer
+  against joining fragments from a warm cache
+- page mix: rendering pages drawn from a catalog with skewed popularity
+  (a few pages get most traffic) through caches of several sizes, with the
+  resulting hit ratio and cached bytes
+- export: NDJSON lines for read-only rows, validated and serialised per
+  row against ``row_fragment`` with every row cached
+
+Usage:
+    python -m benchmarks.bench_film_fragments [--catalog-size 100000] [--page-size 100]
+"""
+
+import argparse
+import random
+import time
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from typing import Callable, List
+
+from domain.catalog.film_fragments import FilmFragmentCache
+from domain.models.responses.film import FilmListResponse, FilmResponse
+from benchmarks.common import print_table
+
+RATINGS = ["G", "PG", "PG-13", "R", "NC-17"]
+
+
+def synthetic_films(count: int) -> List[FilmResponse]:
+    now = datetime.now(timezone.utc)
+    return [
+        FilmResponse(
+            film_id=i,
+            title=f"BENCH FILM {i:08d}",
+            description=f"A synthetic benchmark film number {i}",
+            release_year=2006,
+            language_id=1,
+            language_name="English",
+            rental_duration=3,
+            rental_rate=4.99,
+            length=90 + i % 90,
+            replacement_cost=19.99,
+            rating=RATINGS[i % len(RATINGS)],
+            special_features=["Trailers", "Deleted Scenes"],
+            last_update=now,
+            streaming_available=i % 2 == 0,
+        )
+        for i in range(1, count + 1)
+    ]
+
+
+def per_call(work: Callable[[], object], repeat: int) -> float:
+    """Seconds per call (best of three runs)."""
+    work()
+    best = float("inf")
+    for _ in range(3):
+        start = time.perf_counter()
+        for _ in range(repeat):
+            work()
+        best = min(best, (time.perf_counter() - start) / repeat)
+    return best
+
+
+def bench_hot_page(films: List[FilmResponse], page_size: int) -> None:
+    page = FilmListResponse(films=films[:page_size], total=len(films), page=1, page_size=page_size)
+    cache = FilmFragmentCache(max_bytes=64 * 1024 * 1024)
+    assert cache.render_with_films(page) == page.model_dump_json().encode()
+
+    serializer = per_call(lambda: page.__pydantic_serializer__.to_json(page), 500)
+    fragments = per_call(lambda: cache.render_with_films(page), 500)
+
+    print(f"Hot page ({page_size} films)")
+    print_table(["path", "us_per_page", "speedup"], [
+        ["model serializer", round(serializer * 1_000_000), "1.00x"],
+        ["cached fragments", round(fragments * 1_000_000), f"{serializer / fragments:.2f}x"],
+    ])
+
+
+def bench_page_mix(films: List[FilmResponse], page_size: int, requests: int) -> None:
+    pages = [
+        FilmListResponse(films=films[start:start + page_size], total=len(films), page=start // page_size + 1, page_size=page_size)
+        for start in range(0, len(films), page_size)
+    ]
+    # Page popularity falls off like 1/rank, as listings are mostly browsed from the first pages
+    rng = random.Random(42)
+    mix = rng.choices(pages, weights=[1 / rank for rank in range(1, len(pages) + 1)], k=requests)
+    fragment_bytes = len(films[0].model_dump_json())
+
+    start = time.perf_counter()
+    for page in mix:
+        page.__pydantic_serializer__.to_json(page)
+    baseline = time.perf_counter() - start
+
+    rows = [["no cache", "-", round(requests / baseline), "-", "-"]]
+    for fraction in (0.01, 0.1, 0.5, 1.0):
+        cache = FilmFragmentCache(max_bytes=int(len(films) * fragment_bytes * 1.05 * fraction))
+        start = time.perf_counter()
+        for page in mix:
+            cache.render_with_films(page)
+        elapsed = time.perf_counter() - start
+        stats = cache.stats()
+        rows.append([f"{fraction:.0%} of catalog", stats["max_bytes"], round(requests / elapsed), stats["hit_ratio"], stats["bytes"]])
+
+    print(f"Page mix ({requests} requests over {len(pages)} pages, 1/rank popularity)")
+    print_table(["cache size", "max_bytes", "pages_per_second", "hit_ratio", "cached_bytes"], rows)
+
+
+def bench_export(films: List[FilmResponse]) -> None:
+    rows = [SimpleNamespace(**film.model_dump()) for film in films]
+    cache = FilmFragmentCache(max_bytes=len(films) * 1024)
+
+    def validated() -> None:
+        for row in rows:
+            FilmResponse.model_validate(row, from_attributes=True).model_dump_json().encode()
+
+    def cached() -> None:
+        for row in rows:
+            cache.row_fragment(row)
+
+    baseline = per_call(validated, 1)
+    fragments = per_call(cached, 1)
+
+    print(f"Export lines ({len(rows)} rows, every row cached)")
+    print_table(["path", "rows_per_second", "speedup"], [
+        ["validate + serialise", round(len(rows) / baseline), "1.00x"],
+        ["row_fragment", round(len(rows) / fragments), f"{baseline / fragments:.2f}x"],
+    ])
+
+
+def run(catalog_size: int, page_size: int, requests: int) -> None:
+    films = synthetic_films(catalog_size)
+    bench_hot_page(films, page_size)
+    print()
+    bench_page_mix(films, page_size, requests)
+    print()
+    bench_export(films)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--catalog-size", type=int, default=100000)
+    parser.add_argument("--page-size", type=int, default=100)
+    parser.add_argument("--requests", type=int, default=5000, help="Page renders in the page mix")
+    args = parser.parse_args()
+
+    run(args.catalog_size, args.page_size, args.requests)
+
+
+if __name__ == "__main__":
+    main()
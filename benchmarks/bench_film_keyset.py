@@ -0,0 +1,59 @@
+"""
+Benchmark: OFFSET pagination versus keyset (cursor) pagination by page depth.
+
+Seeds a synthetic catalog, then times fetching a page at increasing depths
+with ``get_films_paginated`` (OFFSET) and ``get_films_after`` (keyset seek).
+
+Usage:
+    python -m benchmarks.bench_film_keyset [--catalog-size 200000]
+"""
+
+import argparse
+import asyncio
+
+from domain.repositories.film_repository import FilmRepository
+from benchmarks.common import measure, print_table, rollback_session, seed_films
+
+
+async def run(catalog_size: int, page_size: int, repeat: int) -> None:
+    rows = []
+
+    async with rollback_session() as session:
+        await seed_films(session, catalog_size)
+        repository = FilmRepository(session)
+        total = await repository.count_films()
+
+        depth = 1
+        while depth * page_size < total:
+            skip = (depth - 1) * page_size
+            films, _ = await repository.get_films_paginated(skip=skip - 1 if skip else 0, limit=1)
+            after_film_id = films[0].film_id if skip else 0
+
+            async def offset_page():
+                session.expunge_all()
+                await repository.get_films_paginated(skip=skip, limit=page_size)
+
+            async def keyset_page():
+                session.expunge_all()
+                await repository.get_films_after(after_film_id=after_film_id, limit=page_size)
+
+            offset_stats = await measure(offset_page, repeat)
+            keyset_stats = await measure(keyset_page, repeat)
+            rows.append([depth, skip, offset_stats["median_ms"], keyset_stats["median_ms"]])
+            depth *= 10
+
+    print_table(["page", "offset_rows", "offset_median_ms", "keyset_median_ms"], rows)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--catalog-size", type=int, default=200000, help="Synthetic films to add")
+    parser.add_argument("--page-size", type=int, default=10)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    asyncio.run(run(args.catalog_size, args.page_size, args.repeat))
+
+
+if __name__ == "__main__":
+    main()
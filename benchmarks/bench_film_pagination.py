@@ -0,0 +1,83 @@
+"""
+Benchmark: film listing latency versus catalog size.
+
+Compares the legacy total computation (materialise every matching Film and
+call ``len()``) with the two strategies supported by
+``FilmRepository.get_films_paginated``: a separate ``SELECT count(*)`` and a
+``count(*) OVER ()`` window on the page query.
+
+Usage:
+    python -m benchmarks.bench_film_pagination [--sizes 0,10000,50000,200000]
+"""
+
+import argparse
+import asyncio
+
+from sqlmodel import col, select
+from sqlalchemy.orm import selectinload
+
+from core.config import settings
+from domain.entities.film import Film
+from domain.repositories.film_repository import FilmRepository
+from benchmarks.common import measure, print_table, rollback_session, seed_films
+
+
+async def legacy_get_films_paginated(repository: FilmRepository, skip: int, limit: int):
+    """The original implementation: hydrate every row just to count it."""
+    count_result = await repository.db.execute(select(Film))
+    total_count = len(count_result.all())
+
+    query = (
+        select(Film)
+        .options(selectinload(Film.language))
+        .offset(skip)
+        .limit(limit)
+        .order_by(col(Film.film_id))
+    )
+    result = await repository.db.execute(query)
+    return list(result.scalars().all()), total_count
+
+
+async def run(sizes: list[int], page_size: int, repeat: int) -> None:
+    rows = []
+
+    async with rollback_session() as session:
+        repository = FilmRepository(session)
+        seeded = 0
+
+        for size in sizes:
+            await seed_films(session, size - seeded)
+            seeded = size
+            catalog_size = await repository.count_films()
+
+            async def legacy():
+                session.expunge_all()
+                await legacy_get_films_paginated(repository, 0, page_size)
+
+            rows.append([catalog_size, "legacy len(all())", *((await measure(legacy, repeat)).values())])
+
+            for strategy in ("count", "window"):
+                settings.film_count_strategy = strategy
+
+                async def current():
+                    session.expunge_all()
+                    await repository.get_films_paginated(skip=0, limit=page_size)
+
+                rows.append([catalog_size, strategy, *((await measure(current, repeat)).values())])
+
+    print_table(["catalog_size", "strategy", "median_ms", "p95_ms", "mean_ms"], rows)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default="0,10000,50000,200000", help="Synthetic films to add, cumulative")
+    parser.add_argument("--page-size", type=int, default=10)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    sizes = sorted(int(size) for size in args.sizes.split(","))
+    asyncio.run(run(sizes, args.page_size, args.repeat))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Benchmark: ORM entity hydration versus the read-only row path.
+
+Seeds a synthetic catalog in one language, then loads every film of that
+language with ``FilmRepository.get_films_by_language`` and converts the
+result to ``FilmResponse``, once with ORM entities (``read_only=False``) and
+once with read-only Core rows (``read_only=True``). Reports per-row cost of
+the query and of the conversion, and peak Python memory (tracemalloc).
+
+Usage:
+    python -m benchmarks.bench_film_rows [--catalog-size 100000]
+"""
+
+import argparse
+import asyncio
+import time
+import tracemalloc
+
+from domain.repositories.film_repository import FilmRepository
+from domain.utils.model_converter import convert_films_to_responses
+from benchmarks.common import print_table, rollback_session, seed_films
+
+LANGUAGE_ID = 1
+
+
+async def run(catalog_size: int, repeat: int) -> None:
+    rows = []
+
+    async with rollback_session() as session:
+        await seed_films(session, catalog_size, language_id=LANGUAGE_ID)
+
+        for label, read_only in (("orm", False), ("rows", True)):
+            repository = FilmRepository(session, read_only=read_only)
+            query_us, convert_us = [], []
+
+            for _ in range(repeat):
+                session.expunge_all()
+                start = time.perf_counter()
+                films = await repository.get_films_by_language(LANGUAGE_ID)
+                fetched = time.perf_counter()
+                responses = convert_films_to_responses(films)
+                converted = time.perf_counter()
+
+                count = max(len(responses), 1)
+                query_us.append((fetched - start) * 1_000_000 / count)
+                convert_us.append((converted - fetched) * 1_000_000 / count)
+                del films, responses
+
+            # Memory is traced in a separate run, as tracing slows allocation
+            session.expunge_all()
+            tracemalloc.start()
+            films = await repository.get_films_by_language(LANGUAGE_ID)
+            responses = convert_films_to_responses(films)
+            peak_mb = tracemalloc.get_traced_memory()[1] / 1024 / 1024
+            tracemalloc.stop()
+            del films, responses
+
+            rows.append([
+                label,
+                count,
+                round(min(query_us), 2),
+                round(min(convert_us), 2),
+                round(min(query_us) + min(convert_us), 2),
+                round(peak_mb, 1),
+            ])
+
+    print_table(["path", "films", "query_us_per_row", "convert_us_per_row", "total_us_per_row", "peak_mb"], rows)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--catalog-size", type=int, default=100000, help="Synthetic films to add")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    asyncio.run(run(args.catalog_size, args.repeat))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+Benchmark: title search via LIKE scan versus ranked full-text search.
+
+Compares ``FilmRepository.search_films_by_title`` (``title LIKE '%x%'``)
+with ``FilmRepository.search_films_fulltext`` (``fulltext @@
+websearch_to_tsquery(...)`` ordered by ``ts_rank``, served by the GIN index).
+
+Usage:
+    python -m benchmarks.bench_film_search [--catalog-size 200000] [--query academy]
+"""
+
+import argparse
+import asyncio
+
+from domain.repositories.film_repository import FilmRepository
+from benchmarks.common import measure, print_table, rollback_session, seed_films
+
+
+async def run(catalog_size: int, queries: list[str], page_size: int, repeat: int) -> None:
+    rows = []
+
+    async with rollback_session() as session:
+        await seed_films(session, catalog_size)
+        repository = FilmRepository(session)
+
+        for query in queries:
+            async def like_scan():
+                session.expunge_all()
+                await repository.search_films_by_title(query.upper())
+
+            async def fulltext():
+                session.expunge_all()
+                await repository.search_films_fulltext(query, skip=0, limit=page_size)
+
+            like_stats = await measure(like_scan, repeat)
+            fulltext_stats = await measure(fulltext, repeat)
+            like_hits = len(await repository.search_films_by_title(query.upper()))
+            _, fulltext_hits = await repository.search_films_fulltext(query, limit=1)
+            rows.append([
+                query,
+                like_hits,
+                like_stats["median_ms"],
+                fulltext_hits,
+                fulltext_stats["median_ms"],
+            ])
+
+    print_table(["query", "like_hits", "like_median_ms", "fts_hits", "fts_median_ms"], rows)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--catalog-size", type=int, default=200000, help="Synthetic films to add")
+    parser.add_argument("--query", action="append", help="Query to run (repeatable)")
+    parser.add_argument("--page-size", type=int, default=10)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    queries = args.query or ["academy", "drama", "astronaut", "synthetic"]
+    asyncio.run(run(args.catalog_size, queries, args.page_size, args.repeat))
+
+
+if __name__ == "__main__":
+    main()
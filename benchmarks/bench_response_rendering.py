@@ -0,0 +1,201 @@
+"""
+Benchmark: film endpoint throughput with and without fast JSON responses.
+
+Runs requests through the ASGI app in-process (no server, no database):
+the ``FilmService`` methods are patched to return prebuilt response models,
+so what is measured is routing plus response rendering. Dependency
+overrides are not used, as FastAPI re-analyses every dependency of a route
+on each request while any override is registered. Each endpoint is
+timed with ``FAST_JSON_RESPONSES`` off (``standard``: the model is
+validated again against ``response_model`` and encoded through
+``jsonable_encoder``) and on (``fast``: serialised once by pydantic).
+The response cache is bypassed with ``Cache-Control: no-cache``.
+
+A second table times only the rendering step of each endpoint (FastAPI's
+``serialize_response`` plus ``JSONResponse`` against ``FastJSONResponse``),
+which is the part the fast mode changes; the end-to-end gain is that saving
+against the fixed cost of routing and parameter parsing.
+
+Usage:
+    python -m benchmarks.bench_response_rendering [--page-size 100] [--requests 200]
+"""
+
+import argparse
+import asyncio
+import os
+import time
+from datetime import datetime, timezone
+from typing import Dict, List, Tuple
+from unittest.mock import AsyncMock
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import APIRoute, serialize_response
+from httpx import ASGITransport, AsyncClient
+from pydantic import BaseModel
+
+# Requests open a film session but never use it, so nothing connects to this database
+os.environ.setdefault("FILM_DATABASE_URL", "postgresql+asyncpg://bench@localhost/bench")
+
+from app.main import app
+from core.config import settings
+from core.responses import FastJSONResponse
+from domain.models.responses.film import (
+    ActorSummary,
+    CategorySummary,
+    FilmBatchResponse,
+    FilmDetailResponse,
+    FilmListResponse,
+    FilmResponse,
+)
+from domain.services.film_service import FilmService
+from benchmarks.common import print_table
+
+RATINGS = ["G", "PG", "PG-13", "R", "NC-17"]
+
+
+def synthetic_responses(count: int) -> List[FilmResponse]:
+    now = datetime.now(timezone.utc)
+    return [
+        FilmResponse(
+            film_id=i,
+            title=f"BENCH FILM {i:08d}",
+            description=f"A synthetic benchmark film number {i}",
+            release_year=2006,
+            language_id=1,
+            language_name="English",
+            rental_duration=3,
+            rental_rate=4.99,
+            length=90 + i % 90,
+            replacement_cost=19.99,
+            rating=RATINGS[i % len(RATINGS)],
+            special_features=["Trailers", "Deleted Scenes"],
+            last_update=now,
+            streaming_available=i % 2 == 0,
+        )
+        for i in range(1, count + 1)
+    ]
+
+
+def service_responses(page_size: int) -> Dict[str, BaseModel]:
+    """What each patched FilmService method returns."""
+    films = synthetic_responses(page_size)
+    page = FilmListResponse(films=films, total=page_size, page=1, page_size=page_size)
+    return {
+        "get_films": page,
+        "search_films": page,
+        "get_films_by_ids": FilmBatchResponse(films=films, missing_ids=[]),
+        "get_film": films[0],
+        "get_film_detail": FilmDetailResponse(
+            **films[0].model_dump(),
+            actors=[ActorSummary(actor_id=i, first_name="PENELOPE", last_name=f"ACTOR {i}") for i in range(10)],
+            categories=[CategorySummary(category_id=6, name="Documentary")],
+        ),
+    }
+
+
+def endpoints(page_size: int) -> List[Tuple[str, str, str, dict, str]]:
+    """(method, route path, URL, request arguments, FilmService method) per endpoint."""
+    return [
+        ("GET", "/api/v1/films/", "/api/v1/films/", {"params": {"page_size": page_size}}, "get_films"),
+        ("GET", "/api/v1/films/search", "/api/v1/films/search", {"params": {"q": "bench", "page_size": page_size}}, "search_films"),
+        ("POST", "/api/v1/films/batch", "/api/v1/films/batch", {"json": {"film_ids": list(range(1, page_size + 1))}}, "get_films_by_ids"),
+        ("GET", "/api/v1/films/{film_id}", "/api/v1/films/1", {}, "get_film"),
+        ("GET", "/api/v1/films/{film_id}/full", "/api/v1/films/1/full", {}, "get_film_detail"),
+    ]
+
+
+def response_field(method: str, path: str):
+    for route in app.router.routes:
+        if isinstance(route, APIRoute) and route.path == path and method in route.methods:
+            return route.response_field
+    raise LookupError(path)
+
+
+async def time_endpoint(client: AsyncClient, method: str, url: str, kwargs: dict, requests: int, rounds: int = 5) -> Dict[str, float]:
+    """
+    Seconds per request in each mode (best of ``rounds``).
+    
+    The modes alternate within every round, so drift in machine load
+    affects both alike.
+    """
+    headers = {"Cache-Control": "no-cache"}
+    best = {"standard": float("inf"), "fast": float("inf")}
+    for round_number in range(rounds + 1):
+        for mode in best:
+            settings.fast_json_responses = mode == "fast"
+            start = time.perf_counter()
+            for _ in range(requests):
+                (await client.request(method, url, headers=headers, **kwargs)).raise_for_status()
+            # The first round only warms up
+            if round_number:
+                best[mode] = min(best[mode], (time.perf_counter() - start) / requests)
+    return best
+
+
+async def time_rendering(field, content: BaseModel, repeat: int) -> Tuple[float, float]:
+    """Seconds per render with FastAPI's validate-and-encode path and with FastJSONResponse."""
+    async def standard() -> bytes:
+        return JSONResponse(await serialize_response(field=field, response_content=content, is_coroutine=True)).body
+
+    async def fast() -> bytes:
+        return FastJSONResponse(content).body
+
+    assert await standard() == await fast()
+    timings = []
+    for render in (standard, fast):
+        start = time.perf_counter()
+        for _ in range(repeat):
+            await render()
+        timings.append((time.perf_counter() - start) / repeat)
+    return timings[0], timings[1]
+
+
+def us(seconds: float) -> int:
+    return round(seconds * 1_000_000)
+
+
+async def run(page_size: int, requests: int) -> None:
+    responses = service_responses(page_size)
+    originals = {name: getattr(FilmService, name) for name in responses}
+    for name, content in responses.items():
+        setattr(FilmService, name, AsyncMock(return_value=content))
+
+    rows, render_rows = [], []
+    try:
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://bench") as client:
+            for method, path, url, kwargs, service_method in endpoints(page_size):
+                label = f"{method} {path.removeprefix('/api/v1')}"
+                timings = await time_endpoint(client, method, url, kwargs, requests)
+                rows.append([
+                    label,
+                    round(1 / timings["standard"]),
+                    round(1 / timings["fast"]),
+                    us(timings["standard"]),
+                    us(timings["fast"]),
+                    f"{timings['standard'] / timings['fast']:.2f}x",
+                ])
+
+                standard, fast = await time_rendering(response_field(method, path), responses[service_method], requests)
+                render_rows.append([label, us(standard), us(fast), f"{standard / fast:.2f}x"])
+    finally:
+        for name, method in originals.items():
+            setattr(FilmService, name, method)
+
+    print(f"Film endpoints, end to end ({page_size} films per list/batch response)")
+    print_table(["endpoint", "standard_rps", "fast_rps", "standard_us", "fast_us", "speedup"], rows)
+    print()
+    print("Rendering only")
+    print_table(["endpoint", "standard_us", "fast_us", "speedup"], render_rows)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--page-size", type=int, default=100, help="Films per list, search and batch response")
+    parser.add_argument("--requests", type=int, default=200, help="Requests per timed run")
+    args = parser.parse_args()
+
+    asyncio.run(run(args.page_size, args.requests))
+
+
+if __name__ == "__main__":
+    main()
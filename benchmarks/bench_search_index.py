@@ -0,0 +1,93 @@
+"""
+Benchmark: in-process BM25 film search index.
+
+Builds the index from a synthetic catalog (no database needed) and reports
+build time, memory held by the index, and per-query latency in microseconds
+for full-word and search-as-you-type prefix queries.
+
+Usage:
+    python -m benchmarks.bench_search_index [--films 100000]
+"""
+
+import argparse
+import itertools
+import random
+import statistics
+import time
+import tracemalloc
+
+from domain.catalog.search_index import FilmSearchIndex
+from benchmarks.common import print_table
+
+SEED_WORDS = (
+    "academy dinosaur epic drama feminist mad scientist astounding epistle database "
+    "administrator reflection lumberjack boring story crocodile shark moose cat dog "
+    "battle canadian rockies ancient india mexico boat sunk abandoned mine fanciful "
+    "documentary husband wife car forensic psychologist composer monastery pioneer"
+).split()
+SYLLABLES = "ka lo mi ne ru sa te vo zi an el or us ith ber dor gan".split()
+FIRST_NAMES = "PENELOPE NICK ED JENNIFER JOHNNY BETTE GRACE MATTHEW JOE CHRISTIAN".split()
+LAST_NAMES = "GUINESS WAHLBERG CHASE DAVIS LOLLOBRIGIDA NICHOLSON MOSTEL JOHANSSON SWANK GABLE".split()
+CATEGORIES = "Action Animation Children Classics Comedy Documentary Drama Family Foreign Games Horror Music New Sci-Fi Sports Travel".split()
+
+
+def vocabulary(size: int, rng: random.Random) -> list[str]:
+    """Seed words plus generated ones, to approximate a real catalog's vocabulary."""
+    words = list(SEED_WORDS)
+    while len(words) < size:
+        words.append("".join(rng.choices(SYLLABLES, k=rng.randint(2, 4))))
+    return words
+
+
+def build(films: int, vocabulary_size: int = 5000, seed: int = 7) -> FilmSearchIndex:
+    rng = random.Random(seed)
+    words = vocabulary(vocabulary_size, rng)
+    # Zipf-like word frequencies, as in natural text
+    cum_weights = list(itertools.accumulate(1 / rank for rank in range(1, len(words) + 1)))
+    rng.shuffle(words)
+    index = FilmSearchIndex()
+    index._loaded = True
+    for film_id in range(1, films + 1):
+        index.upsert(
+            film_id,
+            " ".join(rng.choices(words, cum_weights=cum_weights, k=2)).upper(),
+            "A " + " ".join(rng.choices(words, cum_weights=cum_weights, k=12)),
+            " ".join(f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}" for _ in range(5)),
+            rng.choice(CATEGORIES),
+        )
+    return index
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--films", type=int, default=100000)
+    parser.add_argument("--vocabulary", type=int, default=5000, help="Distinct description words")
+    parser.add_argument("--repeat", type=int, default=200)
+    parser.add_argument("--limit", type=int, default=10)
+    args = parser.parse_args()
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    index = build(args.films, args.vocabulary)
+    build_seconds = time.perf_counter() - start
+    memory_mb = tracemalloc.get_traced_memory()[0] / 1024 / 1024
+    tracemalloc.stop()
+
+    print(f"films={args.films} terms={len(index._postings)} build_s={build_seconds:.2f} index_mb={memory_mb:.1f}")
+    print()
+
+    rows = []
+    for query in ["lumberjack", "crocodile documentary", "penelope guiness", "a", "lu", "epic dr", "moose sunk boat"]:
+        samples = []
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            _, total = index.search(query, limit=args.limit)
+            samples.append((time.perf_counter() - start) * 1_000_000)
+        samples.sort()
+        rows.append([query, total, round(statistics.median(samples)), round(samples[int(len(samples) * 0.95) - 1])])
+
+    print_table(["query", "matches", "median_us", "p95_us"], rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+Benchmark: columnar snapshot versus paging the JSON API.
+
+Seeds a synthetic catalog, then extracts every film three ways and reports
+rows/sec and bytes produced:
+
+- ``json``: walks ``GET /api/v1/films/`` with keyset cursors (page_size=100),
+  through the ASGI app, summing response body sizes
+- ``parquet`` / ``arrow``: ``SnapshotService.write_snapshot`` of the film table
+
+Requires pyarrow (``pip install ".[analytics]"``).
+
+Usage:
+    python -m benchmarks.bench_snapshot [--catalog-size 200000]
+"""
+
+import argparse
+import asyncio
+import tempfile
+import time
+
+from httpx import ASGITransport, AsyncClient
+
+from app.main import app
+from core.db import get_film_db
+from core.response_cache import response_cache
+from domain.services.snapshot_service import SNAPSHOT_FORMATS, SnapshotService
+from benchmarks.common import print_table, rollback_session, seed_films
+
+
+async def page_json(page_size: int):
+    """Fetch every film through the JSON listing; returns (films, body bytes)."""
+    films, size, cursor = 0, 0, None
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://bench") as client:
+        while True:
+            params = {"page_size": page_size, **({"cursor": cursor} if cursor else {})}
+            response = await client.get("/api/v1/films/", params=params, headers={"Cache-Control": "no-cache"})
+            response.raise_for_status()
+            size += len(response.content)
+            data = response.json()
+            films += len(data["films"])
+            cursor = data.get("next_cursor")
+            if not cursor:
+                return films, size
+
+
+async def run(catalog_size: int, page_size: int) -> None:
+    rows = []
+
+    async with rollback_session() as session:
+        await seed_films(session, catalog_size)
+
+        # Let the API read the uncommitted synthetic films
+        async def bench_db():
+            yield session
+
+        app.dependency_overrides[get_film_db] = bench_db
+        try:
+            response_cache.clear()
+            start = time.perf_counter()
+            films, size = await page_json(page_size)
+            elapsed = time.perf_counter() - start
+            rows.append(["json", films, round(films / elapsed), round(size / 1024 / 1024, 2), round(size / max(films, 1), 1)])
+        finally:
+            app.dependency_overrides.clear()
+
+        with tempfile.TemporaryDirectory() as snapshot_dir:
+            service = SnapshotService(snapshot_dir=snapshot_dir)
+            for file_format in SNAPSHOT_FORMATS:
+                start = time.perf_counter()
+                manifest = await service.write_snapshot(session, file_format, file_format, ["film"])
+                elapsed = time.perf_counter() - start
+                film = manifest["tables"]["film"]
+                rows.append([
+                    file_format,
+                    film["rows"],
+                    round(film["rows"] / elapsed),
+                    round(film["bytes"] / 1024 / 1024, 2),
+                    round(film["bytes"] / max(film["rows"], 1), 1),
+                ])
+
+    print_table(["path", "films", "rows_per_sec", "mb", "bytes_per_row"], rows)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--catalog-size", type=int, default=200000, help="Synthetic films to add")
+    parser.add_argument("--page-size", type=int, default=100, help="JSON listing page size (API maximum is 100)")
+    args = parser.parse_args()
+
+    asyncio.run(run(args.catalog_size, args.page_size))
+
+
+if __name__ == "__main__":
+    main()
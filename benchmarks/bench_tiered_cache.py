@@ -0,0 +1,92 @@
+"""
+Benchmark: two-tier film cache shared by several workers.
+
+Simulates uvicorn workers, each with its own local LRU, reading films with a
+Zipf-like popularity through an in-memory L2 backend (standing in for Redis)
+with artificial round-trip latency. Reports how many reads reach the
+database and the mean read latency, with and without the shared tier.
+
+Usage:
+    python -m benchmarks.bench_tiered_cache [--workers 4] [--reads 20000]
+"""
+
+import argparse
+import asyncio
+import itertools
+import random
+import time
+from typing import Optional
+
+from core.cache import CacheBackend, InMemoryCacheBackend, TieredCache
+from benchmarks.common import print_table
+
+
+class LatencyBackend(InMemoryCacheBackend):
+    """In-memory backend that sleeps like a network round trip."""
+
+    def __init__(self, latency_ms: float):
+        super().__init__()
+        self.latency = latency_ms / 1000
+
+    async def get(self, key: str) -> Optional[bytes]:
+        await asyncio.sleep(self.latency)
+        return await super().get(key)
+
+    async def set(self, key: str, value: bytes, ttl_seconds: Optional[float] = None) -> None:
+        await asyncio.sleep(self.latency)
+        await super().set(key, value, ttl_seconds)
+
+
+async def run(workers: int, reads: int, films: int, backend: Optional[CacheBackend], db_latency_ms: float, local_bytes: int):
+    caches = [
+        TieredCache(
+            "film",
+            dumps=lambda value: value.encode(),
+            loads=lambda data: data.decode(),
+            local_max_bytes=local_bytes,
+            version_check_seconds=1.0,
+            backend=backend,
+        )
+        for _ in range(workers)
+    ]
+    db_reads = 0
+
+    async def load(film_id: int) -> str:
+        nonlocal db_reads
+        db_reads += 1
+        await asyncio.sleep(db_latency_ms / 1000)
+        return f'{{"film_id": {film_id}, "title": "FILM {film_id}"}}' + " " * 300
+
+    rng = random.Random(3)
+    cum_weights = list(itertools.accumulate(1 / rank for rank in range(1, films + 1)))
+    film_ids = rng.choices(range(1, films + 1), cum_weights=cum_weights, k=reads)
+
+    start = time.perf_counter()
+    for n, film_id in enumerate(film_ids):
+        await caches[n % workers].get_or_load(str(film_id), lambda: load(film_id))
+    elapsed = time.perf_counter() - start
+    return db_reads, elapsed * 1000 / reads
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--reads", type=int, default=20000)
+    parser.add_argument("--films", type=int, default=5000)
+    parser.add_argument("--db-latency-ms", type=float, default=1.0)
+    parser.add_argument("--l2-latency-ms", type=float, default=0.2)
+    parser.add_argument("--local-kb", type=int, default=256, help="Local LRU size per worker")
+    args = parser.parse_args()
+
+    rows = []
+    for label, backend in [("local only", None), ("local + L2", LatencyBackend(args.l2_latency_ms))]:
+        db_reads, mean_ms = asyncio.run(
+            run(args.workers, args.reads, args.films, backend, args.db_latency_ms, args.local_kb * 1024)
+        )
+        rows.append([label, args.workers, db_reads, round(db_reads / args.reads, 3), round(mean_ms, 3)])
+
+    print_table(["tiers", "workers", "db_reads", "db_read_ratio", "mean_read_ms"], rows)
+
+
+if __name__ == "__main__":
+    main()
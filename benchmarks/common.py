@@ -0,0 +1,110 @@
+"""
+Shared helpers for the benchmark scripts.
+
+Database benchmarks run against the database configured by FILM_DATABASE_URL
+(a pagila instance). Synthetic rows are inserted inside a transaction that is
+rolled back when the benchmark finishes, so the database is left untouched.
+"""
+
+import statistics
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Awaitable, Callable, Dict, List, Sequence
+
+from sqlalchemy import insert, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.db import get_engine_and_session_factory
+from domain.entities.film import Film
+from domain.repositories.film_repository import build_fulltext
+
+
+@asynccontextmanager
+async def rollback_session() -> AsyncIterator[AsyncSession]:
+    """Yield a film database session whose changes are always rolled back."""
+    _, session_factory = get_engine_and_session_factory("film")
+
+    async with session_factory() as session:
+        try:
+            yield session
+        finally:
+            await session.rollback()
+
+
+async def seed_films(session: AsyncSession, count: int, language_id: int = 1, batch_size: int = 5000) -> None:
+    """
+    Insert synthetic films into the current transaction.
+
+    Args:
+        session: Session to insert with (changes are not committed)
+        count: Number of films to insert
+        language_id: Language ID for the synthetic films
+        batch_size: Rows per executemany batch
+    """
+    for start in range(0, count, batch_size):
+        rows = [
+            {
+                "title": f"BENCH FILM {i:08d}",
+                "description": f"A synthetic benchmark film number {i}",
+                "release_year": 2006,
+                "language_id": language_id,
+                "rental_duration": 3,
+                "rental_rate": 4.99,
+                "length": 90 + i % 90,
+                "replacement_cost": 19.99,
+                "special_features": ["Trailers"],
+                "fulltext": "",
+                "streaming_available": i % 2 == 0,
+            }
+            for i in range(start, min(start + batch_size, count))
+        ]
+        await session.execute(insert(Film), rows)
+
+    # Make the synthetic films searchable, as the API does on create
+    await session.execute(
+        update(Film)
+        .where(Film.title.startswith("BENCH FILM "))
+        .values(fulltext=build_fulltext(Film.title, Film.description))
+    )
+    await session.flush()
+
+
+async def measure(func: Callable[[], Awaitable[object]], repeat: int = 20, warmup: int = 2) -> Dict[str, float]:
+    """
+    Time an async callable.
+
+    Args:
+        func: Zero-argument coroutine function to time
+        repeat: Number of timed runs
+        warmup: Number of untimed runs before measuring
+
+    Returns:
+        Dict with median, p95 and mean latency in milliseconds
+    """
+    for _ in range(warmup):
+        await func()
+
+    samples: List[float] = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        await func()
+        samples.append((time.perf_counter() - start) * 1000)
+
+    samples.sort()
+    return {
+        "median_ms": round(statistics.median(samples), 3),
+        "p95_ms": round(samples[max(0, int(len(samples) * 0.95) - 1)], 3),
+        "mean_ms": round(statistics.fmean(samples), 3),
+    }
+
+
+def print_table(headers: Sequence[str], rows: Sequence[Sequence[object]]) -> None:
+    """Print rows as a fixed-width text table."""
+    widths = [
+        max(len(str(header)), *(len(str(row[i])) for row in rows)) if rows else len(str(header))
+        for i, header in enumerate(headers)
+    ]
+    print("  ".join(str(h).ljust(w) for h, w in zip(headers, widths)))
+    print("  ".join("-" * w for w in widths))
+    for row in rows:
+        print("  ".join(str(value).ljust(w) for value, w in zip(row, widths)))
@@ -5,7 +5,7 @@ import uuid
 import jwt
 from core.config import settings
 import logging
-from domain.entities.business import Customer
+from domain.models.responses.customer import CustomerSnapshot
 from domain.models.auth_models import JWTExpiredError, JWTInvalidError, JWTDecodeError
 
 logger = logging.getLogger(__name__)
@@ -16,7 +16,7 @@ class JWTService:
     def __init__(self):
         pass
     
-    async def sign_jwt(self, user: Customer) -> str:
+    async def sign_jwt(self, user: CustomerSnapshot) -> str:
         logger.info(f"Signing JWT for user_id: {user.customer_id}")
         payload = {
             "session_id": str(uuid.uuid4()),
@@ -0,0 +1,513 @@
+"""
+Cache primitives: an in-process byte-bounded LRU, shared (L2) cache
+backends, and a two-tier read-through cache combining them.
+"""
+
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Generic, Hashable, List, Optional, Tuple, TypeVar
+
+from core.config import settings
+from core.logging import get_logger
+
+logger = get_logger(__name__)
+
+V = TypeVar('V')
+
+
+class ByteLRUCache(Generic[V]):
+    """
+    LRU cache bounded by the total size of its entries in bytes.
+    
+    Callers supply each entry's size when storing it; least recently used
+    entries are evicted until the total fits in ``max_bytes``.
+    """
+    
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[Hashable, Tuple[V, int]]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+    
+    @property
+    def size_bytes(self) -> int:
+        return self._bytes
+    
+    def get(self, key: Hashable) -> Optional[V]:
+        """Return the cached value and mark it most recently used, or None."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+    
+    def set(self, key: Hashable, value: V, size: int) -> bool:
+        """
+        Store a value, evicting older entries as needed.
+        
+        Args:
+            key: Cache key
+            value: Value to store
+            size: Size of the value in bytes
+            
+        Returns:
+            False if the value alone is larger than the cache
+        """
+        if size > self.max_bytes:
+            return False
+        
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous[1]
+            
+            self._entries[key] = (value, size)
+            self._bytes += size
+            
+            while self._bytes > self.max_bytes:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._bytes -= evicted_size
+                self.evictions += 1
+        return True
+    
+    def pop(self, key: Hashable) -> Optional[V]:
+        """Remove an entry and return its value, or None."""
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is None:
+                return None
+            self._bytes -= entry[1]
+            return entry[0]
+    
+    def clear(self) -> None:
+        """Remove every entry (counters are kept)."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+    
+    def stats(self) -> Dict[str, Any]:
+        """Current size and hit/miss counters."""
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else None,
+            "evictions": self.evictions,
+        }
+
+
+class CacheBackend:
+    """
+    Shared byte-string cache (the L2 tier) reachable from every worker.
+    """
+    
+    async def get(self, key: str) -> Optional[bytes]:
+        raise NotImplementedError
+    
+    async def set(self, key: str, value: bytes, ttl_seconds: Optional[float] = None) -> None:
+        raise NotImplementedError
+    
+    async def delete(self, *keys: str) -> None:
+        raise NotImplementedError
+    
+    async def incr(self, key: str) -> int:
+        """Atomically increment an integer counter, returning the new value."""
+        raise NotImplementedError
+    
+    async def close(self) -> None:
+        pass
+
+
+class InMemoryCacheBackend(CacheBackend):
+    """
+    Process-local CacheBackend for tests and benchmarks.
+    
+    Several TieredCache instances sharing one of these behave like workers
+    sharing a Redis server.
+    """
+    
+    def __init__(self):
+        self._values: Dict[str, Tuple[bytes, Optional[float]]] = {}
+    
+    async def get(self, key: str) -> Optional[bytes]:
+        entry = self._values.get(key)
+        if entry is None:
+            return None
+        value, expires_at = entry
+        if expires_at is not None and time.monotonic() >= expires_at:
+            del self._values[key]
+            return None
+        return value
+    
+    async def set(self, key: str, value: bytes, ttl_seconds: Optional[float] = None) -> None:
+        expires_at = time.monotonic() + ttl_seconds if ttl_seconds else None
+        self._values[key] = (value, expires_at)
+    
+    async def delete(self, *keys: str) -> None:
+        for key in keys:
+            self._values.pop(key, None)
+    
+    async def incr(self, key: str) -> int:
+        value = int(await self.get(key) or 0) + 1
+        self._values[key] = (str(value).encode(), None)
+        return value
+
+
+class RedisCacheBackend(CacheBackend):
+    """
+    CacheBackend on Redis (``pip install redis``).
+    """
+    
+    def __init__(self, url: str, db: int = 0):
+        try:
+            from redis.asyncio import Redis
+        except ImportError as e:
+            raise ImportError("REDIS_URL is set but the 'redis' package is not installed (pip install redis)") from e
+        
+        self._client = Redis.from_url(url, db=db)
+    
+    async def get(self, key: str) -> Optional[bytes]:
+        return await self._client.get(key)
+    
+    async def set(self, key: str, value: bytes, ttl_seconds: Optional[float] = None) -> None:
+        await self._client.set(key, value, px=int(ttl_seconds * 1000) if ttl_seconds else None)
+    
+    async def delete(self, *keys: str) -> None:
+        await self._client.delete(*keys)
+    
+    async def incr(self, key: str) -> int:
+        return await self._client.incr(key)
+    
+    async def close(self) -> None:
+        await self._client.aclose()
+
+
+_cache_backend: Optional[CacheBackend] = None
+
+
+def get_cache_backend() -> Optional[CacheBackend]:
+    """
+    The shared L2 backend: Redis when ``settings.redis_url`` is set, else None.
+    """
+    global _cache_backend
+    if _cache_backend is None and settings.redis_url:
+        _cache_backend = RedisCacheBackend(settings.redis_url, settings.redis_db)
+        logger.info("Using Redis cache backend", redis_db=settings.redis_db)
+    return _cache_backend
+
+
+async def close_cache_backend() -> None:
+    """Close the shared L2 backend, if one was opened."""
+    global _cache_backend
+    if _cache_backend is not None:
+        await _cache_backend.close()
+        _cache_backend = None
+
+
+class SharedVersion:
+    """
+    Integer version shared between workers through the L2 backend.
+    
+    Readers re-fetch the counter at most every ``check_seconds``, so a bump
+    made by another worker is seen within that interval. Without a backend
+    the counter is process-local.
+    """
+    
+    def __init__(
+        self,
+        key: str,
+        check_seconds: Optional[float] = None,
+        backend: Optional[CacheBackend] = None
+    ):
+        self.key = key
+        self.check_seconds = check_seconds if check_seconds is not None else settings.cache_version_check_seconds
+        self._backend = backend
+        self._value = 0
+        self._next_check = 0.0
+        self.errors = 0
+    
+    @property
+    def backend(self) -> Optional[CacheBackend]:
+        return self._backend if self._backend is not None else get_cache_backend()
+    
+    @property
+    def value(self) -> int:
+        """The last known value, without consulting the backend."""
+        return self._value
+    
+    async def get(self) -> int:
+        """The current value, re-read from the backend when the check interval has passed."""
+        backend = self.backend
+        now = time.monotonic()
+        if backend is None or now < self._next_check:
+            return self._value
+        
+        self._next_check = now + self.check_seconds
+        try:
+            raw = await backend.get(self.key)
+        except Exception as e:
+            self.errors += 1
+            logger.warning("Cache backend call failed", key=self.key, error=str(e))
+            return self._value
+        
+        self._value = int(raw) if raw else 0
+        return self._value
+    
+    async def bump(self) -> int:
+        """Increment the version for every worker."""
+        backend = self.backend
+        if backend is not None:
+            try:
+                self._value = await backend.incr(self.key)
+                return self._value
+            except Exception as e:
+                self.errors += 1
+                logger.warning("Cache backend call failed", key=self.key, error=str(e))
+        
+        self._value += 1
+        return self._value
+
+
+# More keys than this in one TieredCache.discard() retire the whole namespace instead
+MAX_DISCARD_KEYS = 256
+
+# Change log entries a worker reads per check; one further behind drops its local tier
+MAX_CHANGE_LOG = 256
+
+
+class TieredCache(Generic[V]):
+    """
+    Read-through cache: local LRU, then the shared L2 backend, then a loader
+    (normally the database).
+    
+    Keys are prefixed with the namespace and its SharedVersion.
+    ``invalidate()`` bumps the version, so every worker stops reading the old
+    entries; each worker notices within ``version_check_seconds`` and then
+    drops its local tier. ``discard()`` retires single keys instead: it
+    deletes them from L2 and appends them to a short change log in the
+    backend, from which the other workers drop just those local copies
+    within the same interval. L2 failures are logged and fall through to
+    the loader.
+    
+    Values cross the L2 tier as bytes produced by ``dumps``/``loads``; the
+    local tier keeps the decoded objects.
+    """
+    
+    def __init__(
+        self,
+        namespace: str,
+        dumps: Callable[[V], bytes],
+        loads: Callable[[bytes], V],
+        ttl_seconds: Optional[float] = None,
+        local_max_bytes: Optional[int] = None,
+        version_check_seconds: Optional[float] = None,
+        backend: Optional[CacheBackend] = None
+    ):
+        self.namespace = namespace
+        self.dumps = dumps
+        self.loads = loads
+        self.ttl_seconds = ttl_seconds if ttl_seconds is not None else settings.cache_ttl_seconds
+        self.version = SharedVersion(f"{namespace}:version", version_check_seconds, backend)
+        self.changes = SharedVersion(f"{namespace}:changes", version_check_seconds, backend)
+        local_max_bytes = local_max_bytes if local_max_bytes is not None else settings.cache_local_max_bytes
+        # A zero-sized local tier is disabled (callers that keep their own copy)
+        self._local: Optional[ByteLRUCache[Tuple[V, float]]] = ByteLRUCache(local_max_bytes) if local_max_bytes else None
+        self._backend = backend
+        self._local_version = 0
+        self._synced_changes = self.changes.value
+        # Bumped whenever local entries are dropped; values loaded across a drop are not stored
+        self.generation = 0
+        self._listeners: List[Callable[[Optional[str]], None]] = []
+        self.l2_hits = 0
+        self.l2_misses = 0
+        self.l2_errors = 0
+        self.loads_count = 0
+    
+    @property
+    def backend(self) -> Optional[CacheBackend]:
+        return self._backend if self._backend is not None else get_cache_backend()
+    
+    def _key(self, key: str) -> str:
+        return f"{self.namespace}:v{self._local_version}:{key}"
+    
+    async def get_or_load(
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[Optional[V]]],
+        refresh: bool = False
+    ) -> Optional[V]:
+        """
+        Return the cached value for ``key``, loading and caching it on a miss.
+        
+        Args:
+            key: Key within the namespace
+            loader: Coroutine function producing the value; None results are not cached
+            refresh: Skip both cache tiers and overwrite them with a fresh load
+            
+        Returns:
+            The value, or None if the loader found nothing
+        """
+        await self._check_version()
+        cache_key = self._key(key)
+        backend = self.backend
+        
+        if not refresh:
+            if self._local is not None:
+                entry = self._local.get(cache_key)
+                if entry is not None and entry[1] > time.monotonic():
+                    return entry[0]
+            
+            if backend is not None:
+                data = await self._backend_call(backend.get(cache_key))
+                if data is not None:
+                    self.l2_hits += 1
+                    value = self.loads(data)
+                    self._store_local(cache_key, value, len(data))
+                    return value
+                self.l2_misses += 1
+        
+        generation = self.generation
+        value = await loader()
+        self.loads_count += 1
+        if value is None or generation != self.generation:
+            return value
+        
+        data = self.dumps(value)
+        self._store_local(cache_key, value, len(data))
+        if backend is not None:
+            await self._backend_call(backend.set(cache_key, data, self.ttl_seconds))
+        return value
+    
+    async def invalidate(self) -> None:
+        """Retire every entry in the namespace, on every worker."""
+        await self.version.bump()
+        await self._check_version()
+        logger.debug("Cache namespace invalidated", namespace=self.namespace, version=self._local_version)
+    
+    async def discard(self, *keys: str) -> None:
+        """
+        Retire the given keys on every worker, leaving the rest of the namespace cached.
+        
+        Args:
+            *keys: Keys within the namespace
+        """
+        if not keys:
+            return
+        if len(keys) > MAX_DISCARD_KEYS:
+            await self.invalidate()
+            return
+        
+        await self._check_version()
+        self._drop_local(keys)
+        backend = self.backend
+        if backend is not None:
+            await self._backend_call(backend.delete(*(self._key(key) for key in keys)))
+        
+        change = await self.changes.bump()
+        if backend is not None:
+            await self._backend_call(backend.set(self._change_key(change), json.dumps(keys).encode(), self.ttl_seconds))
+        if change == self._synced_changes + 1:
+            self._synced_changes = change
+        else:
+            # Other workers discarded keys this one has not caught up with yet
+            await self._apply_changes(change)
+        logger.debug("Cache keys discarded", namespace=self.namespace, keys=len(keys), change=change)
+    
+    async def sync(self) -> None:
+        """Catch up with invalidations and discards made by other workers."""
+        await self._check_version()
+    
+    def add_listener(self, listener: Callable[[Optional[str]], None]) -> None:
+        """
+        Call ``listener`` whenever local entries are dropped: with the key
+        for a single entry, or None when the whole local tier goes.
+        """
+        self._listeners.append(listener)
+    
+    def _change_key(self, change: int) -> str:
+        return f"{self.namespace}:change:{change}"
+    
+    def _store_local(self, cache_key: str, value: V, size: int) -> None:
+        if self._local is not None:
+            self._local.set(cache_key, (value, time.monotonic() + self.ttl_seconds), size)
+    
+    def _drop_local(self, keys: Optional[Tuple[str, ...]] = None) -> None:
+        """Drop the local copies of ``keys``, or every local entry when None."""
+        self.generation += 1
+        if keys is None:
+            if self._local is not None:
+                self._local.clear()
+            for listener in self._listeners:
+                listener(None)
+            return
+        
+        for key in keys:
+            if self._local is not None:
+                self._local.pop(self._key(key))
+            for listener in self._listeners:
+                listener(key)
+    
+    async def _check_version(self) -> None:
+        version = await self.version.get()
+        if version != self._local_version:
+            self._local_version = version
+            self._drop_local()
+        
+        changes = await self.changes.get()
+        if changes != self._synced_changes:
+            await self._apply_changes(changes)
+    
+    async def _apply_changes(self, changes: int) -> None:
+        """Drop the local copies of keys discarded by other workers, up to change ``changes``."""
+        first = self._synced_changes + 1
+        self._synced_changes = changes
+        backend = self.backend
+        if backend is None or changes < first or changes - first >= MAX_CHANGE_LOG:
+            self._drop_local()
+            return
+        
+        discarded: List[str] = []
+        for change in range(first, changes + 1):
+            data = await self._backend_call(backend.get(self._change_key(change)))
+            if data is None:
+                # Expired or not written yet: the change is unknown, so assume the worst
+                self._drop_local()
+                return
+            discarded.extend(json.loads(data))
+        self._drop_local(tuple(discarded))
+    
+    async def _backend_call(self, call: Awaitable[Any]) -> Any:
+        try:
+            return await call
+        except Exception as e:
+            self.l2_errors += 1
+            logger.warning("Cache backend call failed", namespace=self.namespace, error=str(e))
+            return None
+    
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "version": self._local_version,
+            "local": self._local.stats() if self._local is not None else None,
+            "l2_hits": self.l2_hits,
+            "l2_misses": self.l2_misses,
+            "changes": self._synced_changes,
+            "l2_errors": self.l2_errors + self.version.errors + self.changes.errors,
+            "loads": self.loads_count,
+        }
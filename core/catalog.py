@@ -0,0 +1,43 @@
+"""
+Catalog index setup and lifecycle management.
+"""
+import time
+from contextlib import asynccontextmanager
+import anyio
+from core.config import settings
+from core.db import get_engine_and_session_factory
+from core.logging import get_logger
+from domain.catalog import catalog_view_refresher, category_index, film_search_index, reference_data
+
+logger = get_logger(__name__)
+
+@asynccontextmanager
+async def catalog_lifespan():
+    start_time = time.time()
+    logger.info("Warming catalog indexes")
+    
+    try:
+        await warm_catalog_indexes()
+        init_duration = time.time() - start_time
+        logger.info("Catalog indexes warmed", duration_ms=round(init_duration * 1000, 2))
+    except Exception as e:
+        # Indexes load lazily on first use, so a cold start is not fatal
+        logger.warning("Failed to warm catalog indexes", error=str(e))
+    
+    async with anyio.create_task_group() as task_group:
+        await task_group.start(catalog_view_refresher.run)
+        try:
+            yield
+        finally:
+            logger.info("Shutting down catalog indexes")
+            await catalog_view_refresher.stop()
+
+async def warm_catalog_indexes():
+    _, session_factory = get_engine_and_session_factory("film")
+    
+    async with session_factory() as session:
+        await reference_data.load(session)
+        await category_index.load(session)
+        
+        if settings.search_index_enabled:
+            await film_search_index.load(session)
@@ -26,6 +26,39 @@ class Settings(BaseSettings):
     database_pool_size: int = 10
     database_max_overflow: int = 20
     
+    # Film listing settings
+    film_count_strategy: str = "count"  # Options: "count" (separate COUNT query), "window" (count(*) OVER ())
+    category_index_ttl_seconds: int = 300  # Reload interval for the in-process category -> film_id index
+    reference_data_ttl_seconds: int = 3600  # Reload interval for the in-process language/category/store registry
+    search_index_enabled: bool = False  # Build the in-process BM25 film search index at startup
+    search_index_ttl_seconds: int = 300  # Rebuild interval for the search index, for film changes made outside the API
+    film_batch_max_ids: int = 500  # Most IDs accepted by POST /films/batch
+    film_bulk_max_items: int = 10000  # Most films accepted by one POST /films/bulk
+    film_bulk_batch_size: int = 1000  # Films per multi-row INSERT/UPDATE (and per commit) in bulk writes
+    trusted_model_construct: bool = False  # Build responses from ORM entities with model_construct (skips validation of database values)
+    film_read_mode: str = "orm"  # Options: "orm" (SQLModel entities), "rows" (read-only Core rows), "view" (rows from the film_catalog materialized view)
+    catalog_view_refresh_debounce_seconds: float = 2.0  # Quiet period after the last write before the view is refreshed
+    catalog_view_refresh_max_delay_seconds: float = 30.0  # Longest a write waits for a refresh during a steady stream of writes
+    film_export_batch_size: int = 2000  # Rows per server-side cursor fetch in catalog exports
+    copy_export_max_pending_chunks: int = 16  # COPY output chunks buffered ahead of a slow client in admin CSV exports
+    
+    # Response conversion settings (see benchmarks/bench_conversion_offload.py for the thresholds)
+    convert_inline_max_rows: int = 2000  # Async conversions up to this many rows run in one go on the event loop
+    convert_slice_rows: int = 1000  # Larger async conversions yield to the event loop after each slice of this many rows
+    convert_process_workers: int = 0  # Worker processes serialising large NDJSON exports (0 = serialise on the event loop)
+    convert_process_min_rows: int = 20000  # Rows an export serialises inline before handing batches to the process pool
+    
+    # Analytics snapshot settings
+    snapshot_dir: str = "snapshots"  # Directory snapshots are written under, one subdirectory per snapshot
+    snapshot_format: str = "parquet"  # Options: "parquet" (zstd Parquet), "arrow" (Arrow IPC files)
+    snapshot_batch_size: int = 50000  # Rows per server-side cursor fetch and per record batch / row group
+    snapshot_rows_per_file: int = 1000000  # Rows per part file before a table rolls over to the next file
+    
+    # Film catalog import settings
+    import_dir: str = "imports"  # Directory uploaded catalog files are stored under until imported
+    import_chunk_size: int = 5000  # Rows validated, copied and committed together (the resume granularity)
+    import_max_sample_errors: int = 20  # Rejected rows kept (with line and reason) in an import's progress
+    
     # Global LLM service selection
     global_llm_service: str = "AzureOpenAI"  # Options: "AzureOpenAI", "OpenAI", etc.
     
@@ -45,9 +78,24 @@ class Settings(BaseSettings):
     jwt_algorithm: str = "HS256"
     jwt_expiration_hours: int = 24
     
+    # Response rendering settings
+    fast_json_responses: bool = True  # Serialise service-built response models directly (no second response_model validation); orjson for other content
+    film_fragment_cache_max_bytes: int = 32 * 1024 * 1024  # Serialised film JSON kept per (film_id, last_update) for assembling responses (0 disables)
+    
+    # Response cache settings (GET routes tagged with Surrogate-Key)
+    response_cache_enabled: bool = True
+    response_cache_max_bytes: int = 64 * 1024 * 1024
+    response_cache_max_entry_bytes: int = 1024 * 1024
+    response_cache_ttl_seconds: int = 300
+    
     # Redis settings (if using caching)
     redis_url: Optional[str] = None
     redis_db: int = 0
+    
+    # Two-tier read-through cache (local LRU -> Redis -> database)
+    cache_ttl_seconds: int = 300
+    cache_local_max_bytes: int = 16 * 1024 * 1024  # Per namespace
+    cache_version_check_seconds: float = 1.0  # How stale another worker's invalidation can be locally
 
     # Auth
     jwt_secret: Optional[str] = None
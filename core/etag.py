@@ -0,0 +1,35 @@
+"""
+Entity tag helpers for conditional GET requests.
+"""
+
+from typing import Optional
+
+from fastapi import Response, status
+
+
+def etag_matches(if_none_match: Optional[str], etag: Optional[str]) -> bool:
+    """
+    Whether an ``If-None-Match`` header matches an entity tag.
+    
+    Uses the weak comparison RFC 9110 prescribes for If-None-Match, so
+    ``W/"x"`` matches ``"x"``.
+    
+    Args:
+        if_none_match: Raw header value (a list of tags, or ``*``)
+        etag: Current entity tag of the resource
+        
+    Returns:
+        True if the client's copy is current
+    """
+    if not if_none_match or not etag:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    
+    current = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == current for tag in if_none_match.split(","))
+
+
+def not_modified(etag: str) -> Response:
+    """An empty 304 response carrying the entity tag."""
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
@@ -0,0 +1,28 @@
+"""
+In-process metrics registry.
+
+Components register a callable returning a dict of their current counters;
+``GET /api/v1/metrics`` reports every registered source.
+"""
+
+from typing import Any, Callable, Dict
+
+MetricsSource = Callable[[], Dict[str, Any]]
+
+_sources: Dict[str, MetricsSource] = {}
+
+
+def register_metrics(name: str, source: MetricsSource) -> None:
+    """
+    Register (or replace) a metrics source.
+    
+    Args:
+        name: Section name in the metrics report
+        source: Callable returning the section's current values
+    """
+    _sources[name] = source
+
+
+def collect_metrics() -> Dict[str, Dict[str, Any]]:
+    """Snapshot every registered metrics source."""
+    return {name: source() for name, source in sorted(_sources.items())}
@@ -0,0 +1,46 @@
+"""film filter indexes
+
+Revision ID: 36c38fed7a29
+Revises: a3f1c9d2b7e4
+Create Date: 2026-10-16 21:04:17.283914
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '36c38fed7a29'
+down_revision = 'a3f1c9d2b7e4'
+branch_labels = None
+depends_on = None
+
+# Columns the film listing filters compare with btree operators
+# (language_id is already covered by idx_fk_language_id)
+BTREE_INDEXES = {
+    'idx_film_rating': 'rating',
+    'idx_film_length': 'length',
+    'idx_film_rental_rate': 'rental_rate',
+    'idx_film_release_year': 'release_year',
+    'idx_film_streaming_available': 'streaming_available',
+}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for name, column in BTREE_INDEXES.items():
+        op.create_index(name, 'film', [column], if_not_exists=True)
+    # special_features @> ARRAY[...] needs GIN
+    op.create_index(
+        'idx_film_special_features', 'film', ['special_features'],
+        postgresql_using='gin', if_not_exists=True
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_film_special_features', table_name='film', if_exists=True)
+    for name in BTREE_INDEXES:
+        op.drop_index(name, table_name='film', if_exists=True)
@@ -0,0 +1,94 @@
+"""film catalog materialized view
+
+Revision ID: 7d2e5b0c9f41
+Revises: 36c38fed7a29
+Create Date: 2026-10-16 23:12:48.530271
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '7d2e5b0c9f41'
+down_revision = '36c38fed7a29'
+branch_labels = None
+depends_on = None
+
+# One row per film with the language name, its categories and the number of
+# copies not currently rented out, so listings and facets read a single relation
+FILM_CATALOG_VIEW = """
+CREATE MATERIALIZED VIEW IF NOT EXISTS film_catalog AS
+SELECT
+    film.film_id,
+    film.title,
+    film.description,
+    film.release_year,
+    film.language_id,
+    rtrim(language.name) AS language_name,
+    film.rental_duration,
+    film.rental_rate,
+    film.length,
+    film.replacement_cost,
+    film.rating,
+    film.special_features,
+    film.last_update,
+    film.streaming_available,
+    film.fulltext,
+    COALESCE(categories.category_ids, '{}') AS category_ids,
+    COALESCE(categories.category_names, '{}') AS category_names,
+    COALESCE(stock.available_count, 0) AS available_count
+FROM film
+LEFT JOIN language ON language.language_id = film.language_id
+LEFT JOIN LATERAL (
+    SELECT
+        array_agg(category.category_id ORDER BY category.category_id) AS category_ids,
+        array_agg(category.name ORDER BY category.category_id) AS category_names
+    FROM film_category
+    JOIN category ON category.category_id = film_category.category_id
+    WHERE film_category.film_id = film.film_id
+) AS categories ON true
+LEFT JOIN LATERAL (
+    SELECT count(*)::integer AS available_count
+    FROM inventory
+    WHERE inventory.film_id = film.film_id
+      AND NOT EXISTS (
+          SELECT 1 FROM rental
+          WHERE rental.inventory_id = inventory.inventory_id AND rental.return_date IS NULL
+      )
+) AS stock ON true
+WITH DATA
+"""
+
+# Listing filters and facets that read the view
+BTREE_INDEXES = {
+    'idx_film_catalog_rating': 'rating',
+    'idx_film_catalog_language_id': 'language_id',
+    'idx_film_catalog_length': 'length',
+    'idx_film_catalog_rental_rate': 'rental_rate',
+    'idx_film_catalog_release_year': 'release_year',
+    'idx_film_catalog_streaming_available': 'streaming_available',
+}
+GIN_INDEXES = {
+    'idx_film_catalog_category_ids': 'category_ids',
+    'idx_film_catalog_special_features': 'special_features',
+    'idx_film_catalog_fulltext': 'fulltext',
+}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute(FILM_CATALOG_VIEW)
+    # REFRESH MATERIALIZED VIEW CONCURRENTLY requires a unique index
+    op.create_index('idx_film_catalog_film_id', 'film_catalog', ['film_id'], unique=True, if_not_exists=True)
+    for name, column in BTREE_INDEXES.items():
+        op.create_index(name, 'film_catalog', [column], if_not_exists=True)
+    for name, column in GIN_INDEXES.items():
+        op.create_index(name, 'film_catalog', [column], postgresql_using='gin', if_not_exists=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS film_catalog")
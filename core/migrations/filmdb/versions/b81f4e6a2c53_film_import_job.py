@@ -0,0 +1,41 @@
+"""film import job
+
+Revision ID: b81f4e6a2c53
+Revises: 7d2e5b0c9f41
+Create Date: 2026-10-17 01:41:09.662107
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b81f4e6a2c53'
+down_revision = '7d2e5b0c9f41'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('film_import_job',
+    sa.Column('job_id', sa.String(length=64), nullable=False),
+    sa.Column('source', sa.TEXT(), nullable=False),
+    sa.Column('file_format', sa.String(length=10), nullable=False),
+    sa.Column('status', sa.String(length=20), nullable=False),
+    sa.Column('rows_committed', sa.INTEGER(), server_default=sa.text('0'), nullable=False),
+    sa.Column('rows_imported', sa.INTEGER(), server_default=sa.text('0'), nullable=False),
+    sa.Column('rows_rejected', sa.INTEGER(), server_default=sa.text('0'), nullable=False),
+    sa.Column('chunks_committed', sa.INTEGER(), server_default=sa.text('0'), nullable=False),
+    sa.Column('error', sa.TEXT(), nullable=True),
+    sa.Column('created_at', sa.TIMESTAMP(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('updated_at', sa.TIMESTAMP(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.PrimaryKeyConstraint('job_id')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('film_import_job')
@@ -0,0 +1,90 @@
+"""
+Postgres COPY passthrough for bulk exports.
+
+``COPY ... TO STDOUT`` output is forwarded to the caller exactly as the
+server sends it, so rows are never decoded in Python. The copy runs in a
+background task that feeds a bounded memory stream: when the consumer
+(usually an HTTP client) falls behind, the stream fills, the copy stops
+reading from the socket and Postgres is throttled by TCP backpressure.
+Memory use is therefore bounded by the stream's buffer, not the table size.
+
+Both helpers are async context managers rather than generators, so the
+task group running the copy is never held open across a ``yield`` (see
+``core.streaming``).
+"""
+
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator
+
+import anyio
+from anyio.streams.memory import MemoryObjectReceiveStream, MemoryObjectSendStream
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from core.logging import get_logger
+from core.streaming import produced_stream
+
+logger = get_logger(__name__)
+
+
+def copy_out(driver_connection: Any, query: str, max_pending_chunks: int = 16, **copy_options):
+    """
+    Stream the output of ``COPY (query) TO STDOUT`` from an asyncpg connection.
+
+    Use as ``async with copy_out(...) as chunks: async for chunk in chunks``.
+    Leaving the context early cancels the copy; a failed copy raises when
+    the context exits.
+
+    Args:
+        driver_connection: asyncpg connection (anything with ``copy_from_query``)
+        query: SELECT whose result to copy
+        max_pending_chunks: Chunks buffered ahead of the consumer
+        **copy_options: COPY options passed to asyncpg (``format``, ``header``, ...)
+
+    Returns:
+        Context manager yielding the raw COPY output, chunked as received from the server
+    """
+    async def produce(send: MemoryObjectSendStream) -> None:
+        await driver_connection.copy_from_query(query, output=send.send, **copy_options)
+
+    return produced_stream(produce, max_pending_chunks)
+
+
+@asynccontextmanager
+async def copy_query_csv(
+    engine: AsyncEngine, query: str, max_pending_chunks: int = 16
+) -> AsyncIterator[MemoryObjectReceiveStream]:
+    """
+    Stream a query's result as CSV (with header) through a pooled connection.
+
+    A copy abandoned part-way (client disconnect, error) leaves the
+    connection mid-protocol, so it is invalidated instead of returned to
+    the pool.
+
+    Args:
+        engine: Async engine whose pool to borrow a connection from
+        query: SELECT whose result to copy
+        max_pending_chunks: Chunks buffered ahead of the consumer
+
+    Yields:
+        Stream of CSV bytes
+    """
+    async with engine.connect() as connection:
+        raw_connection = await connection.get_raw_connection()
+        completed = False
+
+        async def produce(send: MemoryObjectSendStream) -> None:
+            nonlocal completed
+            await raw_connection.driver_connection.copy_from_query(
+                query, output=send.send, format="csv", header=True
+            )
+            completed = True
+
+        try:
+            async with produced_stream(produce, max_pending_chunks) as chunks:
+                yield chunks
+        finally:
+            if not completed:
+                logger.warning("COPY export aborted, discarding connection")
+                # Also when the export is being cancelled
+                with anyio.CancelScope(shield=True):
+                    await connection.invalidate()
@@ -0,0 +1,304 @@
+"""
+HTTP response cache for GET routes, purged by surrogate key.
+
+Routes opt in by setting a ``Surrogate-Key`` header listing the keys their
+response depends on (e.g. ``film:42`` or ``films:list``). Services purge
+those keys after writes, which drops exactly the affected entries on the
+worker that made the write and, through a shared version, every entry on
+the other workers.
+"""
+
+import time
+from typing import Dict, List, Optional, Set, Tuple
+from urllib.parse import parse_qsl, urlencode
+
+from fastapi import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from core.cache import ByteLRUCache, SharedVersion
+from core.config import settings
+from core.etag import etag_matches
+from core.logging import get_logger
+from core.metrics import register_metrics
+
+logger = get_logger(__name__)
+
+SURROGATE_KEY_HEADER = "Surrogate-Key"
+
+# Rough per-entry bookkeeping overhead, so tiny bodies still count
+ENTRY_OVERHEAD_BYTES = 256
+
+
+def set_surrogate_keys(response: Response, *keys: str) -> None:
+    """
+    Tag a response with surrogate keys, making it cacheable.
+
+    Args:
+        response: Response whose headers to set
+        *keys: Keys the response content depends on
+    """
+    response.headers[SURROGATE_KEY_HEADER] = " ".join(keys)
+
+
+class CachedResponse:
+    """A complete cached response."""
+
+    __slots__ = ("status", "headers", "body", "keys", "stored_at")
+
+    def __init__(self, status: int, headers: List[Tuple[bytes, bytes]], body: bytes, keys: Tuple[str, ...]):
+        self.status = status
+        self.headers = headers
+        self.body = body
+        self.keys = keys
+        self.stored_at = time.monotonic()
+
+    @property
+    def size(self) -> int:
+        return len(self.body) + sum(len(k) + len(v) for k, v in self.headers) + ENTRY_OVERHEAD_BYTES
+
+
+class ResponseCache:
+    """
+    Byte-bounded LRU of responses with a surrogate key -> cache key index.
+
+    Each worker holds its own entries. Purges drop the tagged entries
+    locally and bump a SharedVersion; other workers cannot tell which of
+    their entries a purge covers, so they drop all of them once they see
+    the new version (within ``settings.cache_version_check_seconds``).
+    Without a shared backend the version is process-local and entries on
+    other workers live out their TTL.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int,
+        max_entry_bytes: int,
+        ttl_seconds: float,
+        version: Optional[SharedVersion] = None
+    ):
+        self.max_entry_bytes = max_entry_bytes
+        self.ttl_seconds = ttl_seconds
+        self.version = version or SharedVersion("responses:version")
+        self._store: ByteLRUCache[CachedResponse] = ByteLRUCache(max_bytes)
+        self._keys_by_surrogate: Dict[str, Set[str]] = {}
+        self._synced_version = self.version.value
+        # Bumped by every purge; responses computed across a purge are not stored
+        self.generation = 0
+        self.purged = 0
+
+    @staticmethod
+    def make_key(method: str, path: str, query_string: bytes) -> str:
+        """Cache key from the method, path and normalised (sorted, non-empty) query."""
+        params = sorted(parse_qsl(query_string.decode("latin-1"), keep_blank_values=False))
+        return f"{method} {path}?{urlencode(params)}"
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        entry = self._store.get(key)
+        if entry is not None and time.monotonic() - entry.stored_at > self.ttl_seconds:
+            self._drop(key)
+            return None
+        return entry
+
+    def store(self, key: str, entry: CachedResponse, generation: int) -> bool:
+        """
+        Store a response computed while the cache was at ``generation``.
+
+        Returns:
+            True if stored
+        """
+        if generation != self.generation or entry.size > self.max_entry_bytes:
+            return False
+
+        self._drop(key)
+        if not self._store.set(key, entry, entry.size):
+            return False
+
+        for surrogate in entry.keys:
+            self._keys_by_surrogate.setdefault(surrogate, set()).add(key)
+        return True
+
+    async def sync(self) -> None:
+        """Drop every entry if another worker has purged since the last check."""
+        version = await self.version.get()
+        if version != self._synced_version:
+            self._synced_version = version
+            self.clear()
+
+    async def purge(self, *surrogate_keys: str) -> int:
+        """
+        Drop every cached response tagged with any of the given keys, here
+        and (all entries) on the other workers.
+
+        Returns:
+            Number of responses dropped on this worker
+        """
+        self.generation += 1
+        dropped = 0
+        for surrogate in surrogate_keys:
+            for key in self._keys_by_surrogate.pop(surrogate, set()):
+                if self._drop(key):
+                    dropped += 1
+
+        self.purged += dropped
+        if dropped:
+            logger.debug("Response cache purged", surrogate_keys=surrogate_keys, dropped=dropped)
+
+        expected = self._synced_version + 1
+        self._synced_version = await self.version.bump()
+        if self._synced_version != expected:
+            # Another worker purged too and this one has not caught up yet
+            self.clear()
+        return dropped
+
+    async def purge_all(self) -> None:
+        """Drop every cached response, here and on the other workers."""
+        self.clear()
+        self._synced_version = await self.version.bump()
+
+    def clear(self) -> None:
+        self.generation += 1
+        self._store.clear()
+        self._keys_by_surrogate.clear()
+
+    def _drop(self, key: str) -> bool:
+        entry = self._store.pop(key)
+        if entry is None:
+            return False
+
+        for surrogate in entry.keys:
+            keys = self._keys_by_surrogate.get(surrogate)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._keys_by_surrogate[surrogate]
+        return True
+
+    def stats(self) -> Dict[str, object]:
+        return {
+            **self._store.stats(),
+            "surrogate_keys": len(self._keys_by_surrogate),
+            "purged": self.purged,
+            "version": self._synced_version,
+        }
+
+
+class ResponseCacheMiddleware:
+    """
+    ASGI middleware serving GET responses from a ResponseCache.
+
+    Only successful responses tagged with a ``Surrogate-Key`` header are
+    stored. Requests carrying credentials or ``Cache-Control: no-cache`` and
+    responses marked ``no-store``/``private`` or setting cookies bypass the
+    cache. Bodies are streamed through untouched; one that outgrows the
+    per-entry limit simply is not stored. A cached response with an ETag
+    also answers matching ``If-None-Match`` requests with a 304.
+    """
+
+    def __init__(self, app: ASGIApp, cache: Optional["ResponseCache"] = None):
+        self.app = app
+        self.cache = cache or response_cache
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] != "GET":
+            await self.app(scope, receive, send)
+            return
+
+        request_headers = dict(scope["headers"])
+        if b"authorization" in request_headers or b"no-cache" in request_headers.get(b"cache-control", b""):
+            await self.app(scope, receive, send)
+            return
+
+        cache = self.cache
+        await cache.sync()
+        key = cache.make_key("GET", scope["path"], scope.get("query_string", b""))
+        entry = cache.get(key)
+        if entry is not None:
+            if_none_match = request_headers.get(b"if-none-match")
+            etag = self._header(entry.headers, b"etag")
+            if if_none_match and etag_matches(if_none_match.decode("latin-1"), etag):
+                await self._send_not_modified(etag, send)
+            else:
+                await self._send_cached(entry, send)
+            return
+
+        generation = cache.generation
+        state = {"status": 0, "headers": [], "body": [], "size": 0, "cacheable": False}
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                state["status"] = message["status"]
+                state["headers"] = list(message.get("headers", []))
+                state["cacheable"] = message["status"] == 200 and self._is_cacheable(state["headers"])
+                message = {**message, "headers": state["headers"] + [(b"x-cache", b"MISS")]}
+            elif message["type"] == "http.response.body" and state["cacheable"]:
+                body = message.get("body", b"")
+                state["size"] += len(body)
+                if state["size"] > cache.max_entry_bytes:
+                    state["cacheable"] = False
+                    state["body"] = []
+                else:
+                    state["body"].append(body)
+
+                if not message.get("more_body", False) and state["cacheable"]:
+                    cache.store(
+                        key,
+                        CachedResponse(
+                            status=state["status"],
+                            headers=state["headers"],
+                            body=b"".join(state["body"]),
+                            keys=self._surrogate_keys(state["headers"]),
+                        ),
+                        generation,
+                    )
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
+    @staticmethod
+    def _header(headers: List[Tuple[bytes, bytes]], name: bytes) -> Optional[str]:
+        for header_name, value in headers:
+            if header_name.lower() == name:
+                return value.decode("latin-1")
+        return None
+    
+    @classmethod
+    def _surrogate_keys(cls, headers: List[Tuple[bytes, bytes]]) -> Tuple[str, ...]:
+        return tuple((cls._header(headers, b"surrogate-key") or "").split())
+
+    @classmethod
+    def _is_cacheable(cls, headers: List[Tuple[bytes, bytes]]) -> bool:
+        if not cls._surrogate_keys(headers):
+            return False
+        for name, value in headers:
+            name = name.lower()
+            if name == b"set-cookie":
+                return False
+            if name == b"cache-control" and (b"no-store" in value or b"private" in value):
+                return False
+        return True
+
+    @staticmethod
+    async def _send_cached(entry: CachedResponse, send: Send) -> None:
+        await send({
+            "type": "http.response.start",
+            "status": entry.status,
+            "headers": entry.headers + [(b"x-cache", b"HIT")],
+        })
+        await send({"type": "http.response.body", "body": entry.body})
+    
+    @staticmethod
+    async def _send_not_modified(etag: str, send: Send) -> None:
+        await send({
+            "type": "http.response.start",
+            "status": 304,
+            "headers": [(b"etag", etag.encode("latin-1")), (b"x-cache", b"HIT")],
+        })
+        await send({"type": "http.response.body", "body": b""})
+
+
+response_cache = ResponseCache(
+    max_bytes=settings.response_cache_max_bytes,
+    max_entry_bytes=settings.response_cache_max_entry_bytes,
+    ttl_seconds=settings.response_cache_ttl_seconds,
+)
+register_metrics("response_cache", response_cache.stats)
@@ -0,0 +1,103 @@
+"""
+JSON response rendering without FastAPI's second validation pass.
+
+A route that returns a model has it validated again against its
+``response_model`` and turned into plain data by ``jsonable_encoder``
+before it is encoded. Models our services build are already of the
+response type, so with ``settings.fast_json_responses`` routes hand them
+to ``model_response`` instead, which serialises them once with pydantic's
+own JSON serializer.
+"""
+
+from decimal import Decimal
+from typing import Any, Callable, Dict, Type, Union
+
+from fastapi import Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+from core.config import settings
+
+try:
+    import orjson
+except ImportError:  # pip install ".[fast-json]"
+    orjson = None
+
+
+# Renders a model to JSON bytes in place of its own serializer
+ModelRenderer = Callable[[Any], bytes]
+
+_renderers: Dict[type, ModelRenderer] = {}
+
+
+def register_renderer(model: Type[BaseModel], render: ModelRenderer) -> None:
+    """
+    Register (or replace) how FastJSONResponse renders instances of exactly ``model``.
+
+    The renderer must produce the same JSON as the model's own serializer;
+    it exists to reuse bytes rendered earlier (see the film fragment cache).
+    """
+    _renderers[model] = render
+
+
+def _orjson_default(value: Any) -> Any:
+    """Types orjson does not encode itself."""
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    if isinstance(value, Decimal):
+        return float(value)
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    JSON response that serialises pydantic models directly and other content with orjson.
+
+    Models with a registered renderer are rendered by it.
+
+    Without orjson installed, content other than models falls back to the
+    standard ``JSONResponse`` encoding.
+    """
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, BaseModel):
+            render = _renderers.get(type(content))
+            if render is not None:
+                return render(content)
+            return content.__pydantic_serializer__.to_json(content)
+        if orjson is not None:
+            return orjson.dumps(content, default=_orjson_default)
+        return super().render(jsonable_encoder(content))
+
+
+def model_response(content: Any, model: Type[BaseModel], response: Response) -> Union[Any, Response]:
+    """
+    Render a service-built response model directly, keeping the headers set on ``response``.
+
+    Content that is not exactly ``model`` (dicts, subclasses with extra
+    fields, None) is returned unchanged, so FastAPI validates and filters
+    it against the route's ``response_model`` as usual; so is everything
+    while ``settings.fast_json_responses`` is off.
+
+    Args:
+        content: What the route would otherwise return
+        model: The route's response model
+        response: The response parameter the route set headers on
+
+    Returns:
+        A rendered response, or ``content`` for FastAPI to handle
+    """
+    if not settings.fast_json_responses or type(content) is not model:
+        return content
+
+    rendered = FastJSONResponse(content, status_code=response.status_code or 200)
+    rendered.raw_headers.extend(response.raw_headers)
+    return rendered
+
+
+def sparse_response(content: Any, response: Response) -> JSONResponse:
+    """Serialise a trimmed (dict) result directly, keeping the headers set on ``response``."""
+    rendered = FastJSONResponse(content)
+    rendered.raw_headers.extend(response.raw_headers)
+    return rendered
@@ -0,0 +1,142 @@
+"""
+Helpers for streamed HTTP responses.
+
+Bodies that need a background task (a COPY relay, batches rendered in the
+process pool) are exposed as async context managers yielding a bounded
+chunk stream, not as async generators: a task group held open across a
+generator's ``yield`` could be exited from another task when the client
+disconnects. ``ContextStreamingResponse`` enters such a body in the task
+that sends the response.
+"""
+
+import zlib
+from contextlib import asynccontextmanager
+from typing import AsyncContextManager, AsyncIterable, AsyncIterator, Awaitable, Callable, Optional
+
+import anyio
+from anyio.streams.memory import MemoryObjectReceiveStream, MemoryObjectSendStream
+from starlette.responses import StreamingResponse
+from starlette.types import Receive, Scope, Send
+
+# Flush compressed output once this much has accumulated
+GZIP_FLUSH_BYTES = 64 * 1024
+
+
+def accepts_gzip(accept_encoding: Optional[str]) -> bool:
+    """Whether an ``Accept-Encoding`` header allows a gzip-encoded response."""
+    if not accept_encoding:
+        return False
+    
+    for coding in accept_encoding.split(","):
+        name, _, params = coding.strip().partition(";")
+        if name.strip().lower() in ("gzip", "*"):
+            quality = params.strip().removeprefix("q=")
+            return not (params and quality in ("0", "0.0", "0.00", "0.000"))
+    return False
+
+
+async def gzip_stream(chunks: AsyncIterable[bytes], level: int = 6) -> AsyncIterator[bytes]:
+    """
+    Gzip-compress a byte stream incrementally.
+    
+    Args:
+        chunks: Uncompressed chunks
+        level: zlib compression level
+        
+    Yields:
+        Gzip member data, in pieces of roughly GZIP_FLUSH_BYTES
+    """
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    pending = bytearray()
+    
+    async for chunk in chunks:
+        pending += compressor.compress(chunk)
+        if len(pending) >= GZIP_FLUSH_BYTES:
+            yield bytes(pending)
+            pending.clear()
+    
+    pending += compressor.flush()
+    yield bytes(pending)
+
+
+@asynccontextmanager
+async def produced_stream(
+    produce: Callable[[MemoryObjectSendStream], Awaitable[None]],
+    max_pending_chunks: int = 16
+) -> AsyncIterator[MemoryObjectReceiveStream]:
+    """
+    Run ``produce(send)`` in a background task and read its chunks from a bounded stream.
+
+    The producer blocks once ``max_pending_chunks`` are waiting, so a slow
+    consumer throttles it. Leaving the context early cancels the producer.
+    A producer error is raised when the context exits, after the chunks
+    sent before it.
+
+    Args:
+        produce: Coroutine function sending chunks; the stream is closed when it returns
+        max_pending_chunks: Chunks buffered ahead of the consumer
+
+    Yields:
+        The receiving end of the stream
+    """
+    send, receive = anyio.create_memory_object_stream(max_pending_chunks)
+    producer_error: Optional[Exception] = None
+    consumer_error: Optional[Exception] = None
+
+    async def run() -> None:
+        nonlocal producer_error
+        async with send:
+            try:
+                await produce(send)
+            except anyio.BrokenResourceError:
+                # The consumer left early; the producer is being cancelled anyway
+                pass
+            except Exception as e:
+                producer_error = e
+
+    async with anyio.create_task_group() as task_group:
+        task_group.start_soon(run)
+        try:
+            async with receive:
+                yield receive
+        except Exception as e:
+            # Raised once the group has exited, so callers see it rather than an ExceptionGroup
+            consumer_error = e
+        finally:
+            # Stops a producer the consumer abandoned; a no-op once it has finished
+            task_group.cancel_scope.cancel()
+
+    if consumer_error is not None:
+        raise consumer_error
+    if producer_error is not None:
+        raise producer_error
+
+
+class ContextStreamingResponse(StreamingResponse):
+    """
+    StreamingResponse whose body is an async context manager yielding chunks.
+
+    The body is opened when the response is sent and closed, in the same
+    task, once it has been sent or the client has gone away.
+    """
+
+    def __init__(
+        self,
+        body: Callable[[], AsyncContextManager[AsyncIterable[bytes]]],
+        transform: Optional[Callable[[AsyncIterable[bytes]], AsyncIterator[bytes]]] = None,
+        **kwargs
+    ):
+        """
+        Args:
+            body: Opens the body, e.g. ``lambda: service.ndjson(since)``
+            transform: Wraps the chunks before sending, e.g. ``gzip_stream``
+            **kwargs: StreamingResponse arguments (media_type, headers, ...)
+        """
+        super().__init__(content=(), **kwargs)
+        self.open_body = body
+        self.transform = transform
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        async with self.open_body() as chunks:
+            self.body_iterator = self.transform(chunks) if self.transform else chunks
+            await super().__call__(scope, receive, send)
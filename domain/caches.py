@@ -0,0 +1,61 @@
+"""
+Shared read-through caches (local LRU -> Redis -> database) for domain lookups.
+"""
+
+import json
+from typing import Any, Dict
+
+from core.cache import TieredCache
+from core.config import settings
+from core.metrics import register_metrics
+from domain.models.responses.customer import CustomerSnapshot
+from domain.models.responses.film import FilmFacetsResponse, FilmResponse
+
+
+def _dump_model(model) -> bytes:
+    return model.model_dump_json().encode()
+
+
+# Films by ID, as response models
+film_cache: TieredCache[FilmResponse] = TieredCache(
+    "film",
+    dumps=_dump_model,
+    loads=FilmResponse.model_validate_json,
+)
+
+# Customers by ID, as the identity snapshot used by auth and rentals
+customer_cache: TieredCache[CustomerSnapshot] = TieredCache(
+    "customer",
+    dumps=_dump_model,
+    loads=CustomerSnapshot.model_validate_json,
+)
+
+# Category table and film_category links; the category index keeps the
+# decoded copy itself, so there is no local tier
+category_cache: TieredCache[Dict[str, Any]] = TieredCache(
+    "category",
+    dumps=lambda snapshot: json.dumps(snapshot, separators=(",", ":")).encode(),
+    loads=json.loads,
+    ttl_seconds=settings.category_index_ttl_seconds,
+    local_max_bytes=0,
+)
+
+# Facet counts by listing filter signature
+facet_cache: TieredCache[FilmFacetsResponse] = TieredCache(
+    "facets",
+    dumps=_dump_model,
+    loads=FilmFacetsResponse.model_validate_json,
+)
+
+# Language, category and store tables; the reference data registry keeps the
+# decoded copy itself
+reference_cache: TieredCache[Dict[str, Any]] = TieredCache(
+    "reference",
+    dumps=lambda snapshot: json.dumps(snapshot, separators=(",", ":")).encode(),
+    loads=json.loads,
+    ttl_seconds=settings.reference_data_ttl_seconds,
+    local_max_bytes=0,
+)
+
+for _cache in (film_cache, customer_cache, category_cache, facet_cache, reference_cache):
+    register_metrics(f"cache.{_cache.namespace}", _cache.stats)
@@ -0,0 +1,27 @@
+"""
+In-process catalog state: indexes and caches derived from the film tables.
+"""
+
+from .catalog_view import CatalogViewRefresher, catalog_view_refresher, film_catalog
+from .category_index import CategoryIndex, category_index
+from .film_fragments import FilmFragmentCache, film_fragments
+from .reference_data import ReferenceDataRegistry, reference_data
+from .search_index import FilmSearchIndex, film_search_index
+from .versions import CatalogVersions, catalog_versions, film_etag
+
+__all__ = [
+    "CatalogViewRefresher",
+    "catalog_view_refresher",
+    "film_catalog",
+    "CategoryIndex",
+    "category_index",
+    "FilmFragmentCache",
+    "film_fragments",
+    "ReferenceDataRegistry",
+    "reference_data",
+    "FilmSearchIndex",
+    "film_search_index",
+    "CatalogVersions",
+    "catalog_versions",
+    "film_etag",
+]
@@ -0,0 +1,11 @@
+"""
+Cache and surrogate keys for catalog data.
+"""
+
+# Any response listing films (listings, searches)
+FILMS_LIST = "films:list"
+
+
+def film_key(film_id: int) -> str:
+    """Key for content derived from a single film."""
+    return f"film:{film_id}"
@@ -0,0 +1,202 @@
+"""
+The ``film_catalog`` materialized view and its debounced refresher.
+"""
+
+import time
+from typing import Any, Dict, Optional, Sequence
+
+import anyio
+from sqlalchemy import Column, Integer, MetaData, Table, Text, select, text
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.sql import visitors
+
+from core.config import settings
+from core.db import get_engine_and_session_factory
+from core.logging import get_logger
+from core.metrics import register_metrics
+from core.response_cache import response_cache
+from domain.caches import facet_cache
+from domain.catalog.cache_keys import FILMS_LIST
+from domain.catalog.versions import catalog_versions
+from domain.entities.film import Film
+from domain.utils.fieldsets import FILM_FIELDS
+
+logger = get_logger(__name__)
+
+_film_table = Film.__table__
+
+# Not part of the entity metadata: the view is created by migration, never by
+# create_all or autogenerate
+film_catalog = Table(
+    "film_catalog",
+    MetaData(),
+    *(
+        Column(name, Text if name == "language_name" else _film_table.c[name].type)
+        for name in FILM_FIELDS
+    ),
+    Column("fulltext", _film_table.c.fulltext.type),
+    Column("category_ids", ARRAY(Integer)),
+)
+
+
+def catalog_select(fields: Sequence[str], *extra_columns):
+    """SELECT of FilmResponse columns from the view; language_name needs no join."""
+    return select(*(film_catalog.c[name] for name in fields), *extra_columns)
+
+
+def catalog_query(statement):
+    """
+    Rewrite a statement over ``film`` to read ``film_catalog`` instead.
+
+    The view has a column of the same name and type for every film column a
+    listing uses, so filter conditions, ordering and ``select_from(Film)``
+    are built once against the entity and retargeted here.
+    """
+    def replace(element):
+        # select_from(Film) carries the table with ORM annotations
+        if isinstance(element, Table) and element._deannotate() is _film_table:
+            return film_catalog
+        if isinstance(element, Column) and element.table is _film_table:
+            return film_catalog.c[element.key]
+        return None
+
+    return visitors.replacement_traverse(statement, {}, replace)
+
+
+class CatalogViewRefresher:
+    """
+    Debounced ``REFRESH MATERIALIZED VIEW CONCURRENTLY film_catalog``.
+
+    Writes call ``request()``; the refresh runs once
+    ``settings.catalog_view_refresh_debounce_seconds`` have passed without a
+    new request (but no later than ``catalog_view_refresh_max_delay_seconds``
+    after the first), so a burst of writes costs one refresh. Requests made
+    while a refresh runs schedule another one. After each refresh the cached
+    listings, facets and listing ETags are retired, since they may have been
+    computed from the old view contents.
+
+    Refreshes are made by ``run()``, which ``catalog_lifespan`` starts in a
+    task group for the life of the app; without it (e.g. in the import CLI)
+    requests are only recorded.
+
+    Lag is the time from the oldest write not yet visible in the view to now
+    (``lag_seconds``), or to the refresh that made it visible
+    (``last_lag_seconds``).
+    """
+
+    def __init__(self, view: str = "film_catalog"):
+        self.view = view
+        self._pending_since: Optional[float] = None
+        self._last_request: float = 0.0
+        self._refreshing_since: Optional[float] = None
+        self._wakeup: Optional[anyio.Event] = None
+        self._cancel_scope: Optional[anyio.CancelScope] = None
+        self.refreshes = 0
+        self.failures = 0
+        self.last_duration_ms = 0.0
+        self.last_lag_seconds = 0.0
+        self.max_lag_seconds = 0.0
+
+    @property
+    def enabled(self) -> bool:
+        return settings.film_read_mode == "view"
+
+    def request(self) -> None:
+        """Note that the view's source tables changed and schedule a refresh."""
+        if not self.enabled:
+            return
+
+        now = time.monotonic()
+        self._last_request = now
+        if self._pending_since is None:
+            self._pending_since = now
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    async def run(self, *, task_status=anyio.TASK_STATUS_IGNORED) -> None:
+        """Make the requested refreshes until ``stop()``; start with ``task_group.start(refresher.run)``."""
+        with anyio.CancelScope() as cancel_scope:
+            self._cancel_scope = cancel_scope
+            task_status.started()
+            try:
+                while True:
+                    self._wakeup = anyio.Event()
+                    if self._pending_since is None:
+                        await self._wakeup.wait()
+                    await self._refresh_pending()
+            finally:
+                self._wakeup = None
+                self._cancel_scope = None
+
+    async def _refresh_pending(self) -> None:
+        while self._pending_since is not None:
+            await self._debounce()
+            started_for = self._pending_since
+            # Requests from here on need a refresh that starts after them
+            self._pending_since = None
+            self._refreshing_since = started_for
+            try:
+                await self.refresh()
+            except Exception as e:
+                self.failures += 1
+                self._pending_since = started_for
+                logger.error("Catalog view refresh failed", view=self.view, error=str(e))
+                await anyio.sleep(settings.catalog_view_refresh_debounce_seconds)
+                continue
+            finally:
+                self._refreshing_since = None
+
+            self.last_lag_seconds = time.monotonic() - started_for
+            self.max_lag_seconds = max(self.max_lag_seconds, self.last_lag_seconds)
+
+    async def _debounce(self) -> None:
+        deadline = self._pending_since + settings.catalog_view_refresh_max_delay_seconds
+        while True:
+            now = time.monotonic()
+            quiet_at = self._last_request + settings.catalog_view_refresh_debounce_seconds
+            wake_at = min(quiet_at, deadline)
+            if now >= wake_at:
+                return
+            await anyio.sleep(wake_at - now)
+
+    async def refresh(self) -> None:
+        """Refresh the view now, without blocking readers, and retire what was derived from it."""
+        start_time = time.time()
+        engine, _ = get_engine_and_session_factory("film")
+
+        async with engine.connect() as connection:
+            await connection.execute(text(f"REFRESH MATERIALIZED VIEW CONCURRENTLY {self.view}"))
+            await connection.commit()
+
+        await response_cache.purge(FILMS_LIST)
+        await facet_cache.invalidate()
+        await catalog_versions.films_changed()
+
+        self.refreshes += 1
+        self.last_duration_ms = round((time.time() - start_time) * 1000, 2)
+        logger.info("Catalog view refreshed", view=self.view, duration_ms=self.last_duration_ms)
+
+    async def stop(self) -> None:
+        """Stop ``run()``, cancelling a scheduled refresh (on shutdown)."""
+        if self._cancel_scope is not None:
+            self._cancel_scope.cancel()
+
+    def lag_seconds(self) -> float:
+        """Seconds since the oldest write the view does not reflect yet (0 if up to date)."""
+        waiting = [since for since in (self._pending_since, self._refreshing_since) if since is not None]
+        return time.monotonic() - min(waiting) if waiting else 0.0
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "pending": self._pending_since is not None or self._refreshing_since is not None,
+            "lag_seconds": round(self.lag_seconds(), 3),
+            "last_lag_seconds": round(self.last_lag_seconds, 3),
+            "max_lag_seconds": round(self.max_lag_seconds, 3),
+            "refreshes": self.refreshes,
+            "failures": self.failures,
+            "last_duration_ms": self.last_duration_ms,
+        }
+
+
+catalog_view_refresher = CatalogViewRefresher()
+register_metrics("catalog_view", catalog_view_refresher.stats)
@@ -0,0 +1,178 @@
+"""
+In-process category table and category -> film_id index.
+"""
+
+import asyncio
+import time
+from array import array
+from bisect import bisect_right
+from typing import Dict, List, Optional
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.config import settings
+from core.logging import get_logger
+from core.response_cache import response_cache
+from domain.caches import category_cache
+from domain.catalog.versions import catalog_versions
+from domain.entities.film import Category, FilmCategory
+
+logger = get_logger(__name__)
+
+
+class CategoryIndex:
+    """
+    Cached copy of the ``category`` table plus, for every category, the sorted
+    IDs of its films built from ``film_category``.
+    
+    Category filters resolve a name or ID here once and then fetch films by
+    primary key, instead of joining ``film_category`` and ``category`` with a
+    ``LIKE`` on every request. The index reloads itself after
+    ``settings.category_index_ttl_seconds`` or after ``invalidate()``; the
+    table snapshot is shared between workers through ``category_cache``.
+    
+    The API never writes ``film_category``, so links changed directly in
+    the database reach the index within that TTL, or on every worker as
+    soon as ``invalidate()`` bumps ``category_cache``'s shared version (the
+    admin reference data hook does). Deleted films are dropped at once by
+    the worker that deleted them and within the TTL by others.
+    """
+    
+    def __init__(self, ttl_seconds: Optional[float] = None):
+        self._ttl_seconds = ttl_seconds
+        self._names_by_id: Dict[int, str] = {}
+        self._ids_by_name: Dict[str, int] = {}
+        self._film_ids: Dict[int, array] = {}
+        self._loaded_at: Optional[float] = None
+        self._loaded_version: Optional[int] = None
+        self._refresh = False
+        self._lock = asyncio.Lock()
+        self.version = 0
+    
+    @property
+    def ttl_seconds(self) -> float:
+        return self._ttl_seconds if self._ttl_seconds is not None else settings.category_index_ttl_seconds
+    
+    @property
+    def is_loaded(self) -> bool:
+        return self._loaded_at is not None
+    
+    def is_fresh(self) -> bool:
+        """True if the index is loaded and within its TTL."""
+        return self._loaded_at is not None and time.monotonic() - self._loaded_at < self.ttl_seconds
+    
+    async def load(self, db: AsyncSession, refresh: bool = False) -> None:
+        """
+        (Re)build the index from the shared category cache, reading the
+        category and film_category tables when no other worker has.
+        
+        Args:
+            db: Session used to read the tables
+            refresh: Read the tables even if the shared cache has a snapshot
+        """
+        start_time = time.time()
+        
+        version = await category_cache.version.get()
+        snapshot = await category_cache.get_or_load("snapshot", lambda: self._read_snapshot(db), refresh=refresh)
+        
+        names_by_id = {category_id: name for category_id, name in snapshot["categories"]}
+        film_ids: Dict[int, array] = {category_id: array("I") for category_id in names_by_id}
+        for category_id, ids in snapshot["links"]:
+            film_ids[category_id] = array("I", ids)
+        
+        self._names_by_id = names_by_id
+        self._ids_by_name = {name.strip().lower(): category_id for category_id, name in names_by_id.items()}
+        self._film_ids = film_ids
+        self._loaded_at = time.monotonic()
+        self._loaded_version = version
+        self._refresh = False
+        self.version += 1
+        
+        logger.info(
+            "Category index loaded",
+            categories=len(names_by_id),
+            links=sum(len(ids) for ids in film_ids.values()),
+            duration_ms=round((time.time() - start_time) * 1000, 2)
+        )
+    
+    @staticmethod
+    async def _read_snapshot(db: AsyncSession) -> Dict[str, list]:
+        category_result = await db.execute(select(Category.category_id, Category.name))
+        categories = [[category_id, name] for category_id, name in category_result.all()]
+        
+        links: Dict[int, List[int]] = {}
+        link_result = await db.execute(
+            select(FilmCategory.category_id, FilmCategory.film_id)
+            .order_by(FilmCategory.category_id, FilmCategory.film_id)
+        )
+        for category_id, film_id in link_result.all():
+            links.setdefault(category_id, []).append(film_id)
+        
+        return {"categories": categories, "links": list(links.items())}
+    
+    async def ensure_loaded(self, db: AsyncSession) -> None:
+        """Load the index if it was never loaded, has gone stale, or was invalidated."""
+        if self.is_fresh() and await category_cache.version.get() == self._loaded_version:
+            return
+        
+        async with self._lock:
+            if not self.is_fresh() or category_cache.version.value != self._loaded_version:
+                await self.load(db, refresh=self._refresh)
+    
+    async def invalidate(self) -> None:
+        """
+        Make every worker reload the index from the database on next use
+        (e.g. after film_category changes), and retire the responses, ETags
+        and facet counts derived from it.
+        """
+        await category_cache.invalidate()
+        self._loaded_at = None
+        self._refresh = True
+        await response_cache.purge_all()
+        await catalog_versions.catalog_changed()
+    
+    def resolve(self, category: str) -> Optional[int]:
+        """
+        Resolve a category by ID or exact (case-insensitive) name.
+        
+        Args:
+            category: Category ID as a string, or category name
+            
+        Returns:
+            Category ID, or None if no such category exists
+        """
+        value = category.strip()
+        if value.isdigit():
+            category_id = int(value)
+            return category_id if category_id in self._names_by_id else None
+        return self._ids_by_name.get(value.lower())
+    
+    def film_ids(self, category_id: int) -> array:
+        """Sorted IDs of the films in a category."""
+        return self._film_ids.get(category_id, array("I"))
+    
+    def film_ids_after(self, category_id: int, after_film_id: int, limit: int) -> array:
+        """Up to ``limit`` film IDs in a category that follow ``after_film_id``."""
+        ids = self.film_ids(category_id)
+        start = bisect_right(ids, after_film_id)
+        return ids[start:start + limit]
+    
+    def name(self, category_id: int) -> Optional[str]:
+        """Name of a category, or None if unknown."""
+        return self._names_by_id.get(category_id)
+    
+    def category_names(self) -> List[str]:
+        """All category names, sorted."""
+        return sorted(self._names_by_id.values())
+    
+    def remove_film(self, film_id: int) -> None:
+        """Drop a film from every category it belongs to."""
+        for ids in self._film_ids.values():
+            position = bisect_right(ids, film_id)
+            if position and ids[position - 1] == film_id:
+                del ids[position - 1]
+                self.version += 1
+
+
+category_index = CategoryIndex()
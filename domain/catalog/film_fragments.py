@@ -0,0 +1,94 @@
+"""
+Serialised film JSON, cached per film version, for assembling responses.
+"""
+
+from typing import Any, Dict, Iterable, Optional
+
+from pydantic import BaseModel
+
+from core.cache import ByteLRUCache
+from core.config import settings
+from core.metrics import register_metrics
+from core.responses import register_renderer
+from domain.models.responses.film import FilmBatchResponse, FilmListResponse, FilmResponse
+
+_serialize_film = FilmResponse.__pydantic_serializer__.to_json
+
+
+class FilmFragmentCache:
+    """
+    ``FilmResponse`` JSON bytes keyed by ``(film_id, last_update)``.
+
+    Every film write moves ``last_update``, so a fragment never needs
+    invalidating for one: the new version simply gets a new key and the old
+    one ages out of the byte-bounded LRU. The language name comes from the
+    reference data registry instead, which clears the cache when it loads
+    a new version. Entities, rows and view rows all give the trimmed name,
+    so a fragment is the same whichever path cached it first.
+
+    List, batch and search responses are assembled by joining cached
+    fragments, and the NDJSON export writes them directly, so a film is
+    serialised once per version rather than once per response.
+    """
+
+    def __init__(self, max_bytes: Optional[int] = None):
+        self._lru: ByteLRUCache[bytes] = ByteLRUCache(
+            settings.film_fragment_cache_max_bytes if max_bytes is None else max_bytes
+        )
+
+    def fragment(self, film: FilmResponse) -> bytes:
+        """The JSON of a film response, serialised on the first request for its version."""
+        key = (film.film_id, film.last_update)
+        data = self._lru.get(key)
+        if data is None:
+            data = _serialize_film(film)
+            self._lru.set(key, data, len(data))
+        return data
+
+    def row_fragment(self, row: Any) -> bytes:
+        """
+        The JSON of a read-only film row (the FilmResponse columns).
+
+        The row is validated into a FilmResponse only when its version is
+        not cached yet.
+        """
+        key = (row.film_id, row.last_update)
+        data = self._lru.get(key)
+        if data is None:
+            data = _serialize_film(FilmResponse.model_validate(row))
+            self._lru.set(key, data, len(data))
+        return data
+
+    def json_array(self, films: Iterable[FilmResponse]) -> bytes:
+        """A JSON array of film responses, joined from their fragments."""
+        fragment = self.fragment
+        return b"[" + b",".join([fragment(film) for film in films]) + b"]"
+
+    def render_with_films(self, content: BaseModel) -> bytes:
+        """
+        Render a response whose first field is ``films``.
+
+        The other fields are serialised as usual and the films array is
+        joined from fragments, giving the same bytes as the model's own
+        serializer.
+        """
+        rest = content.__pydantic_serializer__.to_json(content, exclude={"films"})
+        films = self.json_array(content.films)
+        return b'{"films":' + films + (b"," + rest[1:] if len(rest) > 2 else b"}")
+
+    def clear(self) -> None:
+        self._lru.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        return self._lru.stats()
+
+
+film_fragments = FilmFragmentCache()
+register_metrics("film_fragments", film_fragments.stats)
+
+register_renderer(FilmResponse, film_fragments.fragment)
+for _model in (FilmListResponse, FilmBatchResponse):
+    # render_with_films splices the array in front of the other fields
+    if next(iter(_model.model_fields)) != "films":
+        raise TypeError(f"{_model.__name__} must declare films as its first field")
+    register_renderer(_model, film_fragments.render_with_films)
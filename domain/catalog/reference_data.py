@@ -0,0 +1,153 @@
+"""
+In-process copy of the small reference tables: language, category and store.
+"""
+
+import asyncio
+import time
+from typing import Dict, List, Optional
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.config import settings
+from core.logging import get_logger
+from core.metrics import register_metrics
+from core.response_cache import response_cache
+from domain.caches import reference_cache
+from domain.catalog.film_fragments import film_fragments
+from domain.catalog.versions import catalog_versions
+from domain.entities.business import Store
+from domain.entities.film import Category, Language
+
+logger = get_logger(__name__)
+
+
+class ReferenceDataRegistry:
+    """
+    Cached copy of the ``language``, ``category`` and ``store`` tables.
+    
+    These tables are tiny and almost never change, so film reads take the
+    language name from here instead of loading the ``language`` relationship
+    on every request. The registry is loaded at startup, reloads after
+    ``settings.reference_data_ttl_seconds``, and reloads as soon as it sees
+    that ``reference_cache``'s shared version has moved, which is what
+    ``invalidate()`` does for every worker.
+    """
+    
+    def __init__(self, ttl_seconds: Optional[float] = None):
+        self._ttl_seconds = ttl_seconds
+        self._languages: Dict[int, str] = {}
+        self._categories: Dict[int, str] = {}
+        self._stores: Dict[int, Dict[str, int]] = {}
+        self._loaded_at: Optional[float] = None
+        self._loaded_version: Optional[int] = None
+        self._lock = asyncio.Lock()
+        self.loads = 0
+    
+    @property
+    def ttl_seconds(self) -> float:
+        return self._ttl_seconds if self._ttl_seconds is not None else settings.reference_data_ttl_seconds
+    
+    @property
+    def is_loaded(self) -> bool:
+        return self._loaded_at is not None
+    
+    def is_fresh(self) -> bool:
+        """True if the registry is loaded and within its TTL."""
+        return self._loaded_at is not None and time.monotonic() - self._loaded_at < self.ttl_seconds
+    
+    async def load(self, db: AsyncSession) -> None:
+        """
+        (Re)load the registry from the shared reference cache, reading the
+        tables when no other worker has.
+        
+        Args:
+            db: Session used to read the tables
+        """
+        start_time = time.time()
+        
+        version = await reference_cache.version.get()
+        snapshot = await reference_cache.get_or_load("snapshot", lambda: self._read_snapshot(db))
+        
+        self._languages = {language_id: name for language_id, name in snapshot["languages"]}
+        self._categories = {category_id: name for category_id, name in snapshot["categories"]}
+        self._stores = {
+            store_id: {"manager_staff_id": manager_staff_id, "address_id": address_id}
+            for store_id, manager_staff_id, address_id in snapshot["stores"]
+        }
+        self._loaded_at = time.monotonic()
+        if version != self._loaded_version:
+            # Cached film JSON carries language names from the previous version
+            film_fragments.clear()
+        self._loaded_version = version
+        self.loads += 1
+        
+        logger.info(
+            "Reference data loaded",
+            languages=len(self._languages),
+            categories=len(self._categories),
+            stores=len(self._stores),
+            version=version,
+            duration_ms=round((time.time() - start_time) * 1000, 2)
+        )
+    
+    @staticmethod
+    async def _read_snapshot(db: AsyncSession) -> Dict[str, list]:
+        languages = await db.execute(select(Language.language_id, Language.name))
+        categories = await db.execute(select(Category.category_id, Category.name))
+        stores = await db.execute(select(Store.store_id, Store.manager_staff_id, Store.address_id))
+        
+        return {
+            # language.name is CHAR(20); strip the padding once here
+            "languages": [[language_id, name.strip()] for language_id, name in languages.all()],
+            "categories": [[category_id, name] for category_id, name in categories.all()],
+            "stores": [list(row) for row in stores.all()],
+        }
+    
+    async def ensure_loaded(self, db: AsyncSession) -> None:
+        """Load the registry if it was never loaded, has gone stale, or was invalidated."""
+        if self.is_fresh() and await reference_cache.version.get() == self._loaded_version:
+            return
+        
+        async with self._lock:
+            if not self.is_fresh() or reference_cache.version.value != self._loaded_version:
+                await self.load(db)
+    
+    async def invalidate(self) -> None:
+        """
+        Make every worker reload the registry on next use (e.g. after editing
+        a language), and retire the responses and ETags that carry its names.
+        """
+        await reference_cache.invalidate()
+        self._loaded_at = None
+        await response_cache.purge_all()
+        await catalog_versions.catalog_changed()
+    
+    def language_name(self, language_id: Optional[int]) -> Optional[str]:
+        """Name of a language, or None if unknown."""
+        return self._languages.get(language_id)
+    
+    def category_name(self, category_id: int) -> Optional[str]:
+        """Name of a category, or None if unknown."""
+        return self._categories.get(category_id)
+    
+    def category_names(self) -> List[str]:
+        """All category names, sorted."""
+        return sorted(self._categories.values())
+    
+    def store(self, store_id: int) -> Optional[Dict[str, int]]:
+        """A store's manager_staff_id and address_id, or None if unknown."""
+        return self._stores.get(store_id)
+    
+    def stats(self) -> Dict[str, int]:
+        return {
+            "languages": len(self._languages),
+            "categories": len(self._categories),
+            "stores": len(self._stores),
+            "loads": self.loads,
+            "version": self._loaded_version or 0,
+        }
+
+
+reference_data = ReferenceDataRegistry()
+register_metrics("reference_data", reference_data.stats)
@@ -0,0 +1,368 @@
+"""
+In-process BM25 inverted index over film titles, descriptions, actors and categories.
+"""
+
+import asyncio
+import heapq
+import math
+import re
+import time
+from array import array
+from bisect import bisect_left
+from collections import Counter
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.cache import SharedVersion
+from core.config import settings
+from core.db import get_engine_and_session_factory
+from core.logging import get_logger
+from domain.entities.film import Actor, Category, Film, FilmActor, FilmCategory
+
+logger = get_logger(__name__)
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+STOPWORDS = frozenset({"a", "an", "and", "in", "of", "on", "or", "the", "to", "who", "with"})
+
+# Term frequency multipliers per field (a crude BM25F)
+FIELD_WEIGHTS = {"title": 3, "actors": 2, "categories": 2, "description": 1}
+
+MAX_PREFIX_EXPANSIONS = 32
+MAX_TERM_FREQUENCY = 0xFFFF
+
+
+def tokenize(text: Optional[str]) -> List[str]:
+    """Lowercase a string and split it into index terms."""
+    if not text:
+        return []
+    return [token for token in TOKEN_PATTERN.findall(text.lower()) if token not in STOPWORDS]
+
+
+class _Postings:
+    """Posting list for one term: parallel arrays of document numbers and term frequencies."""
+
+    __slots__ = ("docs", "freqs")
+
+    def __init__(self):
+        self.docs = array("I")
+        self.freqs = array("H")
+
+
+class FilmSearchIndex:
+    """
+    BM25 inverted index answering search-as-you-type queries without a
+    database round trip.
+
+    Each indexed film gets an internal, ever-increasing document number, so
+    posting lists stay sorted under appends. Updating a film tombstones its
+    old document and appends a new one; tombstones are skipped while scoring
+    and physically removed once they make up a quarter of the documents.
+
+    Every worker keeps its own index and applies its own writes at once.
+    Writers then call ``changed()``, which bumps a version shared through
+    the cache backend; ``ensure_fresh()`` rebuilds the index when another
+    worker has moved that version, or after
+    ``settings.search_index_ttl_seconds`` for changes made outside the API.
+    """
+
+    # Kept across (re)loads, which replace everything else
+    _PERSISTENT_STATE = frozenset({"k1", "b", "_ttl_seconds", "version", "_lock"})
+
+    def __init__(
+        self,
+        k1: float = 1.2,
+        b: float = 0.75,
+        ttl_seconds: Optional[float] = None,
+        version: Optional[SharedVersion] = None
+    ):
+        self.k1 = k1
+        self.b = b
+        self._ttl_seconds = ttl_seconds
+        self.version = version or SharedVersion("search-index:version")
+        self._lock = asyncio.Lock()
+        self._reset()
+
+    def _reset(self) -> None:
+        self._postings: Dict[str, _Postings] = {}
+        self._doc_film_ids = array("I")
+        self._doc_lengths = array("I")
+        self._live = bytearray()
+        self._docno_by_film: Dict[int, int] = {}
+        # Actor and category text is kept so title/description updates can
+        # re-index a film without re-reading its relationships
+        self._related_text: Dict[int, Tuple[str, str]] = {}
+        self._live_length = 0
+        self._vocabulary: Optional[List[str]] = None
+        # Per-document BM25 length normalisation, rebuilt lazily after changes
+        self._norms: Optional[array] = None
+        self._loaded = False
+        self._loaded_at: Optional[float] = None
+        self._loaded_version: Optional[int] = None
+
+    @property
+    def ttl_seconds(self) -> float:
+        return self._ttl_seconds if self._ttl_seconds is not None else settings.search_index_ttl_seconds
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._loaded
+
+    def is_fresh(self) -> bool:
+        """True if the index is loaded and within its TTL."""
+        return self._loaded_at is not None and time.monotonic() - self._loaded_at < self.ttl_seconds
+
+    def __len__(self) -> int:
+        return len(self._docno_by_film)
+
+    async def load(self, db: AsyncSession) -> None:
+        """
+        (Re)build the index from the film, actor and category tables.
+
+        Args:
+            db: Session used to read the tables
+        """
+        start_time = time.time()
+
+        actors = (
+            select(func.string_agg(Actor.first_name + " " + Actor.last_name, " "))
+            .join(FilmActor, FilmActor.actor_id == Actor.actor_id)
+            .where(FilmActor.film_id == Film.film_id)
+            .scalar_subquery()
+        )
+        categories = (
+            select(func.string_agg(Category.name, " "))
+            .join(FilmCategory, FilmCategory.category_id == Category.category_id)
+            .where(FilmCategory.film_id == Film.film_id)
+            .scalar_subquery()
+        )
+        query = (
+            select(Film.film_id, Film.title, Film.description, actors, categories)
+            .order_by(Film.film_id)
+            .execution_options(yield_per=2000)
+        )
+
+        version = await self.version.get()
+        fresh = FilmSearchIndex(self.k1, self.b)
+        result = await db.stream(query)
+        async for film_id, title, description, actor_names, category_names in result:
+            fresh._add(film_id, title, description, actor_names or "", category_names or "")
+        fresh._loaded = True
+        fresh._loaded_at = time.monotonic()
+        fresh._loaded_version = version
+
+        # Swap in the new state in one step so readers never see a partial index
+        self.__dict__.update(
+            (name, value) for name, value in fresh.__dict__.items() if name not in self._PERSISTENT_STATE
+        )
+
+        logger.info(
+            "Film search index loaded",
+            documents=len(self),
+            terms=len(self._postings),
+            duration_ms=round((time.time() - start_time) * 1000, 2)
+        )
+
+    async def ensure_fresh(self) -> None:
+        """
+        Rebuild a loaded index that has gone stale or that another worker
+        has changed. An index that was never loaded stays unloaded (search
+        falls back to full-text search).
+        """
+        if not self._loaded:
+            return
+        if self.is_fresh() and await self.version.get() == self._loaded_version:
+            return
+
+        async with self._lock:
+            if not self.is_fresh() or self.version.value != self._loaded_version:
+                _, session_factory = get_engine_and_session_factory("film")
+                async with session_factory() as session:
+                    await self.load(session)
+
+    async def changed(self) -> None:
+        """
+        Tell the other workers to rebuild their index after this worker
+        applied a change with ``upsert()`` or ``remove()``.
+        """
+        if not self._loaded:
+            return
+
+        loaded_version = self._loaded_version
+        version = await self.version.bump()
+        # Only this worker's own bump: skipping the reload must not hide another worker's change
+        if loaded_version is not None and version == loaded_version + 1:
+            self._loaded_version = version
+
+    def upsert(
+        self,
+        film_id: int,
+        title: str,
+        description: Optional[str],
+        actors: Optional[str] = None,
+        categories: Optional[str] = None
+    ) -> None:
+        """
+        Index a new film or re-index a changed one.
+
+        Args:
+            film_id: Film ID
+            title: Film title
+            description: Film description
+            actors: Actor names; None keeps the previously indexed names
+            categories: Category names; None keeps the previously indexed names
+        """
+        if not self._loaded:
+            # The full load will pick the film up
+            return
+
+        previous_actors, previous_categories = self._related_text.get(film_id, ("", ""))
+        self.remove(film_id)
+        self._add(
+            film_id,
+            title,
+            description,
+            previous_actors if actors is None else actors,
+            previous_categories if categories is None else categories,
+        )
+
+    def remove(self, film_id: int) -> None:
+        """Remove a film from the index."""
+        docno = self._docno_by_film.pop(film_id, None)
+        if docno is None:
+            return
+
+        self._related_text.pop(film_id, None)
+        self._live[docno] = 0
+        self._live_length -= self._doc_lengths[docno]
+        self._norms = None
+
+        if len(self._live) - len(self._docno_by_film) > len(self._live) // 4:
+            self._compact()
+
+    def _add(self, film_id: int, title: str, description: Optional[str], actors: str, categories: str) -> None:
+        frequencies: Counter = Counter()
+        fields = {"title": title, "description": description, "actors": actors, "categories": categories}
+        for field, text in fields.items():
+            weight = FIELD_WEIGHTS[field]
+            for token in tokenize(text):
+                frequencies[token] += weight
+
+        docno = len(self._doc_film_ids)
+        length = sum(frequencies.values())
+        self._doc_film_ids.append(film_id)
+        self._doc_lengths.append(length)
+        self._live.append(1)
+        self._docno_by_film[film_id] = docno
+        self._related_text[film_id] = (actors, categories)
+        self._live_length += length
+        self._norms = None
+
+        for term, frequency in frequencies.items():
+            postings = self._postings.get(term)
+            if postings is None:
+                postings = self._postings[term] = _Postings()
+                self._vocabulary = None
+            postings.docs.append(docno)
+            postings.freqs.append(min(frequency, MAX_TERM_FREQUENCY))
+
+    def _compact(self) -> None:
+        """Drop tombstoned documents and renumber the survivors."""
+        remap = array("i", [-1]) * len(self._live)
+        doc_film_ids = array("I")
+        doc_lengths = array("I")
+        for docno, alive in enumerate(self._live):
+            if alive:
+                remap[docno] = len(doc_film_ids)
+                doc_film_ids.append(self._doc_film_ids[docno])
+                doc_lengths.append(self._doc_lengths[docno])
+
+        postings_by_term: Dict[str, _Postings] = {}
+        for term, postings in self._postings.items():
+            compacted = _Postings()
+            for docno, frequency in zip(postings.docs, postings.freqs):
+                new_docno = remap[docno]
+                if new_docno >= 0:
+                    compacted.docs.append(new_docno)
+                    compacted.freqs.append(frequency)
+            if compacted.docs:
+                postings_by_term[term] = compacted
+
+        self._postings = postings_by_term
+        self._doc_film_ids = doc_film_ids
+        self._doc_lengths = doc_lengths
+        self._live = bytearray(b"\x01") * len(doc_film_ids)
+        self._docno_by_film = {film_id: docno for docno, film_id in enumerate(doc_film_ids)}
+        self._vocabulary = None
+        self._norms = None
+
+    def _document_norms(self) -> array:
+        if self._norms is None:
+            average_length = self._live_length / max(len(self._docno_by_film), 1) or 1.0
+            k1, b = self.k1, self.b
+            self._norms = array("d", (k1 * (1 - b + b * length / average_length) for length in self._doc_lengths))
+        return self._norms
+
+    def _expand_prefix(self, prefix: str) -> List[str]:
+        if self._vocabulary is None:
+            self._vocabulary = sorted(self._postings)
+
+        vocabulary = self._vocabulary
+        start = bisect_left(vocabulary, prefix)
+        expansions = []
+        for term in vocabulary[start:start + MAX_PREFIX_EXPANSIONS]:
+            if not term.startswith(prefix):
+                break
+            expansions.append(term)
+        return expansions
+
+    def search(self, query: str, limit: int = 10, prefix: bool = True) -> Tuple[List[Tuple[int, float]], int]:
+        """
+        Score films against a query with BM25.
+
+        Args:
+            query: Free-text query
+            limit: Number of top results to return
+            prefix: Treat the last query term as a prefix (search-as-you-type)
+                unless the query ends with whitespace
+
+        Returns:
+            Tuple of ([(film_id, score), ...] best first, number of matching films)
+        """
+        terms = tokenize(query)
+        if not terms or not self._docno_by_film:
+            return [], 0
+
+        query_terms = set(terms)
+        if prefix and not query[-1:].isspace():
+            last = terms[-1]
+            expansions = self._expand_prefix(last)
+            if expansions:
+                if terms.count(last) == 1:
+                    query_terms.discard(last)
+                query_terms.update(expansions)
+
+        document_count = len(self._docno_by_film)
+        k1_plus_one = self.k1 + 1
+        live = self._live
+        norms = self._document_norms()
+        scores: Dict[int, float] = {}
+
+        for term in query_terms:
+            postings = self._postings.get(term)
+            if postings is None:
+                continue
+
+            # Tombstones are counted until compaction; the drift is bounded
+            document_frequency = len(postings.docs)
+            weight = k1_plus_one * math.log(1 + (document_count - document_frequency + 0.5) / (document_frequency + 0.5))
+            for docno, frequency in zip(postings.docs, postings.freqs):
+                if live[docno]:
+                    scores[docno] = scores.get(docno, 0.0) + weight * frequency / (frequency + norms[docno])
+
+        top = heapq.nlargest(limit, scores.items(), key=lambda item: item[1])
+        return [(self._doc_film_ids[docno], score) for docno, score in top], len(scores)
+
+
+film_search_index = FilmSearchIndex()
@@ -0,0 +1,145 @@
+"""
+Entity tags for film resources, answerable without a database round trip.
+"""
+
+import secrets
+import time
+import zlib
+from collections import OrderedDict
+from datetime import datetime
+from typing import Optional, Tuple
+
+from core.cache import SharedVersion, TieredCache
+from core.config import settings
+from core.metrics import register_metrics
+from domain.caches import film_cache
+
+
+def film_etag(film_id: int, last_update: datetime, catalog_version: str = "0") -> str:
+    """Strong entity tag for one film, derived from its ID, last_update and the catalog version."""
+    return f'"film-{film_id}-{int(last_update.timestamp() * 1_000_000):x}-{catalog_version}"'
+
+
+class CatalogVersions:
+    """
+    Map of film_id -> current ETag, plus a catalog version for listings.
+    
+    Film tags are remembered as films are served, so a conditional GET for a
+    film seen before is answered from memory. A tag is forgotten whenever
+    the shared film cache drops that film (any worker updating or deleting
+    it), and the whole map whenever the film cache is invalidated, so it can
+    never vouch for a stale film for longer than
+    ``settings.cache_version_check_seconds``. Writes made outside the API
+    (straight to the database) bypass all of that, so every tag is also
+    forgotten ``ttl_seconds`` after it was remembered, like the film cache
+    entries themselves.
+    
+    Film responses also carry data their film row does not version (the
+    language name from the reference data), so film tags include a shared
+    catalog version that ``catalog_changed()`` bumps when reference data or
+    categories are invalidated; that also retires every listing tag.
+    
+    Listing tags combine the shared listing version with a hash of the
+    query. Without a shared backend the counters restart with the process,
+    so a per-process epoch keeps old tags from matching.
+    """
+    
+    def __init__(
+        self,
+        films: TieredCache,
+        list_version: SharedVersion,
+        catalog_version: SharedVersion,
+        max_films: int = 100_000,
+        ttl_seconds: Optional[float] = None
+    ):
+        self.films = films
+        self.list_version = list_version
+        self.catalog_version = catalog_version
+        self.max_films = max_films
+        self.ttl_seconds = ttl_seconds if ttl_seconds is not None else settings.cache_ttl_seconds
+        # film_id -> (ETag, monotonic expiry)
+        self._etags: "OrderedDict[int, Tuple[str, float]]" = OrderedDict()
+        self._synced_catalog_version = catalog_version.value
+        self._epoch = secrets.token_hex(4)
+        # Bumped whenever tags are dropped; tags computed across a drop are not remembered
+        self.generation = 0
+        self.not_modified = 0
+        films.add_listener(self._films_dropped)
+    
+    async def film_etag(self, film_id: int) -> Optional[str]:
+        """The remembered ETag of a film, or None if unknown."""
+        await self.films.sync()
+        version = await self.catalog_version.get()
+        if version != self._synced_catalog_version:
+            self._synced_catalog_version = version
+            self._films_dropped(None)
+        
+        entry = self._etags.get(film_id)
+        if entry is None:
+            return None
+        etag, expires_at = entry
+        if time.monotonic() >= expires_at:
+            del self._etags[film_id]
+            return None
+        return etag
+    
+    def film_tag(self, film_id: int, last_update: datetime) -> str:
+        """The ETag of a film as served now (call ``film_etag`` first to sync the versions)."""
+        return film_etag(film_id, last_update, f"{self._epoch_prefix(self.catalog_version)}{self._synced_catalog_version}")
+    
+    def remember_film(self, film_id: int, etag: str, generation: int) -> None:
+        """
+        Remember the ETag of a film served while the map was at ``generation``.
+        """
+        if generation != self.generation:
+            return
+        
+        self._etags[film_id] = (etag, time.monotonic() + self.ttl_seconds)
+        self._etags.move_to_end(film_id)
+        if len(self._etags) > self.max_films:
+            self._etags.popitem(last=False)
+    
+    async def list_etag(self, query_key: str) -> str:
+        """Strong entity tag for a film listing identified by its normalised query."""
+        version = await self.list_version.get()
+        return f'"films-{self._epoch_prefix(self.list_version)}{version}-{zlib.crc32(query_key.encode()):08x}"'
+    
+    async def films_changed(self) -> None:
+        """Record a film write: retire every listing tag and re-check film tags."""
+        await self.list_version.bump()
+        await self.films.sync()
+    
+    async def catalog_changed(self) -> None:
+        """
+        Record a change to reference data or categories: retire every film and listing tag.
+        """
+        self._synced_catalog_version = await self.catalog_version.bump()
+        self._films_dropped(None)
+        await self.list_version.bump()
+    
+    def _epoch_prefix(self, version: SharedVersion) -> str:
+        return "" if version.backend is not None else f"{self._epoch}."
+    
+    def _films_dropped(self, key: Optional[str]) -> None:
+        """Film cache listener: forget the tag of a dropped film, or every tag."""
+        if key is None:
+            self._etags.clear()
+        else:
+            self._etags.pop(int(key), None)
+        self.generation += 1
+    
+    def stats(self) -> dict:
+        return {
+            "film_etags": len(self._etags),
+            "list_version": self.list_version.value,
+            "catalog_version": self._synced_catalog_version,
+            "not_modified": self.not_modified,
+        }
+
+
+catalog_versions = CatalogVersions(
+    films=film_cache,
+    list_version=SharedVersion("films:list:version"),
+    catalog_version=SharedVersion("films:catalog:version"),
+)
+register_metrics("etags", catalog_versions.stats)
@@ -14,6 +14,7 @@ from .location import Country, City, Address
 from .film import Actor, Category, Language, Film, FilmActor, FilmCategory
 from .business import Store, Staff, Customer, Inventory, Rental, Payment
 from .streaming_subscription import StreamingSubscription
+from .film_import import FilmImportJob
 
 # Export all models for convenient imports
 __all__ = [
@@ -39,4 +40,6 @@ __all__ = [
     "Payment",
     # Streaming
     "StreamingSubscription",
+    # Imports
+    "FilmImportJob",
 ] 
\ No newline at end of file
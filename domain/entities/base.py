@@ -33,6 +33,9 @@ def _import_all_models():
     
     # Import streaming subscription models
     from . import streaming_subscription  # noqa: F401
+    
+    # Import film catalog import job model
+    from . import film_import  # noqa: F401
 
 # Call the import function when this module is loaded
 _import_all_models() 
\ No newline at end of file
@@ -89,10 +89,17 @@ class Film(Base, table=True):
     
     # Indexes and constraints - match pagila schema exactly
     __table_args__ = (
-        Index('film_fulltext_idx', 'fulltext'),  # GIST index
+        Index('film_fulltext_idx', 'fulltext', postgresql_using='gin'),
         Index('idx_title', 'title'),
         Index('idx_fk_language_id', 'language_id'),
         Index('idx_fk_original_language_id', 'original_language_id'),
+        # Listing filters (migration 36c38fed7a29)
+        Index('idx_film_rating', 'rating'),
+        Index('idx_film_length', 'length'),
+        Index('idx_film_rental_rate', 'rental_rate'),
+        Index('idx_film_release_year', 'release_year'),
+        Index('idx_film_streaming_available', 'streaming_available'),
+        Index('idx_film_special_features', 'special_features', postgresql_using='gin'),
         CheckConstraint('release_year >= 1901 AND release_year <= 2155', name='film_release_year_check'),
     )
 
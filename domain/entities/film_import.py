@@ -0,0 +1,28 @@
+"""
+Film catalog import job model (checkpoints of resumable file imports).
+"""
+
+from sqlmodel import Field
+from sqlalchemy import Column, INTEGER, TEXT, TIMESTAMP
+from sqlalchemy.sql import func
+from typing import Optional
+from datetime import datetime
+
+from .base import Base
+
+
+class FilmImportJob(Base, table=True):
+    __tablename__ = 'film_import_job'
+    
+    job_id: str = Field(primary_key=True, max_length=64)
+    source: str = Field(sa_column=Column(TEXT, nullable=False))
+    file_format: str = Field(max_length=10, nullable=False)
+    status: str = Field(max_length=20, nullable=False)
+    # Checkpoint: source records (accepted or rejected) covered by committed chunks
+    rows_committed: int = Field(sa_column=Column(INTEGER, server_default=func.text('0'), nullable=False))
+    rows_imported: int = Field(sa_column=Column(INTEGER, server_default=func.text('0'), nullable=False))
+    rows_rejected: int = Field(sa_column=Column(INTEGER, server_default=func.text('0'), nullable=False))
+    chunks_committed: int = Field(sa_column=Column(INTEGER, server_default=func.text('0'), nullable=False))
+    error: Optional[str] = Field(sa_column=Column(TEXT))
+    created_at: Optional[datetime] = Field(sa_column=Column(TIMESTAMP(timezone=True), server_default=func.now(), nullable=False))
+    updated_at: Optional[datetime] = Field(sa_column=Column(TIMESTAMP(timezone=True), server_default=func.now(), nullable=False))
@@ -2,13 +2,17 @@
 Request schemas for API input validation.
 """
 
-from .film import CreateFilmRequest, UpdateFilmRequest, FilmSummaryRequest
+from .film import CreateFilmRequest, UpdateFilmRequest, FilmSummaryRequest, FilmBatchRequest, FilmFilter, FilmBulkItem, FilmBulkRequest
 from .rental import CreateRentalRequest
 
 __all__ = [
     # Film requests
     "CreateFilmRequest",
     "UpdateFilmRequest",
+    "FilmBatchRequest",
+    "FilmFilter",
+    "FilmBulkItem",
+    "FilmBulkRequest",
     # Rental requests
     "CreateRentalRequest",
     "FilmSummaryRequest",
@@ -2,8 +2,10 @@
 Film request schemas.
 """
 
-from typing import Optional, List
-from pydantic import BaseModel, Field, validator
+from typing import Any, Dict, Optional, List
+from pydantic import BaseModel, Field, model_validator, validator
+
+from core.config import settings
 
 
 class CreateFilmRequest(BaseModel):
@@ -30,6 +32,85 @@ class CreateFilmRequest(BaseModel):
                 raise ValueError(f'Rating must be one of: {allowed_ratings}')
         return v
 
+class FilmBatchRequest(BaseModel):
+    """Request schema for fetching several films at once."""
+    
+    film_ids: List[int] = Field(
+        ...,
+        min_length=1,
+        max_length=settings.film_batch_max_ids,
+        description="Film IDs to fetch; results follow this order"
+    )
+
+
+class FilmBulkItem(CreateFilmRequest):
+    """One film of a bulk write: created, or replaced entirely when film_id is given."""
+    
+    film_id: Optional[int] = Field(None, gt=0, description="Existing film to replace; omit to create a film")
+
+
+class FilmBulkRequest(BaseModel):
+    """
+    Request schema for creating or replacing many films at once.
+    
+    Items are validated one by one as FilmBulkItem, so an invalid item is
+    reported in the response instead of rejecting the whole request.
+    """
+    
+    films: List[Dict[str, Any]] = Field(
+        ...,
+        min_length=1,
+        max_length=settings.film_bulk_max_items,
+        description="Films to create (or replace, with film_id)"
+    )
+
+
+class FilmFilter(BaseModel):
+    """
+    Composable film listing filters; a film must match every criterion given.
+    
+    Ranges are inclusive and either bound may be omitted.
+    """
+    
+    ratings: Optional[List[str]] = Field(None, description="MPAA ratings (any of)")
+    language_id: Optional[int] = Field(None, gt=0, description="Language ID")
+    min_length: Optional[int] = Field(None, ge=0, description="Minimum length in minutes")
+    max_length: Optional[int] = Field(None, ge=0, description="Maximum length in minutes")
+    min_rental_rate: Optional[float] = Field(None, ge=0, description="Minimum rental rate")
+    max_rental_rate: Optional[float] = Field(None, ge=0, description="Maximum rental rate")
+    min_release_year: Optional[int] = Field(None, ge=1901, le=2155, description="Earliest release year")
+    max_release_year: Optional[int] = Field(None, ge=1901, le=2155, description="Latest release year")
+    special_features: Optional[List[str]] = Field(None, description="Special features (all of)")
+    streaming_available: Optional[bool] = Field(None, description="Available for streaming")
+    
+    @validator('ratings', each_item=True)
+    def validate_ratings(cls, v):
+        allowed_ratings = ['G', 'PG', 'PG-13', 'R', 'NC-17']
+        if v not in allowed_ratings:
+            raise ValueError(f'Rating must be one of: {allowed_ratings}')
+        return v
+    
+    @model_validator(mode="after")
+    def validate_ranges(self):
+        for name in ("length", "rental_rate", "release_year"):
+            low, high = getattr(self, f"min_{name}"), getattr(self, f"max_{name}")
+            if low is not None and high is not None and low > high:
+                raise ValueError(f"min_{name} must not exceed max_{name}")
+        return self
+    
+    def is_empty(self) -> bool:
+        """True if no criterion is set."""
+        return not self.model_dump(exclude_none=True)
+    
+    def cache_key(self) -> str:
+        """Canonical form of the criteria, for cache keys and ETags."""
+        criteria = self.model_dump(exclude_none=True)
+        return "&".join(
+            f"{name}={','.join(sorted(value)) if isinstance(value, list) else value}"
+            for name, value in sorted(criteria.items())
+        )
+
+
 class FilmSummaryRequest(BaseModel):
     """Request schema for summarizing a film."""
     film_id: int = Field(..., description="Film ID")
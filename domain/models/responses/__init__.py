@@ -6,16 +6,27 @@ Response schemas for API output serialization.
 # from .customer import CustomerResponse, CustomerListResponse  
 # from .streaming import SubscriptionResponse
 
-from .film import FilmResponse, FilmListResponse, FilmCreateResponse, FilmSummaryResponse
+from .film import FilmResponse, FilmListResponse, FilmCreateResponse, FilmSummaryResponse, FilmBatchResponse, FacetCount, FilmFacetsResponse, ActorSummary, CategorySummary, FilmDetailResponse, FilmBulkError, FilmBulkResponse
 from .rental import RentalResponse, RentalCreateResponse
+from .customer import CustomerSnapshot
 
 __all__ = [
     # Film responses
     "FilmResponse",
     "FilmListResponse",
     "FilmCreateResponse",
+    "FilmBatchResponse",
+    "FacetCount",
+    "FilmFacetsResponse",
+    "ActorSummary",
+    "CategorySummary",
+    "FilmDetailResponse",
+    "FilmBulkError",
+    "FilmBulkResponse",
     # Rental responses
     "RentalResponse",
     "RentalCreateResponse",
     "FilmSummaryResponse",
+    # Customer responses
+    "CustomerSnapshot",
 ] 
\ No newline at end of file
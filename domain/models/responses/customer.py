@@ -0,0 +1,19 @@
+"""
+Customer response schemas.
+"""
+
+from typing import Optional
+from pydantic import BaseModel, ConfigDict
+
+
+class CustomerSnapshot(BaseModel):
+    """Identity fields of a customer, as needed by auth and rentals."""
+    
+    model_config = ConfigDict(from_attributes=True)
+    
+    customer_id: int
+    store_id: int
+    first_name: str
+    last_name: str
+    email: Optional[str] = None
+    activebool: bool
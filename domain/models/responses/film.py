@@ -2,7 +2,7 @@
 Film response schemas for API outputs.
 """
 
-from typing import List, Optional, Annotated
+from typing import List, Optional, Annotated, Union
 from datetime import datetime
 from pydantic import BaseModel
 from semantic_kernel.kernel_pydantic import KernelBaseModel
@@ -30,6 +30,25 @@ class FilmResponse(BaseModel):
         from_attributes = True
 
 
+class ActorSummary(BaseModel):
+    """Actor as listed on a film detail."""
+    actor_id: int
+    first_name: str
+    last_name: str
+
+
+class CategorySummary(BaseModel):
+    """Category as listed on a film detail."""
+    category_id: int
+    name: str
+
+
+class FilmDetailResponse(FilmResponse):
+    """Film with its actors and categories."""
+    actors: List[ActorSummary] = []
+    categories: List[CategorySummary] = []
+
+
 class FilmCreateResponse(BaseModel):
     """Response for film creation."""
     film_id: int
@@ -39,9 +58,44 @@ class FilmCreateResponse(BaseModel):
 class FilmListResponse(BaseModel):
     """Paginated film list response."""
     films: List[FilmResponse]
-    total: int
+    # None on keyset (cursor) pages unless include_total was requested
+    total: Optional[int]
     page: int
-    page_size: int 
+    page_size: int
+    next_cursor: Optional[str] = None
+
+class FilmBatchResponse(BaseModel):
+    """Films fetched by ID, in request order."""
+    films: List[FilmResponse]
+    missing_ids: List[int]
+
+class FilmBulkError(BaseModel):
+    """Why one item of a bulk write was not written."""
+    index: int
+    film_id: Optional[int] = None
+    error: str
+
+class FilmBulkResponse(BaseModel):
+    """Outcome of a bulk write; film_ids follows the request order, None where the item failed."""
+    created: int
+    updated: int
+    failed: int
+    film_ids: List[Optional[int]]
+    errors: List[FilmBulkError]
+
+class FacetCount(BaseModel):
+    """Number of films with one value of a facet."""
+    value: Union[bool, int, str, None]
+    name: Optional[str] = None
+    count: int
+
+class FilmFacetsResponse(BaseModel):
+    """Film counts per facet value for the films matching a listing filter."""
+    total: int
+    rating: List[FacetCount]
+    category: List[FacetCount]
+    language: List[FacetCount]
+    streaming_available: List[FacetCount]
 
 class FilmSummaryResponse(KernelBaseModel):
     """Response for film summary."""
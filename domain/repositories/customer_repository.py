@@ -7,7 +7,9 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, or_
 from sqlalchemy.orm import selectinload
 
+from domain.caches import customer_cache
 from domain.entities.business import Customer
+from domain.models.responses.customer import CustomerSnapshot
 from .base_repository import BaseRepository
 
 
@@ -39,6 +41,32 @@ class CustomerRepository(BaseRepository[Customer]):
         result = await self.db.execute(query)
         return result.scalar_one_or_none()
     
+    async def get_customer_snapshot(self, customer_id: int) -> Optional[CustomerSnapshot]:
+        """
+        Get a customer's identity fields, read through the shared customer cache.
+        
+        Args:
+            customer_id: Customer ID
+            
+        Returns:
+            Customer snapshot if found, None otherwise
+        """
+        return await customer_cache.get_or_load(str(customer_id), lambda: self._load_customer_snapshot(customer_id))
+    
+    async def _load_customer_snapshot(self, customer_id: int) -> Optional[CustomerSnapshot]:
+        query = select(
+            Customer.customer_id,
+            Customer.store_id,
+            Customer.first_name,
+            Customer.last_name,
+            Customer.email,
+            Customer.activebool
+        ).where(Customer.customer_id == customer_id)
+        
+        result = await self.db.execute(query)
+        row = result.one_or_none()
+        return CustomerSnapshot.model_validate(row) if row else None
+    
     async def get_customers_by_store(self, store_id: int) -> List[Customer]:
         """
         Get all customers for a specific store.
@@ -142,7 +170,9 @@ class CustomerRepository(BaseRepository[Customer]):
         Returns:
             Updated customer
         """
-        return await self.update(customer)
+        updated = await self.update(customer)
+        await customer_cache.discard(str(customer.customer_id))
+        return updated
     
     async def deactivate_customer(self, customer_id: int) -> Optional[Customer]:
         """
@@ -159,7 +189,7 @@ class CustomerRepository(BaseRepository[Customer]):
             return None
         
         customer.activebool = False
-        return await self.update(customer)
+        return await self.update_customer(customer)
     
     async def activate_customer(self, customer_id: int) -> Optional[Customer]:
         """
@@ -176,4 +206,4 @@ class CustomerRepository(BaseRepository[Customer]):
             return None
         
         customer.activebool = True
-        return await self.update(customer) 
\ No newline at end of file
+        return await self.update_customer(customer) 
\ No newline at end of file
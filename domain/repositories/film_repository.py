@@ -2,129 +2,1000 @@
 Film repository for film-related database operations using SQLModel.
 """
 
-from typing import Optional, List, Tuple
+import time
+from datetime import datetime
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Optional, List, Sequence, Set, Tuple, Union
 from sqlmodel import select, Session, col
 from sqlmodel.ext.asyncio.session import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy import ARRAY, Integer, Text, any_, bindparam, cast, distinct, func, insert, literal_column, true, tuple_, update
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.dialects.postgresql import aggregate_order_by
+from sqlalchemy.engine import Row
 
-from domain.entities.film import Film, Category, FilmCategory
+from domain.entities.film import Actor, Category, Film, FilmActor, FilmCategory, Language
+from domain.models.requests.film import FilmFilter
+from domain.utils.fieldsets import FILM_FIELDS
+from domain.catalog.catalog_view import catalog_query, catalog_select, film_catalog
+from domain.catalog.category_index import category_index
+from domain.catalog.reference_data import reference_data
+from core.config import settings
+from core.logging import log_database_operation
 from .base_repository import BaseRepository
 
 
+# Rendered inline: a bound parameter would be typed as VARCHAR, which has no
+# implicit cast to regconfig
+FULLTEXT_CONFIG = literal_column("'pg_catalog.english'::regconfig")
+
+
+def build_fulltext(title, description):
+    """
+    SQL expression computing Film.fulltext from a title and description.
+    
+    Mirrors pagila's ``tsvector_update_trigger(fulltext, 'pg_catalog.english',
+    title, description)`` so rows written by the API are searchable.
+    """
+    return func.to_tsvector(
+        FULLTEXT_CONFIG,
+        func.concat_ws(" ", title, func.coalesce(description, ""))
+    )
+
+
+def database_error_message(error: DBAPIError) -> str:
+    """The driver's message for a failed statement, without the SQL and parameters."""
+    return str(getattr(error, "orig", None) or error).strip().splitlines()[0]
+
+
+# A film as returned by the listing methods: the entity, a read-only row of
+# every FilmResponse column, or a dict of the requested columns when a sparse
+# fieldset is given
+FilmRow = Union[Film, Row, Dict[str, Any]]
+
+
+def film_select(fields: Optional[Sequence[str]] = None, *extra_columns):
+    """
+    SELECT for films: the entity, or only the requested columns.
+    
+    Entities carry no language; converters take the name from the reference
+    data registry, so the ``language`` table is only joined for column
+    projections that ask for ``language_name``. The name is a CHAR(20),
+    trimmed here as the registry trims it.
+    
+    Args:
+        fields: FilmResponse field names to project, or None for the full entity
+        *extra_columns: Additional columns appended to the select list
+    """
+    if fields is None:
+        return select(Film, *extra_columns)
+    
+    columns = [
+        func.rtrim(Language.name).label("language_name") if name == "language_name" else getattr(Film, name)
+        for name in fields
+    ]
+    query = select(*columns, *extra_columns)
+    if "language_name" in fields:
+        query = query.outerjoin(Language, Language.language_id == Film.language_id)
+    return query
+
+
+def film_rows(result, fields: Optional[Sequence[str]] = None) -> List[FilmRow]:
+    """Films from a result of ``film_select(fields)``."""
+    if fields is None:
+        return list(result.scalars().all())
+    return [row._asdict() for row in result.all()]
+
+
+def _json_object(pairs: Sequence[Tuple[str, Any]]):
+    # Keys are our own field names, rendered inline so the statement has no key parameters
+    return func.json_build_object(*(arg for key, value in pairs for arg in (literal_column(f"'{key}'"), value)))
+
+
+def film_detail_select(film_id: int):
+    """
+    One statement returning a film with its actors and categories as a JSON document.
+    
+    The film columns, actors (``film_actor`` -> ``actor``) and categories
+    (``film_category`` -> ``category``) are assembled with
+    ``json_build_object``/``json_agg`` in correlated subqueries, and the
+    document is returned as text so it can be validated straight into
+    ``FilmDetailResponse``.
+    
+    Args:
+        film_id: Film ID
+    """
+    actors = (
+        select(func.coalesce(
+            func.json_agg(aggregate_order_by(
+                _json_object([
+                    ("actor_id", Actor.actor_id),
+                    ("first_name", Actor.first_name),
+                    ("last_name", Actor.last_name),
+                ]),
+                Actor.last_name, Actor.first_name, Actor.actor_id
+            )),
+            literal_column("'[]'::json")
+        ))
+        .select_from(FilmActor)
+        .join(Actor, Actor.actor_id == FilmActor.actor_id)
+        .where(FilmActor.film_id == Film.film_id)
+        .scalar_subquery()
+    )
+    categories = (
+        select(func.coalesce(
+            func.json_agg(aggregate_order_by(
+                _json_object([("category_id", Category.category_id), ("name", Category.name)]),
+                Category.name
+            )),
+            literal_column("'[]'::json")
+        ))
+        .select_from(FilmCategory)
+        .join(Category, Category.category_id == FilmCategory.category_id)
+        .where(FilmCategory.film_id == Film.film_id)
+        .scalar_subquery()
+    )
+    
+    pairs = [
+        (name, func.rtrim(Language.name) if name == "language_name" else getattr(Film, name))
+        for name in FILM_FIELDS
+    ]
+    document = _json_object([*pairs, ("actors", actors), ("categories", categories)])
+    return (
+        select(cast(document, Text))
+        .select_from(Film)
+        .outerjoin(Language, Language.language_id == Film.language_id)
+        .where(Film.film_id == film_id)
+    )
+
+
+def film_filter_conditions(film_filter: Optional[FilmFilter]) -> List[Any]:
+    """
+    WHERE conditions for a FilmFilter (category excepted).
+    
+    Each criterion is a plain comparison on one film column, so each can be
+    answered from that column's index and several combine with a BitmapAnd:
+    btree indexes for rating, language, length, rental_rate, release_year
+    and streaming_available, GIN for ``special_features @> ...``.
+    
+    Args:
+        film_filter: Criteria, or None
+        
+    Returns:
+        Conditions to AND together (empty for no criteria)
+    """
+    if film_filter is None:
+        return []
+    
+    conditions = []
+    if film_filter.ratings:
+        conditions.append(col(Film.rating).in_(film_filter.ratings))
+    if film_filter.language_id is not None:
+        conditions.append(Film.language_id == film_filter.language_id)
+    if film_filter.min_length is not None:
+        conditions.append(col(Film.length) >= film_filter.min_length)
+    if film_filter.max_length is not None:
+        conditions.append(col(Film.length) <= film_filter.max_length)
+    if film_filter.min_rental_rate is not None:
+        conditions.append(col(Film.rental_rate) >= film_filter.min_rental_rate)
+    if film_filter.max_rental_rate is not None:
+        conditions.append(col(Film.rental_rate) <= film_filter.max_rental_rate)
+    if film_filter.min_release_year is not None:
+        conditions.append(col(Film.release_year) >= film_filter.min_release_year)
+    if film_filter.max_release_year is not None:
+        conditions.append(col(Film.release_year) <= film_filter.max_release_year)
+    if film_filter.special_features:
+        conditions.append(col(Film.special_features).contains(film_filter.special_features))
+    if film_filter.streaming_available is not None:
+        conditions.append(Film.streaming_available == film_filter.streaming_available)
+    return conditions
+
+
+# GROUPING(rating, category_id, language_id, streaming_available) of each
+# grouping set in get_facet_counts: a bit is set for every column the set
+# does not group by
+FACET_GROUPINGS = {
+    0b0111: "rating",
+    0b1011: "category",
+    0b1101: "language",
+    0b1110: "streaming_available",
+    0b1111: "total",
+}
+
+
 class FilmRepository(BaseRepository[Film]):
-    """Repository for Film entity with specialized queries using SQLModel."""
+    """
+    Repository for Film entity with specialized queries using SQLModel.
+    
+    In read-only mode (``settings.film_read_mode == "rows"``) the listing
+    and search methods select the FilmResponse columns with a Core
+    ``select()`` and return the result rows as they are, skipping entity
+    hydration, the identity map and attribute instrumentation.
+    ``get_film_by_id`` always returns the entity, since updates modify it.
     
-    def __init__(self, db: AsyncSession):
+    In view mode (``settings.film_read_mode == "view"``) listings, searches
+    and facets read rows from the ``film_catalog`` materialized view, which
+    already carries the language name and category IDs; queries are built
+    against ``Film`` as usual and retargeted by ``_execute``. The view lags
+    writes by up to one debounced refresh (see ``CatalogViewRefresher``).
+    Single-film reads always use the tables.
+    """
+    
+    def __init__(self, db: AsyncSession, read_only: Optional[bool] = None, use_view: Optional[bool] = None):
         super().__init__(db, Film)
+        self.use_view = settings.film_read_mode == "view" if use_view is None else use_view
+        if read_only is None:
+            read_only = settings.film_read_mode in ("rows", "view")
+        self.read_only = read_only or self.use_view
+    
+    def _select(self, fields: Optional[Sequence[str]] = None, *extra_columns):
+        """film_select() honouring read-only and view mode when no fieldset is given."""
+        if self.use_view:
+            return catalog_select(fields or FILM_FIELDS, *extra_columns)
+        if fields is None and self.read_only:
+            return film_select(FILM_FIELDS, *extra_columns)
+        return film_select(fields, *extra_columns)
+    
+    async def _execute(self, query):
+        """Execute a listing query, against the catalog view in view mode."""
+        return await self.db.execute(catalog_query(query) if self.use_view else query)
+    
+    def _rows(self, result, fields: Optional[Sequence[str]] = None) -> List[FilmRow]:
+        """Films from a result of ``_select(fields)``."""
+        if fields is None and self.read_only:
+            return list(result.all())
+        return film_rows(result, fields)
+    
+    async def _ensure_reference_data(self, fields: Optional[Sequence[str]] = None) -> None:
+        """Load the reference data registry before returning entities, which need it for language_name."""
+        if fields is None and not self.read_only:
+            await reference_data.ensure_loaded(self.db)
     
     async def get_films_paginated(
         self, 
         skip: int = 0, 
         limit: int = 10, 
-        category: Optional[str] = None
-    ) -> Tuple[List[Film], int]:
-        # Build base query with eager loading
-        base_query = select(Film).options(selectinload(Film.language))
-        base_count_query = select(Film)
+        category: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None,
+        film_filter: Optional[FilmFilter] = None
+    ) -> Tuple[List[FilmRow], int]:
+        """
+        Get a page of films together with the total number of matching films.
+        
+        Unfiltered listings compute the total either with a separate
+        ``SELECT count(*)`` or with ``count(*) OVER ()`` on the page query,
+        depending on ``settings.film_count_strategy``. Category-only listings
+        take the page of film IDs and the total from the in-process category
+        index and fetch the films by primary key. With a film filter, every
+        criterion (and the category, as a film_id array) becomes part of the
+        WHERE clause of the same page and count queries.
+        
+        Args:
+            skip: Number of records to skip
+            limit: Maximum number of records to return
+            category: Optional category name or ID to filter by
+            fields: Optional FilmResponse fields to select instead of the entity
+            film_filter: Optional column criteria, combined with the category
+            
+        Returns:
+            Tuple of (films, total_count); films are dicts when fields are given
+        """
+        start_time = time.time()
+        filtered = film_filter is not None and not film_filter.is_empty()
+        await self._ensure_reference_data(fields)
+        
+        if category and not filtered:
+            strategy = "category_index"
+            films, total_count = await self._get_category_page(skip, limit, category, fields)
+        else:
+            conditions = await self._filter_conditions(category, film_filter)
+            if conditions is None:
+                strategy = "filter"
+                films, total_count = [], 0
+            elif settings.film_count_strategy == "window":
+                strategy = "window"
+                films, total_count = await self._get_page_with_window_count(skip, limit, fields, conditions)
+            else:
+                strategy = "count"
+                films, total_count = await self._get_page_with_count_query(skip, limit, fields, conditions)
+        
+        duration = time.time() - start_time
+        log_database_operation(
+            logger=self.logger,
+            operation="SELECT",
+            table=self.model.__tablename__,
+            duration=duration,
+            skip=skip,
+            limit=limit,
+            count=len(films),
+            total_count=total_count,
+            count_strategy=strategy,
+            film_filter=film_filter.cache_key() if filtered else None
+        )
+        
+        return films, total_count
+    
+    async def resolve_category(self, category: str) -> Optional[int]:
+        """
+        Resolve a category name (exact, case-insensitive) or ID via the category index.
         
-        # Add category filter if provided
+        Args:
+            category: Category name or ID
+            
+        Returns:
+            Category ID, or None if no such category exists
+        """
+        await category_index.ensure_loaded(self.db)
+        return category_index.resolve(category)
+    
+    async def _filter_conditions(
+        self, category: Optional[str], film_filter: Optional[FilmFilter]
+    ) -> Optional[List[Any]]:
+        """
+        WHERE conditions for a category plus film filter.
+        
+        Returns:
+            Conditions to AND together, or None if the category does not exist
+        """
+        conditions = film_filter_conditions(film_filter)
         if category:
-            base_query = (
-                base_query
-                .join(FilmCategory)
-                .join(Category)
-                .where(col(Category.name).contains(category))
-            )
+            category_id = await self.resolve_category(category)
+            if category_id is None:
+                return None
+            if self.use_view:
+                conditions.append(film_catalog.c.category_ids.contains([category_id]))
+            else:
+                film_ids = bindparam("category_film_ids", list(category_index.film_ids(category_id)), type_=ARRAY(Integer))
+                conditions.append(col(Film.film_id) == any_(film_ids))
+        return conditions
+    
+    async def count_films(self, category: Optional[str] = None, film_filter: Optional[FilmFilter] = None) -> int:
+        """
+        Count films matching the listing filters without loading any rows.
+        
+        Args:
+            category: Optional category name or ID to filter by
+            film_filter: Optional column criteria, combined with the category
+            
+        Returns:
+            Number of matching films
+        """
+        if film_filter is not None and not film_filter.is_empty():
+            conditions = await self._filter_conditions(category, film_filter)
+            return await self._count_where(conditions) if conditions is not None else 0
+        
+        if category:
+            category_id = await self.resolve_category(category)
+            return len(category_index.film_ids(category_id)) if category_id is not None else 0
+        
+        return await self._count_where([])
+    
+    async def _count_where(self, conditions: Sequence[Any]) -> int:
+        result = await self._execute(select(func.count()).select_from(Film).where(*conditions))
+        return result.scalar_one()
+    
+    async def _get_films_by_id_list(
+        self, film_ids: Sequence[int], fields: Optional[Sequence[str]] = None
+    ) -> List[FilmRow]:
+        """Fetch films by primary key, ordered by film_id."""
+        if not film_ids:
+            return []
+        
+        query = (
+            self._select(fields)
+            .where(col(Film.film_id).in_(list(film_ids)))
+            .order_by(col(Film.film_id))
+        )
+        
+        result = await self._execute(query)
+        return self._rows(result, fields)
+    
+    async def _get_category_page(
+        self, skip: int, limit: int, category: str, fields: Optional[Sequence[str]] = None
+    ) -> Tuple[List[FilmRow], int]:
+        category_id = await self.resolve_category(category)
+        if category_id is None:
+            return [], 0
+        
+        film_ids = category_index.film_ids(category_id)
+        films = await self._get_films_by_id_list(film_ids[skip:skip + limit], fields)
+        return films, len(film_ids)
+    
+    async def _get_page_with_count_query(
+        self, skip: int, limit: int, fields: Optional[Sequence[str]] = None, conditions: Sequence[Any] = ()
+    ) -> Tuple[List[FilmRow], int]:
+        total_count = await self._count_where(conditions)
+        
+        # Nothing to fetch past the last row
+        if skip >= total_count:
+            return [], total_count
+        
+        query = (
+            self._select(fields)
+            .where(*conditions)
+            .order_by(col(Film.film_id))
+            .offset(skip)
+            .limit(limit)
+        )
+        
+        result = await self._execute(query)
+        return self._rows(result, fields), total_count
+    
+    async def _get_page_with_window_count(
+        self, skip: int, limit: int, fields: Optional[Sequence[str]] = None, conditions: Sequence[Any] = ()
+    ) -> Tuple[List[FilmRow], int]:
+        query = (
+            self._select(fields, func.count().over().label("total_count"))
+            .where(*conditions)
+            .order_by(col(Film.film_id))
+            .offset(skip)
+            .limit(limit)
+        )
+        
+        result = await self._execute(query)
+        rows = result.all()
+        
+        # An empty page carries no window value, so fall back to a plain count
+        if not rows:
+            return [], await self._count_where(conditions)
+        
+        total_count = rows[0].total_count
+        if fields is not None:
+            return [{name: row._mapping[name] for name in fields} for row in rows], total_count
+        if self.read_only:
+            return rows, total_count
+        return [row[0] for row in rows], total_count
+    
+    async def get_films_after(
+        self,
+        after_film_id: int,
+        limit: int = 10,
+        category: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None,
+        film_filter: Optional[FilmFilter] = None
+    ) -> Tuple[List[FilmRow], bool]:
+        """
+        Get the films that follow a given film ID (keyset pagination).
+        
+        Seeks with ``WHERE film_id > :after_film_id`` on the primary key, so
+        the cost of a page does not depend on how deep into the catalog it is.
+        
+        Args:
+            after_film_id: Last film ID seen by the client
+            limit: Maximum number of records to return
+            category: Optional category name or ID to filter by
+            fields: Optional FilmResponse fields to select instead of the entity
+            film_filter: Optional column criteria, combined with the category
             
-            base_count_query = (
-                base_count_query
-                .join(FilmCategory)
-                .join(Category)
-                .where(col(Category.name).contains(category))
+        Returns:
+            Tuple of (films, has_more); films are dicts when fields are given
+        """
+        start_time = time.time()
+        await self._ensure_reference_data(fields)
+        
+        if category and (film_filter is None or film_filter.is_empty()):
+            category_id = await self.resolve_category(category)
+            film_ids = (
+                category_index.film_ids_after(category_id, after_film_id, limit + 1)
+                if category_id is not None else []
             )
+            films = await self._get_films_by_id_list(film_ids, fields)
+        else:
+            conditions = await self._filter_conditions(category, film_filter)
+            if conditions is None:
+                films = []
+            else:
+                query = (
+                    self._select(fields)
+                    .where(col(Film.film_id) > after_film_id, *conditions)
+                    .order_by(col(Film.film_id))
+                    .limit(limit + 1)
+                )
+                
+                result = await self._execute(query)
+                films = self._rows(result, fields)
         
-        # Get total count first
-        count_result = await self.db.execute(base_count_query)
-        total_count = len(count_result.all())
+        has_more = len(films) > limit
         
-        # Get films with pagination
-        query = base_query.offset(skip).limit(limit).order_by(col(Film.film_id))
+        duration = time.time() - start_time
+        log_database_operation(
+            logger=self.logger,
+            operation="SELECT",
+            table=self.model.__tablename__,
+            duration=duration,
+            after_film_id=after_film_id,
+            limit=limit,
+            count=min(len(films), limit),
+            has_more=has_more
+        )
         
-        result = await self.db.execute(query)
-        films = result.scalars().all()
+        return films[:limit], has_more
+    
+    async def get_films_by_ids(
+        self, film_ids: Sequence[int], fields: Optional[Sequence[str]] = None
+    ) -> List[FilmRow]:
+        """
+        Get films by a list of IDs in a single round trip.
+        
+        The IDs travel as one array parameter (``film_id = ANY(:film_ids)``),
+        so the statement text is the same for any batch size.
+        
+        Args:
+            film_ids: Film IDs to fetch
+            fields: Optional FilmResponse fields to select instead of the entity
+            
+        Returns:
+            Films found, in no particular order; dicts when fields are given
+        """
+        if not film_ids:
+            return []
+        
+        start_time = time.time()
+        ids_param = bindparam("film_ids", list(film_ids), type_=ARRAY(Integer))
+        await self._ensure_reference_data(fields)
+        query = self._select(fields).where(col(Film.film_id) == any_(ids_param))
+        
+        result = await self._execute(query)
+        films = self._rows(result, fields)
+        
+        log_database_operation(
+            logger=self.logger,
+            operation="SELECT",
+            table=self.model.__tablename__,
+            duration=time.time() - start_time,
+            requested=len(film_ids),
+            found=len(films)
+        )
+        return films
+    
+    async def stream_films(
+        self, since: Optional[datetime] = None, batch_size: int = 1000
+    ) -> AsyncIterator[Row]:
+        """
+        Stream every film as a read-only row of the FilmResponse columns.
         
-        return list(films), total_count
+        Rows are fetched from a server-side cursor ``batch_size`` at a time
+        (``yield_per``), so memory use does not grow with the catalog.
+        
+        Args:
+            since: Only films with ``last_update >= since``
+            batch_size: Rows fetched per round trip
+            
+        Yields:
+            Film rows ordered by film_id
+        """
+        query = (
+            film_select(FILM_FIELDS)
+            .order_by(col(Film.film_id))
+            .execution_options(yield_per=batch_size)
+        )
+        if since is not None:
+            query = query.where(col(Film.last_update) >= since)
+        
+        result = await self.db.stream(query)
+        async for row in result:
+            yield row
     
     async def get_film_by_id(self, film_id: int) -> Optional[Film]:
-        return await self.get_by_id(film_id, load_relationships=["language"])
+        await reference_data.ensure_loaded(self.db)
+        return await self.get_by_id(film_id)
     
-    async def get_films_by_language(self, language_id: int) -> List[Film]:
+    async def get_film_detail_json(self, film_id: int) -> Optional[str]:
+        """
+        Get a film with its actors and categories as a JSON document, in one query.
+        
+        Args:
+            film_id: Film ID
+            
+        Returns:
+            JSON text matching FilmDetailResponse, or None if the film does not exist
+        """
+        start_time = time.time()
+        
+        result = await self.db.execute(film_detail_select(film_id))
+        document = result.scalar_one_or_none()
+        
+        log_database_operation(
+            logger=self.logger,
+            operation="SELECT",
+            table=self.model.__tablename__,
+            duration=time.time() - start_time,
+            query_type="detail",
+            film_id=film_id,
+            found=document is not None
+        )
+        return document
+    
+    async def get_film_fields(self, film_id: int, fields: Sequence[str]) -> Optional[Dict[str, Any]]:
+        """
+        Get only the requested columns of a film.
+        
+        Args:
+            film_id: Film ID
+            fields: FilmResponse field names to select
+            
+        Returns:
+            Dict of the requested fields, or None if the film does not exist
+        """
+        result = await self.db.execute(film_select(fields).where(col(Film.film_id) == film_id))
+        row = result.one_or_none()
+        return row._asdict() if row else None
+    
+    async def get_facet_counts(
+        self, category_id: Optional[int] = None, film_filter: Optional[FilmFilter] = None
+    ) -> List[Tuple[str, Any, Optional[str], int]]:
+        """
+        Count films per rating, category, language and streaming availability
+        in one grouped query (GROUPING SETS), plus the total.
+        
+        Films are counted distinctly, since joining film_category repeats a
+        film once per category.
+        
+        Args:
+            category_id: Optional category to restrict the films to
+            film_filter: Optional column criteria the films must match
+            
+        Returns:
+            (facet, value, name, count) tuples; facet is a FACET_GROUPINGS
+            value, name is the category or language name
+        """
+        start_time = time.time()
+        await category_index.ensure_loaded(self.db)
+        
+        if self.use_view:
+            query = self._catalog_facet_query(category_id, film_filter)
+        else:
+            query = self._facet_query(category_id, film_filter)
+        
+        result = await self.db.execute(query)
+        facets = []
+        for row in result.all():
+            facet = FACET_GROUPINGS[row.grouping]
+            if facet == "rating":
+                facets.append((facet, row.rating, None, row.count))
+            elif facet == "category":
+                name = category_index.name(row.category_id) if row.category_id is not None else None
+                facets.append((facet, row.category_id, name, row.count))
+            elif facet == "language":
+                facets.append((facet, row.language_id, row.name.strip() if row.name else None, row.count))
+            elif facet == "streaming_available":
+                facets.append((facet, row.streaming_available, None, row.count))
+            else:
+                facets.append((facet, None, None, row.count))
+        
+        log_database_operation(
+            logger=self.logger,
+            operation="SELECT",
+            table=self.model.__tablename__,
+            duration=time.time() - start_time,
+            query_type="facets",
+            category_id=category_id,
+            count=len(facets)
+        )
+        return facets
+    
+    @staticmethod
+    def _facet_query(category_id: Optional[int], film_filter: Optional[FilmFilter]):
+        """The facet query over the tables: film joined to film_category and language."""
+        grouping = func.grouping(
+            Film.rating, FilmCategory.category_id, Film.language_id, Film.streaming_available
+        ).label("grouping")
+        query = (
+            select(
+                grouping,
+                Film.rating,
+                FilmCategory.category_id,
+                Film.language_id,
+                func.rtrim(Language.name).label("name"),
+                Film.streaming_available,
+                func.count(distinct(Film.film_id)).label("count")
+            )
+            .select_from(Film)
+            .outerjoin(FilmCategory, FilmCategory.film_id == Film.film_id)
+            .outerjoin(Language, Language.language_id == Film.language_id)
+            .group_by(func.grouping_sets(
+                Film.rating,
+                FilmCategory.category_id,
+                tuple_(Film.language_id, func.rtrim(Language.name)),
+                Film.streaming_available,
+                tuple_()
+            ))
+            .where(*film_filter_conditions(film_filter))
+        )
+        if category_id is not None:
+            query = query.where(col(Film.film_id).in_(
+                select(FilmCategory.film_id).where(FilmCategory.category_id == category_id)
+            ))
+        return query
+    
+    @staticmethod
+    def _catalog_facet_query(category_id: Optional[int], film_filter: Optional[FilmFilter]):
+        """The facet query over film_catalog: categories are unnested from the row, no joins."""
+        categories = func.unnest(film_catalog.c.category_ids).table_valued("category_id").render_derived(name="categories")
+        catalog = film_catalog.c
+        grouping = func.grouping(
+            catalog.rating, categories.c.category_id, catalog.language_id, catalog.streaming_available
+        ).label("grouping")
         query = (
-            select(Film)
-            .options(selectinload(Film.language))
+            select(
+                grouping,
+                catalog.rating,
+                categories.c.category_id,
+                catalog.language_id,
+                catalog.language_name.label("name"),
+                catalog.streaming_available,
+                func.count(distinct(catalog.film_id)).label("count")
+            )
+            .select_from(film_catalog.outerjoin(categories, true()))
+            .group_by(func.grouping_sets(
+                catalog.rating,
+                categories.c.category_id,
+                tuple_(catalog.language_id, catalog.language_name),
+                catalog.streaming_available,
+                tuple_()
+            ))
+            .where(*(catalog_query(condition) for condition in film_filter_conditions(film_filter)))
+        )
+        if category_id is not None:
+            query = query.where(catalog.category_ids.contains([category_id]))
+        return query
+    
+    async def get_films_by_language(self, language_id: int) -> List[FilmRow]:
+        await self._ensure_reference_data()
+        query = (
+            self._select()
             .where(Film.language_id == language_id)
             .order_by(Film.title)
         )
         
-        result = await self.db.execute(query)
-        return list(result.scalars().all())
+        result = await self._execute(query)
+        return self._rows(result)
     
-    async def get_films_by_rating(self, rating: str) -> List[Film]:
+    async def get_films_by_rating(self, rating: str) -> List[FilmRow]:
+        await self._ensure_reference_data()
         query = (
-            select(Film)
-            .options(selectinload(Film.language))
+            self._select()
             .where(Film.rating == rating)
             .order_by(Film.title)
         )
         
-        result = await self.db.execute(query)
-        return list(result.scalars().all())
+        result = await self._execute(query)
+        return self._rows(result)
     
-    async def get_films_by_category(self, category_name: str) -> List[Film]:
+    async def get_films_by_category(self, category_name: str) -> List[FilmRow]:
+        category_id = await self.resolve_category(category_name)
+        if category_id is None:
+            return []
+        
+        await self._ensure_reference_data()
         query = (
-            select(Film)
-            .options(selectinload(Film.language))
-            .join(FilmCategory)
-            .join(Category)
-            .where(Category.name == category_name)
+            self._select()
+            .where(col(Film.film_id).in_(list(category_index.film_ids(category_id))))
             .order_by(Film.title)
         )
         
-        result = await self.db.execute(query)
-        return list(result.scalars().all())
+        result = await self._execute(query)
+        return self._rows(result)
     
-    async def get_streaming_films(self) -> List[Film]:
+    async def get_streaming_films(self) -> List[FilmRow]:
+        await self._ensure_reference_data()
         query = (
-            select(Film)
-            .options(selectinload(Film.language))
+            self._select()
             .where(Film.streaming_available == True)
             .order_by(Film.title)
         )
         
-        result = await self.db.execute(query)
-        return list(result.scalars().all())
+        result = await self._execute(query)
+        return self._rows(result)
     
-    async def search_films_by_title(self, title: str) -> List[Film]:
+    async def search_films_by_title(self, title: str) -> List[FilmRow]:
+        await self._ensure_reference_data()
         query = (
-            select(Film)
-            .options(selectinload(Film.language))
+            self._select()
             .where(col(Film.title).contains(title))
             .order_by(Film.title)
         )
         
-        result = await self.db.execute(query)
-        return list(result.scalars().all())
+        result = await self._execute(query)
+        return self._rows(result)
+    
+    async def search_films_fulltext(
+        self,
+        query_text: str,
+        skip: int = 0,
+        limit: int = 10
+    ) -> Tuple[List[FilmRow], int]:
+        """
+        Ranked full-text search over Film.fulltext.
+        
+        Parses the query with ``websearch_to_tsquery`` (quoted phrases, ``or``
+        and ``-term`` are supported), matches it with ``@@`` so the GIN index
+        on ``fulltext`` is used, and orders by ``ts_rank``.
+        
+        Args:
+            query_text: Search query as typed by the user
+            skip: Number of records to skip
+            limit: Maximum number of records to return
+            
+        Returns:
+            Tuple of (films, total_count)
+        """
+        start_time = time.time()
+        
+        ts_query = func.websearch_to_tsquery(FULLTEXT_CONFIG, query_text)
+        matches = col(Film.fulltext).op("@@")(ts_query)
+        
+        count_result = await self._execute(
+            select(func.count()).select_from(Film).where(matches)
+        )
+        total_count = count_result.scalar_one()
+        
+        films: List[FilmRow] = []
+        if skip < total_count:
+            await self._ensure_reference_data()
+            rank = func.ts_rank(col(Film.fulltext), ts_query)
+            query = (
+                self._select()
+                .where(matches)
+                .order_by(rank.desc(), col(Film.film_id))
+                .offset(skip)
+                .limit(limit)
+            )
+            
+            result = await self._execute(query)
+            films = self._rows(result)
+        
+        duration = time.time() - start_time
+        log_database_operation(
+            logger=self.logger,
+            operation="SEARCH",
+            table=self.model.__tablename__,
+            duration=duration,
+            skip=skip,
+            limit=limit,
+            count=len(films),
+            total_count=total_count
+        )
+        
+        return films, total_count
     
     async def create_film(self, film: Film) -> Film:
+        film.fulltext = build_fulltext(film.title, film.description)
         return await self.create(film)
     
     async def update_film(self, film: Film) -> Film:
+        # last_update feeds the film's ETag, so every update must move it
+        film.last_update = func.now()
+        film.fulltext = build_fulltext(film.title, film.description)
         return await self.update(film)
     
+    @staticmethod
+    def _fulltext_params(row: Dict[str, Any]) -> Dict[str, Any]:
+        # Values bound a second time for the server-side fulltext expression
+        return {"fulltext_title": row["title"], "fulltext_description": row.get("description")}
+    
+    async def insert_films(self, rows: Sequence[Dict[str, Any]]) -> List[int]:
+        """
+        Insert films with one multi-row ``INSERT ... RETURNING film_id``.
+        
+        ``fulltext`` is computed by the database from the bound title and
+        description. Nothing is committed.
+        
+        Args:
+            rows: Column values per film (no film_id); every row has the same keys
+            
+        Returns:
+            New film IDs, in the order of ``rows``
+        """
+        statement = (
+            insert(Film.__table__)
+            .values(fulltext=build_fulltext(bindparam("fulltext_title"), bindparam("fulltext_description")))
+            .returning(Film.__table__.c.film_id, sort_by_parameter_order=True)
+        )
+        result = await self.db.execute(statement, [{**row, **self._fulltext_params(row)} for row in rows])
+        return list(result.scalars())
+    
+    async def update_films(self, rows: Sequence[Dict[str, Any]]) -> List[int]:
+        """
+        Replace films by primary key with one executemany ``UPDATE``.
+        
+        ``fulltext`` and ``last_update`` are set by the database. Nothing is
+        committed.
+        
+        Args:
+            rows: Column values per film, including film_id; every row has the same keys
+            
+        Returns:
+            The updated film IDs, in the order of ``rows``
+        """
+        table = Film.__table__
+        statement = (
+            update(table)
+            .where(table.c.film_id == bindparam("target_film_id"))
+            .values(
+                fulltext=build_fulltext(bindparam("fulltext_title"), bindparam("fulltext_description")),
+                last_update=func.now()
+            )
+        )
+        params = [
+            {
+                **{key: value for key, value in row.items() if key != "film_id"},
+                **self._fulltext_params(row),
+                "target_film_id": row["film_id"],
+            }
+            for row in rows
+        ]
+        await self.db.execute(statement, params)
+        return [row["film_id"] for row in rows]
+    
+    async def write_films_isolated(
+        self,
+        write: Callable[[Sequence[Dict[str, Any]]], Awaitable[List[int]]],
+        rows: Sequence[Dict[str, Any]]
+    ) -> List[Tuple[Optional[int], Optional[str]]]:
+        """
+        Run a bulk write (``insert_films`` or ``update_films``) for one batch and commit.
+        
+        The batch runs in a savepoint. If the database rejects it, each row
+        is retried in its own savepoint, so a bad row (e.g. a constraint
+        violation) fails alone and the rest of the batch is still written.
+        
+        Args:
+            write: Bulk write method
+            rows: Rows of the batch
+            
+        Returns:
+            Per row, (film_id, None) if written or (None, error message) if not
+        """
+        start_time = time.time()
+        isolated = False
+        
+        try:
+            async with self.db.begin_nested():
+                results = [(film_id, None) for film_id in await write(rows)]
+        except DBAPIError as e:
+            isolated = True
+            self.logger.warning(
+                "Bulk film write failed, retrying rows one by one",
+                rows=len(rows),
+                error=database_error_message(e)
+            )
+            results = []
+            for row in rows:
+                try:
+                    async with self.db.begin_nested():
+                        results.append(((await write([row]))[0], None))
+                except DBAPIError as row_error:
+                    results.append((None, database_error_message(row_error)))
+        
+        await self.db.commit()
+        
+        log_database_operation(
+            logger=self.logger,
+            operation="BULK_WRITE",
+            table=self.model.__tablename__,
+            duration=time.time() - start_time,
+            rows=len(rows),
+            failed=sum(1 for film_id, _ in results if film_id is None),
+            isolated=isolated
+        )
+        return results
+    
+    async def existing_film_ids(self, film_ids: Sequence[int]) -> Set[int]:
+        """The subset of the given film IDs that exist."""
+        if not film_ids:
+            return set()
+        ids_param = bindparam("film_ids", list(film_ids), type_=ARRAY(Integer))
+        result = await self.db.execute(select(Film.film_id).where(col(Film.film_id) == any_(ids_param)))
+        return set(result.scalars())
+    
+    async def unknown_language_ids(self, language_ids: Sequence[int]) -> Set[int]:
+        """The given language IDs that are not in the language table (checked via the reference data registry)."""
+        await reference_data.ensure_loaded(self.db)
+        return {language_id for language_id in language_ids if reference_data.language_name(language_id) is None}
+    
     async def delete_film(self, film_id: int) -> bool:
         return await self.delete_by_id(film_id)
     
-    async def get_film_by_title_search(self, title: str) -> Optional[Film]:
+    async def get_film_by_title_search(self, title: str) -> Optional[FilmRow]:
         """
         Get the first film that matches the title search criteria.
         
@@ -134,19 +1005,18 @@ class FilmRepository(BaseRepository[Film]):
         Returns:
             First matching film or None if not found
         """
+        await self._ensure_reference_data()
         query = (
-            select(Film)
-            .options(selectinload(Film.language))
+            self._select()
             .where(col(Film.title).contains(title))
             .order_by(Film.title)
             .limit(1)
         )
         
-        result = await self.db.execute(query)
-        return result.scalar_one_or_none()
+        result = await self._execute(query)
+        films = self._rows(result)
+        return films[0] if films else None
 
     async def get_available_categories(self) -> List[str]:
-        query = select(Category.name).order_by(Category.name)
-        
-        result = await self.db.execute(query)
-        return list(result.scalars().all()) 
\ No newline at end of file
+        await reference_data.ensure_loaded(self.db)
+        return reference_data.category_names()
@@ -2,7 +2,7 @@ from typing import Optional, Dict, Any
 from fastapi import Depends
 import logging
 
-from domain.entities.business import Customer
+from domain.models.responses.customer import CustomerSnapshot
 from domain.repositories.deps import get_customer_repository
 from domain.repositories.customer_repository import CustomerRepository
 from domain.models.auth_models import AuthenticatedUser, JWTExpiredError, JWTInvalidError, JWTDecodeError
@@ -15,10 +15,10 @@ class AuthService:
     def __init__(self, customer_repository: CustomerRepository = Depends(get_customer_repository)):
         self.customer_repository = customer_repository
 
-    async def get_customer_by_id(self, customer_id: int) -> Optional[Customer]:
+    async def get_customer_by_id(self, customer_id: int) -> Optional[CustomerSnapshot]:
         logger.info("AuthService: Authenticating user")
         try:
-            user = await self.customer_repository.get_customer_by_id(customer_id)
+            user = await self.customer_repository.get_customer_snapshot(customer_id)
             logger.info(f"AuthService: User authenticated")
             return user
         except Exception as e:
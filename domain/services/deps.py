@@ -5,6 +5,10 @@ from domain.services.customer_service import CustomerService
 from domain.repositories.deps import get_customer_repository
 from domain.repositories.customer_repository import CustomerRepository
 from domain.services.film_service import FilmService
+from domain.services.film_export_service import FilmExportService
+from domain.services.table_export_service import TableExportService
+from domain.services.snapshot_service import SnapshotService
+from domain.services.film_import_service import FilmImportService
 from domain.repositories.film_repository import FilmRepository
 from domain.repositories.deps import get_film_repository
 from domain.services.rental_service import RentalService
@@ -26,6 +30,22 @@ def get_film_service(film_repository: FilmRepository = Depends(get_film_reposito
     """Dependency to get FilmService instance."""
     return FilmService(film_repository)
 
+def get_film_export_service() -> FilmExportService:
+    """Dependency to get FilmExportService instance (opens its own sessions)."""
+    return FilmExportService()
+
+def get_table_export_service() -> TableExportService:
+    """Dependency to get TableExportService instance (borrows its own connections)."""
+    return TableExportService()
+
+def get_snapshot_service() -> SnapshotService:
+    """Dependency to get SnapshotService instance (opens its own sessions)."""
+    return SnapshotService()
+
+def get_film_import_service() -> FilmImportService:
+    """Dependency to get FilmImportService instance (opens its own sessions and connections)."""
+    return FilmImportService()
+
 def get_rental_service(rental_repository: RentalRepository = Depends(get_rental_repository), customer_repository: CustomerRepository = Depends(get_customer_repository)):
     """Dependency to get RentalService instance."""
     return RentalService(rental_repository, customer_repository)
@@ -0,0 +1,168 @@
+"""
+Service layer for bulk film catalog exports.
+"""
+
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from datetime import datetime
+from typing import AsyncIterator, Deque, List, Optional, Tuple
+
+import anyio
+from anyio.abc import TaskGroup
+from anyio.streams.memory import MemoryObjectReceiveStream, MemoryObjectSendStream
+
+from core.config import settings
+from core.db import get_engine_and_session_factory
+from core.logging import get_logger, log_service_operation
+from core.streaming import produced_stream
+from domain.models.responses.film import FilmResponse
+from domain.catalog.film_fragments import film_fragments
+from domain.repositories.film_repository import FilmRepository
+from domain.utils.conversion_pool import conversion_pool
+
+# Emit a chunk to the client once this much NDJSON has accumulated
+CHUNK_BYTES = 64 * 1024
+
+# Chunks rendered ahead of a slow client
+PENDING_CHUNKS = 4
+
+
+class FilmExportService:
+    """
+    Streams the film catalog for downstream systems.
+    
+    Exports outlive the request handler (the body is sent after the route
+    returns), so each export opens its own session instead of using the
+    request-scoped one.
+    """
+    
+    def __init__(self, session_factory=None):
+        self._session_factory = session_factory
+        self.logger = get_logger(__name__)
+    
+    @property
+    def session_factory(self):
+        if self._session_factory is None:
+            _, self._session_factory = get_engine_and_session_factory("film")
+        return self._session_factory
+    
+    @asynccontextmanager
+    async def ndjson(self, since: Optional[datetime] = None) -> AsyncIterator[AsyncIterator[bytes]]:
+        """
+        Stream films as newline-delimited JSON, one FilmResponse per line.
+        
+        Lines come from the film fragment cache, so films already rendered
+        in their current version are neither validated nor serialised again.
+        With a conversion process pool configured, rows past the first
+        ``settings.convert_process_min_rows`` are sent to it as plain tuples
+        in batches of ``settings.film_export_batch_size``, keeping up to one
+        batch per worker in flight while the next one is fetched; small
+        exports never leave the event loop. The pool renders the same bytes
+        as the fragment cache.
+        
+        The export runs in a background task, so this is a context manager
+        (``async with service.ndjson() as chunks``, see
+        ``core.streaming.ContextStreamingResponse``); leaving it early
+        cancels the export.
+        
+        Args:
+            since: Only films with ``last_update >= since``
+            
+        Yields:
+            Chunks of complete NDJSON lines
+        """
+        async def produce(send: MemoryObjectSendStream) -> None:
+            await self._write_ndjson(send, since)
+        
+        async with produced_stream(produce, PENDING_CHUNKS) as chunks:
+            yield chunks
+    
+    async def _write_ndjson(self, send: MemoryObjectSendStream, since: Optional[datetime]) -> None:
+        start_time = time.time()
+        count = 0
+        buffer = bytearray()
+        offload = conversion_pool.enabled
+        batch_size = settings.film_export_batch_size
+        batch: List[tuple] = []
+        field_names = None
+        in_flight: Deque[MemoryObjectReceiveStream] = deque()
+        error: Optional[Exception] = None
+        
+        async with anyio.create_task_group() as task_group:
+            try:
+                async with self.session_factory() as session:
+                    repository = FilmRepository(session, read_only=True)
+                    async for row in repository.stream_films(since, batch_size=batch_size):
+                        count += 1
+                        if offload and count > settings.convert_process_min_rows:
+                            if field_names is None:
+                                field_names = tuple(row._fields)
+                            batch.append(tuple(row))
+                            if len(batch) >= batch_size:
+                                in_flight.append(self._render_batch(task_group, field_names, batch))
+                                batch = []
+                                if buffer:
+                                    await send.send(bytes(buffer))
+                                    buffer.clear()
+                                if len(in_flight) > settings.convert_process_workers:
+                                    await send.send(await self._batch_result(in_flight.popleft()))
+                            continue
+                        
+                        buffer += film_fragments.row_fragment(row)
+                        buffer += b"\n"
+                        if len(buffer) >= CHUNK_BYTES:
+                            await send.send(bytes(buffer))
+                            buffer.clear()
+                
+                if buffer:
+                    await send.send(bytes(buffer))
+                if batch:
+                    in_flight.append(self._render_batch(task_group, field_names, batch))
+                while in_flight:
+                    await send.send(await self._batch_result(in_flight.popleft()))
+            except Exception as e:
+                # Raised once the group has exited, so callers see it rather than an ExceptionGroup
+                error = e
+            finally:
+                for receive in in_flight:
+                    receive.close()
+                # Batches nobody will read once the export stopped early
+                task_group.cancel_scope.cancel()
+        
+        if error is not None:
+            raise error
+        
+        log_service_operation(
+            logger=self.logger,
+            service="FilmExportService",
+            operation="ndjson",
+            duration=time.time() - start_time,
+            since=since.isoformat() if since else None,
+            count=count
+        )
+    
+    @staticmethod
+    def _render_batch(task_group: TaskGroup, field_names: Tuple[str, ...], rows: List[tuple]) -> MemoryObjectReceiveStream:
+        """Start rendering a batch in the process pool; its NDJSON (or error) arrives on the returned stream."""
+        send, receive = anyio.create_memory_object_stream(1)
+        
+        async def render() -> None:
+            async with send:
+                try:
+                    result = await conversion_pool.render_json_lines(FilmResponse, field_names, rows)
+                except Exception as e:
+                    result = e
+                await send.send(result)
+        
+        task_group.start_soon(render)
+        return receive
+    
+    @staticmethod
+    async def _batch_result(receive: MemoryObjectReceiveStream) -> bytes:
+        """Wait for a batch started by ``_render_batch``, raising its error if it failed."""
+        async with receive:
+            result = await receive.receive()
+        if isinstance(result, Exception):
+            raise result
+        return result
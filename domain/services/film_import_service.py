@@ -0,0 +1,582 @@
+"""
+Service layer for resumable film catalog imports (CSV / JSON Lines) via COPY.
+"""
+
+import csv
+import io
+import json
+import os
+import time
+from datetime import datetime, timezone
+from decimal import ROUND_HALF_UP, Decimal
+from itertools import islice
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Tuple
+
+import anyio
+import asyncpg
+from pydantic import ValidationError
+from sqlalchemy import Column, MetaData, Table, delete, func, insert, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.schema import CreateTable
+
+from core.config import settings
+from core.db import get_engine_and_session_factory
+from core.logging import get_logger, log_service_operation
+from core.metrics import register_metrics
+from core.response_cache import response_cache
+from domain.caches import facet_cache
+from domain.catalog.cache_keys import FILMS_LIST
+from domain.catalog.catalog_view import catalog_view_refresher
+from domain.catalog.reference_data import reference_data
+from domain.catalog.search_index import film_search_index
+from domain.catalog.versions import catalog_versions
+from domain.entities import Film, FilmImportJob
+from domain.models.requests.film import CreateFilmRequest
+from domain.repositories.film_repository import build_fulltext, database_error_message
+from domain.services.film_service import validation_message
+
+IMPORT_FORMATS = {"csv": "csv", "jsonl": "jsonl"}  # format -> file extension
+
+# CreateFilmRequest fields, copied into film in this order
+IMPORT_COLUMNS = tuple(CreateFilmRequest.model_fields)
+
+# Postgres types (NUMERIC) that asyncpg's COPY encoder wants as Decimal
+DECIMAL_COLUMNS = {"rental_rate", "replacement_cost"}
+
+_film_table = Film.__table__
+
+
+def _numeric_limit(name: str) -> Tuple[Decimal, Decimal]:
+    """Largest value of a NUMERIC(precision, scale) film column, and its rounding step."""
+    column_type = _film_table.c[name].type
+    step = Decimal(1).scaleb(-column_type.scale)
+    return Decimal(1).scaleb(column_type.precision - column_type.scale) - step, step
+
+
+# rental_rate is NUMERIC(4,2): CreateFilmRequest allows up to 999.99, the column stops at 99.99
+NUMERIC_LIMITS = {name: _numeric_limit(name) for name in sorted(DECIMAL_COLUMNS)}
+
+# COPY goes through the asyncpg connection directly, so its errors are not wrapped in DBAPIError
+DATABASE_ERRORS = (DBAPIError, asyncpg.PostgresError)
+
+# Per-connection staging table for COPY; its rows vanish when the chunk's
+# transaction ends, so each chunk starts from an empty table
+film_import_staging = Table(
+    "film_import_staging",
+    MetaData(),
+    *(Column(name, _film_table.c[name].type) for name in IMPORT_COLUMNS),
+    prefixes=["TEMPORARY"],
+    postgresql_on_commit="DELETE ROWS",
+)
+
+# (line number, record or None, parse error or None)
+SourceRecord = Tuple[int, Optional[Dict[str, Any]], Optional[str]]
+
+# (line number, validated film)
+ValidFilm = Tuple[int, CreateFilmRequest]
+
+
+def new_import_id() -> str:
+    """Sortable, filesystem-safe import job ID (UTC timestamp)."""
+    return datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S%fZ")
+
+
+def parse_text_array(value: str) -> List[str]:
+    """
+    Elements of a list-valued CSV cell.
+
+    Accepts a Postgres array literal (``{Trailers,"Deleted Scenes"}``, as the
+    admin CSV export writes ``special_features``) or a JSON array.
+    """
+    value = value.strip()
+    if value.startswith("["):
+        return json.loads(value)
+    if not (value.startswith("{") and value.endswith("}")):
+        raise ValueError(f"Not an array: {value!r}")
+    inner = value[1:-1]
+    if not inner:
+        return []
+    elements = next(csv.reader([inner], escapechar="\\", doublequote=False))
+    return [element for element in elements if element != "NULL"]
+
+
+def _csv_records(stream: io.TextIOBase) -> Iterator[SourceRecord]:
+    reader = csv.DictReader(stream)
+    for row in reader:
+        # An empty cell means "not given", so CreateFilmRequest defaults apply
+        record = {key: value for key, value in row.items() if key is not None and value not in ("", None)}
+        try:
+            if "special_features" in record:
+                record["special_features"] = parse_text_array(record["special_features"])
+        except ValueError as e:
+            yield reader.line_num, None, f"special_features: {e}"
+            continue
+        yield reader.line_num, record, None
+
+
+def _jsonl_records(stream: io.TextIOBase) -> Iterator[SourceRecord]:
+    for line_number, line in enumerate(stream, start=1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError as e:
+            yield line_number, None, f"Invalid JSON: {e}"
+            continue
+        if not isinstance(record, dict):
+            yield line_number, None, "Expected a JSON object"
+            continue
+        yield line_number, record, None
+
+
+def read_records(stream: io.TextIOBase, file_format: str) -> Iterator[SourceRecord]:
+    """
+    Lazily parse a catalog file, one record at a time.
+
+    Args:
+        stream: Text stream positioned at the start of the file
+        file_format: "csv" (with a header row) or "jsonl" (one object per line)
+
+    Returns:
+        Iterator of (line number, record, parse error); blank JSONL lines are skipped
+
+    Raises:
+        ValueError: For an unknown format
+    """
+    if file_format == "csv":
+        return _csv_records(stream)
+    if file_format == "jsonl":
+        return _jsonl_records(stream)
+    raise ValueError(f"Unknown import format: {file_format}")
+
+
+def column_limit_error(film: CreateFilmRequest) -> Optional[str]:
+    """
+    Why a valid CreateFilmRequest would still not fit the film table, or None.
+
+    Title length and rating are already checked by the request model; the
+    NUMERIC columns are narrower than its bounds, and text columns cannot
+    hold NUL characters.
+    """
+    values = film.model_dump()
+    for name, (limit, step) in NUMERIC_LIMITS.items():
+        # Postgres rounds to the column's scale before checking the precision
+        if Decimal(str(values[name])).quantize(step, rounding=ROUND_HALF_UP) > limit:
+            return f"{name}: must be at most {limit}"
+
+    texts = [("title", film.title), ("description", film.description)]
+    texts += [("special_features", feature) for feature in film.special_features or ()]
+    for name, text in texts:
+        if text is not None and "\x00" in text:
+            return f"{name}: must not contain NUL characters"
+    return None
+
+
+def validate_chunk(records: List[SourceRecord]) -> Tuple[List[ValidFilm], List[Tuple[int, str]]]:
+    """
+    Validate parsed records with CreateFilmRequest and the film column limits.
+
+    Returns:
+        (line number, film) for every valid record, and (line number, reason)
+        for every rejected one
+    """
+    films: List[ValidFilm] = []
+    rejects: List[Tuple[int, str]] = []
+    for line_number, record, error in records:
+        if error is not None:
+            rejects.append((line_number, error))
+            continue
+        try:
+            film = CreateFilmRequest.model_validate(record)
+        except ValidationError as e:
+            rejects.append((line_number, validation_message(e)))
+            continue
+        unknown = [
+            language_id for language_id in (film.language_id, film.original_language_id)
+            if language_id is not None and reference_data.language_name(language_id) is None
+        ]
+        if unknown:
+            rejects.append((line_number, f"Unknown language_id {unknown[0]}"))
+            continue
+        error = column_limit_error(film)
+        if error is not None:
+            rejects.append((line_number, error))
+            continue
+        films.append((line_number, film))
+    return films, rejects
+
+
+def copy_record(film: CreateFilmRequest) -> Tuple[Any, ...]:
+    """A validated film as a staging-table row (IMPORT_COLUMNS order)."""
+    values = film.model_dump()
+    return tuple(
+        Decimal(str(values[name])) if name in DECIMAL_COLUMNS else values[name]
+        for name in IMPORT_COLUMNS
+    )
+
+
+def merge_statement():
+    """INSERT INTO film ... SELECT from the staging table, computing the search vector in SQL."""
+    staging = film_import_staging.c
+    return (
+        insert(_film_table)
+        .from_select(
+            [*IMPORT_COLUMNS, "fulltext"],
+            select(*(staging[name] for name in IMPORT_COLUMNS), build_fulltext(staging.title, staging.description))
+        )
+        .returning(_film_table.c.film_id, _film_table.c.title, _film_table.c.description)
+    )
+
+
+def _read_chunk(records: Iterator[SourceRecord], size: int) -> List[SourceRecord]:
+    return list(islice(records, size))
+
+
+def _skip(records: Iterator[SourceRecord], count: int) -> int:
+    return sum(1 for _ in islice(records, count))
+
+
+class ImportProgress:
+    """Live counters of one import run, reported by GET /admin/imports/{id} and the metrics."""
+
+    def __init__(self, job_id: str, total_bytes: int, resumed_from: int = 0):
+        self.job_id = job_id
+        self.status = "running"
+        self.total_bytes = total_bytes
+        self.bytes_read = 0
+        self.resumed_from = resumed_from
+        self.rows_read = 0
+        self.rows_imported = 0
+        self.rows_rejected = 0
+        self.chunks = 0
+        self.sample_errors: List[Dict[str, Any]] = []
+        self.error: Optional[str] = None
+        self._started = time.monotonic()
+        self._finished: Optional[float] = None
+
+    def record_chunk(self, rows_read: int, rows_imported: int, rejects: List[Tuple[int, str]], bytes_read: int) -> None:
+        self.rows_read += rows_read
+        self.rows_imported += rows_imported
+        self.rows_rejected += len(rejects)
+        self.chunks += 1
+        self.bytes_read = bytes_read
+        room = settings.import_max_sample_errors - len(self.sample_errors)
+        self.sample_errors.extend({"line": line, "error": error} for line, error in rejects[:max(room, 0)])
+
+    def finish(self, status: str, error: Optional[str] = None) -> None:
+        self.status = status
+        self.error = error
+        self._finished = time.monotonic()
+
+    def stats(self) -> Dict[str, Any]:
+        elapsed = (self._finished or time.monotonic()) - self._started
+        return {
+            "status": self.status,
+            "resumed_from": self.resumed_from,
+            "rows_read": self.rows_read,
+            "rows_imported": self.rows_imported,
+            "rows_rejected": self.rows_rejected,
+            "chunks": self.chunks,
+            "bytes_read": self.bytes_read,
+            "total_bytes": self.total_bytes,
+            "percent": round(100 * self.bytes_read / self.total_bytes, 1) if self.total_bytes else 100.0,
+            "elapsed_seconds": round(elapsed, 3),
+            "rows_per_second": round(self.rows_read / elapsed, 1) if elapsed > 0 else 0.0,
+            "mb_per_second": round((self.bytes_read / elapsed) / (1024 * 1024), 2) if elapsed > 0 else 0.0,
+            "sample_errors": self.sample_errors,
+            "error": self.error,
+        }
+
+
+# Import runs of this process, by job ID
+import_progress: Dict[str, ImportProgress] = {}
+register_metrics("imports", lambda: {job_id: progress.stats() for job_id, progress in import_progress.items()})
+
+
+class FilmImportService:
+    """
+    Imports film catalog files of any size into the film table.
+
+    The file is parsed lazily and handled ``settings.import_chunk_size``
+    records at a time: a chunk is validated with CreateFilmRequest (off the
+    event loop), the valid rows are streamed into a temporary staging table
+    with COPY through the asyncpg connection, moved into ``film`` with one
+    INSERT ... SELECT that also computes the search vector, and committed in
+    the same transaction as the job's checkpoint (``rows_committed``). Memory
+    is bounded by the chunk size, not the file size.
+
+    A failed run leaves the job ``failed`` with every chunk up to its
+    checkpoint imported; resuming skips that many records of the file and
+    carries on, so no row is imported twice. Rejected rows are counted and
+    sampled, not fatal: if the database still rejects a chunk, its rows are
+    retried one by one in savepoints, so only the bad rows are left out.
+    """
+
+    def __init__(self, engine=None, session_factory=None, import_dir: Optional[str] = None):
+        self._engine = engine
+        self._session_factory = session_factory
+        self.import_dir = import_dir or settings.import_dir
+        self.logger = get_logger(__name__)
+
+    @property
+    def engine(self):
+        if self._engine is None:
+            self._engine, _ = get_engine_and_session_factory("film")
+        return self._engine
+
+    @property
+    def session_factory(self):
+        if self._session_factory is None:
+            _, self._session_factory = get_engine_and_session_factory("film")
+        return self._session_factory
+
+    def is_running(self, job_id: str) -> bool:
+        """Whether this process is currently importing ``job_id``."""
+        progress = import_progress.get(job_id)
+        return progress is not None and progress.status == "running"
+
+    async def save_upload(self, job_id: str, file_format: str, chunks: AsyncIterator[bytes]) -> Tuple[str, int]:
+        """
+        Store an uploaded file under the import dir without holding it in memory.
+
+        Args:
+            job_id: Import job the file belongs to
+            file_format: Key of IMPORT_FORMATS
+            chunks: Request body chunks
+
+        Returns:
+            Path of the stored file and its size in bytes
+        """
+        os.makedirs(self.import_dir, exist_ok=True)
+        path = os.path.join(self.import_dir, f"{job_id}.{IMPORT_FORMATS[file_format]}")
+        partial = f"{path}.part"
+        size = 0
+        try:
+            with open(partial, "wb") as f:
+                async for chunk in chunks:
+                    await anyio.to_thread.run_sync(f.write, chunk)
+                    size += len(chunk)
+            os.replace(partial, path)
+        except BaseException:
+            if os.path.exists(partial):
+                os.remove(partial)
+            raise
+        return path, size
+
+    async def get_job(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """
+        A job's checkpoint, with the live progress of its current (or last) run in this process.
+
+        Returns:
+            The job, or None if there is no such job
+        """
+        async with self.session_factory() as session:
+            job = await session.get(FilmImportJob, job_id)
+        if job is None:
+            return None
+
+        result = job.model_dump()
+        progress = import_progress.get(job_id)
+        if progress is not None:
+            result["progress"] = progress.stats()
+        return result
+
+    async def run(
+        self,
+        job_id: Optional[str] = None,
+        path: Optional[str] = None,
+        file_format: Optional[str] = None,
+        chunk_size: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Import a file as a new job, or resume an existing job from its checkpoint.
+
+        Args:
+            job_id: Job to start or resume (default: new_import_id())
+            path: File to import; required for a new job, ignored when resuming
+            file_format: "csv" or "jsonl" (required for a new job)
+            chunk_size: Records per chunk (default: IMPORT_CHUNK_SIZE)
+
+        Returns:
+            The job's final checkpoint and the run's progress
+
+        Raises:
+            ValueError: For an unknown job without a file, or an unknown format
+        """
+        job_id = job_id or new_import_id()
+        chunk_size = chunk_size or settings.import_chunk_size
+        job = await self._start_job(job_id, path, file_format)
+        if job.status == "completed":
+            return {**job.model_dump(), "progress": None}
+
+        progress = ImportProgress(job_id, os.path.getsize(job.source), resumed_from=job.rows_committed)
+        import_progress[job_id] = progress
+        start_time = time.time()
+        try:
+            await self._import(job, progress, chunk_size)
+        except Exception as e:
+            error = database_error_message(e) if isinstance(e, DBAPIError) else str(e) or type(e).__name__
+            progress.finish("failed", error)
+            await self._set_status(job_id, "failed", error)
+            self.logger.error("Film import failed", job_id=job_id, rows_committed=job.rows_committed + progress.rows_read, error=error)
+            raise
+
+        progress.finish("completed")
+        await self._set_status(job_id, "completed")
+        log_service_operation(
+            logger=self.logger,
+            service="FilmImportService",
+            operation="run",
+            duration=time.time() - start_time,
+            job_id=job_id,
+            resumed_from=job.rows_committed,
+            rows_imported=progress.rows_imported,
+            rows_rejected=progress.rows_rejected,
+            rows_per_second=progress.stats()["rows_per_second"]
+        )
+        return {**(await self.get_job(job_id)), "progress": progress.stats()}
+
+    async def _start_job(self, job_id: str, path: Optional[str], file_format: Optional[str]) -> FilmImportJob:
+        async with self.session_factory() as session:
+            await reference_data.ensure_loaded(session)
+            job = await session.get(FilmImportJob, job_id)
+            if job is None:
+                if path is None:
+                    raise ValueError(f"Import job {job_id} not found")
+                if file_format not in IMPORT_FORMATS:
+                    raise ValueError(f"Unknown import format: {file_format}")
+                await session.execute(
+                    pg_insert(FilmImportJob)
+                    .values(job_id=job_id, source=path, file_format=file_format, status="running")
+                    .on_conflict_do_nothing()
+                )
+            elif job.status != "completed":
+                job.status = "running"
+                job.error = None
+            await session.commit()
+            return await session.get(FilmImportJob, job_id, populate_existing=True)
+
+    async def _set_status(self, job_id: str, status: str, error: Optional[str] = None) -> None:
+        async with self.session_factory() as session:
+            await session.execute(
+                update(FilmImportJob)
+                .where(FilmImportJob.job_id == job_id)
+                .values(status=status, error=error, updated_at=func.now())
+            )
+            await session.commit()
+
+    async def _import(self, job: FilmImportJob, progress: ImportProgress, chunk_size: int) -> None:
+        rows_committed = job.rows_committed
+        # The text stream is held here: the record generator drops it once exhausted,
+        # and a collected TextIOWrapper closes the file underneath us
+        with open(job.source, "rb") as raw, io.TextIOWrapper(raw, encoding="utf-8-sig", newline="") as stream:
+            records = read_records(stream, job.file_format)
+            if rows_committed:
+                await anyio.to_thread.run_sync(_skip, records, rows_committed)
+
+            async with self.engine.connect() as connection:
+                await connection.execute(CreateTable(film_import_staging, if_not_exists=True))
+                await connection.commit()
+
+                while True:
+                    # Parsing and validation are CPU-bound; keep them off the event loop
+                    chunk = await anyio.to_thread.run_sync(_read_chunk, records, chunk_size)
+                    if not chunk:
+                        break
+                    films, rejects = await anyio.to_thread.run_sync(validate_chunk, chunk)
+                    imported, failed = await self._commit_chunk(connection, job.job_id, rows_committed, len(chunk), films, len(rejects))
+                    rows_committed += len(chunk)
+                    rejects = sorted(rejects + failed)
+
+                    progress.record_chunk(len(chunk), len(imported), rejects, raw.tell())
+                    if imported:
+                        await self._films_imported(imported)
+                    self.logger.info(
+                        "Film import chunk committed",
+                        job_id=job.job_id,
+                        rows_committed=rows_committed,
+                        rows_imported=len(imported),
+                        rows_rejected=len(rejects),
+                        rows_per_second=progress.stats()["rows_per_second"]
+                    )
+
+    async def _commit_chunk(
+        self,
+        connection,
+        job_id: str,
+        rows_committed: int,
+        rows_read: int,
+        films: List[ValidFilm],
+        rows_rejected: int
+    ) -> Tuple[List[Any], List[Tuple[int, str]]]:
+        """
+        Copy one chunk into film and advance the checkpoint, in one transaction.
+
+        Returns:
+            The imported films, and (line number, reason) for every row the database rejected
+        """
+        async with connection.begin():
+            # Also opens the transaction on the driver connection before the COPY uses it
+            checkpoint = (await connection.execute(
+                select(FilmImportJob.rows_committed).where(FilmImportJob.job_id == job_id).with_for_update()
+            )).scalar_one()
+            if checkpoint != rows_committed:
+                raise RuntimeError(f"Import job {job_id} is being run elsewhere (checkpoint moved to {checkpoint})")
+
+            imported: List[Any] = []
+            failed: List[Tuple[int, str]] = []
+            if films:
+                try:
+                    async with connection.begin_nested():
+                        imported = await self._copy_films(connection, [film for _, film in films])
+                except DATABASE_ERRORS as e:
+                    self.logger.warning(
+                        "Film import chunk rejected, retrying rows one by one",
+                        job_id=job_id,
+                        rows=len(films),
+                        error=database_error_message(e)
+                    )
+                    for line_number, film in films:
+                        try:
+                            async with connection.begin_nested():
+                                imported += await self._copy_films(connection, [film])
+                                # Staged rows live until commit; the next row must not merge this one again
+                                await connection.execute(delete(film_import_staging))
+                        except DATABASE_ERRORS as row_error:
+                            failed.append((line_number, database_error_message(row_error)))
+                    rows_rejected += len(failed)
+
+            await connection.execute(
+                update(FilmImportJob)
+                .where(FilmImportJob.job_id == job_id)
+                .values(
+                    rows_committed=rows_committed + rows_read,
+                    rows_imported=FilmImportJob.rows_imported + len(imported),
+                    rows_rejected=FilmImportJob.rows_rejected + rows_rejected,
+                    chunks_committed=FilmImportJob.chunks_committed + 1,
+                    updated_at=func.now()
+                )
+            )
+        return imported, failed
+
+    async def _copy_films(self, connection, films: List[CreateFilmRequest]) -> List[Any]:
+        """COPY films into the staging table and merge them into film; returns (film_id, title, description) rows."""
+        raw_connection = await connection.get_raw_connection()
+        await raw_connection.driver_connection.copy_records_to_table(
+            film_import_staging.name,
+            records=[copy_record(film) for film in films],
+            columns=list(IMPORT_COLUMNS)
+        )
+        return (await connection.execute(merge_statement())).all()
+
+    async def _films_imported(self, imported: List[Any]) -> None:
+        """Make committed films visible to cached listings, facets and search."""
+        if film_search_index.is_loaded:
+            for film_id, title, description in imported:
+                film_search_index.upsert(film_id, title, description)
+            await film_search_index.changed()
+        await response_cache.purge(FILMS_LIST)
+        await facet_cache.invalidate()
+        await catalog_versions.films_changed()
+        catalog_view_refresher.request()
@@ -3,15 +3,41 @@ Service layer for film operations.
 """
 
 import time
-from typing import Optional
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+from pydantic import ValidationError
 
 from domain.entities.film import Film
 from domain.entities.base import MPAARating
-from domain.models.requests.film import CreateFilmRequest, UpdateFilmRequest
-from domain.models.responses.film import FilmResponse, FilmCreateResponse, FilmListResponse, FilmListResponse
-from domain.repositories.film_repository import FilmRepository
+from domain.models.requests.film import CreateFilmRequest, UpdateFilmRequest, FilmFilter, FilmBulkItem
+from domain.models.responses.film import FilmResponse, FilmCreateResponse, FilmListResponse, FilmBatchResponse, FacetCount, FilmFacetsResponse, FilmDetailResponse, FilmBulkError, FilmBulkResponse
+from domain.repositories.film_repository import FilmRepository, FilmRow
 from domain.utils.model_converter import convert_film_to_response, convert_films_to_responses, convert_films_to_responses_async
+from domain.utils.cursor import encode_cursor, decode_cursor
+from domain.catalog.category_index import category_index
+from domain.catalog.search_index import film_search_index
+from domain.catalog.versions import catalog_versions
+from domain.catalog.catalog_view import catalog_view_refresher
+from domain.catalog.cache_keys import FILMS_LIST, film_key
+from domain.caches import category_cache, facet_cache, film_cache
+from core.config import settings
 from core.logging import get_logger, log_service_operation
+from core.response_cache import response_cache
+
+def _film_id(film: FilmRow) -> int:
+    return film["film_id"] if isinstance(film, dict) else film.film_id
+
+
+def validation_message(error: ValidationError) -> str:
+    """A validation error as one line: ``field: message; ...``."""
+    return "; ".join(
+        f"{'.'.join(str(part) for part in detail['loc']) or 'film'}: {detail['msg']}"
+        for detail in error.errors()
+    )
+
+
+# Film columns written by bulk creates and replacements
+BULK_FILM_COLUMNS = tuple(name for name in CreateFilmRequest.model_fields)
+
 
 class FilmService:
     """Service class for film operations."""
@@ -20,17 +46,40 @@ class FilmService:
         self.film_repository = film_repository
         self.logger = get_logger(__name__)
 
-    async def get_films(self, page: int = 1, page_size: int = 10, category: Optional[str] = None) -> FilmListResponse:
+    async def get_films(
+        self,
+        page: int = 1,
+        page_size: int = 10,
+        category: Optional[str] = None,
+        cursor: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None,
+        film_filter: Optional[FilmFilter] = None,
+        include_total: bool = False
+    ) -> Union[FilmListResponse, Dict[str, Any]]:
         """
-        Get paginated films with optional category filter.
+        Get paginated films with optional category and column filters.
+        
+        When a cursor is given the page is located with a keyset seek on
+        film_id instead of an offset, and ``page`` is ignored. Counting the
+        matches costs more than seeking a deep page, so keyset pages leave
+        ``total`` unset unless ``include_total`` is given; clients take it
+        from the first page.
         
         Args:
             page: Page number (1-based)
             page_size: Number of records per page
-            category: Optional category name to filter by
+            category: Optional category name or ID to filter by
+            cursor: Optional opaque cursor from a previous response
+            fields: Optional sparse fieldset; only these columns are selected
+            film_filter: Optional column criteria (rating, length range, ...)
+            include_total: Also count the matching films on a keyset page
             
         Returns:
-            Tuple of (films, total_count)
+            Paginated film list response, or the same structure as a plain
+            dict holding only the requested film fields
+            
+        Raises:
+            ValueError: If the cursor is malformed
         """
         # Convert page-based pagination to skip/limit for repository
         skip = (page - 1) * page_size
@@ -39,16 +88,33 @@ class FilmService:
         start_time = time.time()
         
         try:
-            self.logger.debug("Getting films", skip=skip, limit=page_size)
-            
-            films, total_count = await self.film_repository.get_films_paginated(
-                skip=skip, 
-                limit=page_size, 
-                category=category
-            )
-            
-            # Convert to response models efficiently
-            film_responses = convert_films_to_responses(films)
+            if cursor is not None:
+                after_film_id = decode_cursor(cursor)
+                self.logger.debug("Getting films after cursor", after_film_id=after_film_id, limit=page_size)
+                
+                films, has_more = await self.film_repository.get_films_after(
+                    after_film_id=after_film_id,
+                    limit=page_size,
+                    category=category,
+                    fields=fields,
+                    film_filter=film_filter
+                )
+                total_count = (
+                    await self.film_repository.count_films(category, film_filter) if include_total else None
+                )
+            else:
+                self.logger.debug("Getting films", skip=skip, limit=page_size)
+                
+                films, total_count = await self.film_repository.get_films_paginated(
+                    skip=skip, 
+                    limit=page_size, 
+                    category=category,
+                    fields=fields,
+                    film_filter=film_filter
+                )
+                has_more = skip + len(films) < total_count
+            
+            next_cursor = encode_cursor(_film_id(films[-1])) if films and has_more else None
             
             duration = time.time() - start_time
             log_service_operation(
@@ -58,17 +124,33 @@ class FilmService:
                 duration=duration,
                 skip=skip,
                 limit=page_size,
+                cursor=cursor,
+                fields=fields,
+                film_filter=film_filter.cache_key() if film_filter else None,
                 count=len(films),
                 total_count=total_count
             )
+            
+            if fields is not None:
+                return {
+                    "films": films,
+                    "total": total_count,
+                    "page": page,
+                    "page_size": page_size,
+                    "next_cursor": next_cursor
+                }
 
+            # Convert to response models efficiently
             return FilmListResponse(
-                films=film_responses,
+                films=convert_films_to_responses(films),
                 total=total_count,
                 page=page,
-                page_size=page_size
+                page_size=page_size,
+                next_cursor=next_cursor
             )
             
+        except ValueError:
+            raise
         except Exception as e:
             duration = time.time() - start_time
             self.logger.error(
@@ -83,29 +165,118 @@ class FilmService:
             )
             raise
     
-    async def get_film(self, film_id: int) -> Optional[FilmResponse]:
+    async def search_films(
+        self,
+        query: str,
+        page: int = 1,
+        page_size: int = 10,
+        mode: str = "fulltext"
+    ) -> FilmListResponse:
+        """
+        Ranked search over films.
+        
+        ``fulltext`` mode ranks title and description matches in Postgres.
+        ``index`` mode scores title, description, actor and category terms
+        with the in-process BM25 index (treating the last term as a prefix)
+        and only hydrates the requested page of films from the database; it
+        falls back to ``fulltext`` while the index is not loaded.
+        
+        Args:
+            query: Search query
+            page: Page number (1-based)
+            page_size: Number of records per page
+            mode: "fulltext" or "index"
+            
+        Returns:
+            Paginated film list response, best matches first
+        """
+        skip = (page - 1) * page_size
+        start_time = time.time()
+        
+        try:
+            if mode == "index":
+                await film_search_index.ensure_fresh()
+            if mode == "index" and not film_search_index.is_loaded:
+                self.logger.warning("Film search index not loaded, falling back to full-text search")
+                mode = "fulltext"
+            
+            self.logger.debug("Searching films", query=query, mode=mode, skip=skip, limit=page_size)
+            
+            if mode == "index":
+                ranked, total_count = film_search_index.search(query, limit=skip + page_size)
+                page_ids = [film_id for film_id, _ in ranked[skip:]]
+                films_by_id = {
+                    film.film_id: film
+                    for film in await self.film_repository.get_films_by_ids(page_ids)
+                }
+                films = [films_by_id[film_id] for film_id in page_ids if film_id in films_by_id]
+            else:
+                films, total_count = await self.film_repository.search_films_fulltext(
+                    query, skip=skip, limit=page_size
+                )
+            
+            film_responses = convert_films_to_responses(films)
+            
+            duration = time.time() - start_time
+            log_service_operation(
+                logger=self.logger,
+                service="FilmService",
+                operation="search_films",
+                duration=duration,
+                query=query,
+                mode=mode,
+                count=len(films),
+                total_count=total_count
+            )
+            
+            return FilmListResponse(
+                films=film_responses,
+                total=total_count,
+                page=page,
+                page_size=page_size
+            )
+            
+        except Exception as e:
+            duration = time.time() - start_time
+            self.logger.error(
+                "Service operation failed",
+                service="FilmService",
+                operation="search_films",
+                query=query,
+                error=str(e),
+                duration_ms=round(duration * 1000, 2),
+                exc_info=True
+            )
+            raise
+    
+    async def get_film(
+        self, film_id: int, fields: Optional[Sequence[str]] = None
+    ) -> Union[FilmResponse, Dict[str, Any], None]:
         """
-        Get a film by ID.
+        Get a film by ID, read through the shared film cache.
         
         Args:
             film_id: Film ID
+            fields: Optional sparse fieldset; selects only these columns and
+                bypasses the cache
             
         Returns:
-            Film if found, None otherwise
+            Film (a dict of the requested fields when given) if found, None otherwise
         """
         start_time = time.time()
         
         try:
-            self.logger.debug("Getting film by ID", film_id=film_id)
+            self.logger.debug("Getting film by ID", film_id=film_id, fields=fields)
             
-            film = await self.film_repository.get_film_by_id(film_id)
+            if fields is not None:
+                response = await self.film_repository.get_film_fields(film_id, fields)
+            else:
+                response = await film_cache.get_or_load(str(film_id), lambda: self._load_film(film_id))
             
-            if not film:
+            if not response:
                 self.logger.warning("Film not found", film_id=film_id)
                 return None
             
-            response = convert_film_to_response(film)
-            
             duration = time.time() - start_time
             log_service_operation(
                 logger=self.logger,
@@ -131,6 +302,172 @@ class FilmService:
             )
             raise
     
+    async def _load_film(self, film_id: int) -> Optional[FilmResponse]:
+        film = await self.film_repository.get_film_by_id(film_id)
+        return convert_film_to_response(film) if film else None
+    
+    async def get_film_detail(self, film_id: int) -> Optional[FilmDetailResponse]:
+        """
+        Get a film with its actors and categories.
+        
+        The database builds the whole document in one statement and the JSON
+        text is validated directly into the response model, without
+        hydrating ORM entities for the film, actors or categories.
+        
+        Args:
+            film_id: Film ID
+            
+        Returns:
+            Film detail if found, None otherwise
+        """
+        start_time = time.time()
+        
+        try:
+            document = await self.film_repository.get_film_detail_json(film_id)
+            if document is None:
+                self.logger.warning("Film not found", film_id=film_id)
+                return None
+            
+            detail = FilmDetailResponse.model_validate_json(document)
+            
+            duration = time.time() - start_time
+            log_service_operation(
+                logger=self.logger,
+                service="FilmService",
+                operation="get_film_detail",
+                duration=duration,
+                film_id=film_id,
+                actors=len(detail.actors),
+                categories=len(detail.categories)
+            )
+            
+            return detail
+            
+        except Exception as e:
+            duration = time.time() - start_time
+            self.logger.error(
+                "Service operation failed",
+                service="FilmService",
+                operation="get_film_detail",
+                film_id=film_id,
+                error=str(e),
+                duration_ms=round(duration * 1000, 2),
+                exc_info=True
+            )
+            raise
+    
+    async def get_films_by_ids(
+        self, film_ids: List[int], fields: Optional[Sequence[str]] = None
+    ) -> Union[FilmBatchResponse, Dict[str, Any]]:
+        """
+        Get several films by ID with one query.
+        
+        Args:
+            film_ids: Film IDs; duplicates are returned once
+            fields: Optional sparse fieldset; only these columns are selected
+            
+        Returns:
+            Films in request order, plus the IDs that do not exist (as a plain
+            dict when fields are given)
+        """
+        start_time = time.time()
+        requested = list(dict.fromkeys(film_ids))
+        
+        try:
+            self.logger.debug("Getting films by IDs", count=len(requested))
+            
+            films_by_id = {
+                _film_id(film): film
+                for film in await self.film_repository.get_films_by_ids(requested, fields=fields)
+            }
+            films = [films_by_id[film_id] for film_id in requested if film_id in films_by_id]
+            missing_ids = [film_id for film_id in requested if film_id not in films_by_id]
+            
+            duration = time.time() - start_time
+            log_service_operation(
+                logger=self.logger,
+                service="FilmService",
+                operation="get_films_by_ids",
+                duration=duration,
+                requested=len(requested),
+                count=len(films),
+                missing=len(missing_ids)
+            )
+            
+            if fields is not None:
+                return {"films": films, "missing_ids": missing_ids}
+            return FilmBatchResponse(films=convert_films_to_responses(films), missing_ids=missing_ids)
+            
+        except Exception as e:
+            duration = time.time() - start_time
+            self.logger.error(
+                "Service operation failed",
+                service="FilmService",
+                operation="get_films_by_ids",
+                requested=len(requested),
+                error=str(e),
+                duration_ms=round(duration * 1000, 2),
+                exc_info=True
+            )
+            raise
+    
+    async def get_facets(
+        self, category: Optional[str] = None, film_filter: Optional[FilmFilter] = None
+    ) -> FilmFacetsResponse:
+        """
+        Get film counts per rating, category, language and streaming
+        availability for the films a listing with the same filters returns.
+        
+        Results are cached by filter signature. Film writes invalidate the
+        cache. The API never writes film_category, so link changes made in
+        the database are not seen until the entry expires
+        (``settings.cache_ttl_seconds``), unless the category index is
+        invalidated: the shared category version is part of the key, so
+        ``category_index.invalidate()`` (run by the admin reference data
+        hook) retires every entry at once.
+        
+        Args:
+            category: Optional category name or ID to filter by
+            film_filter: Optional column criteria (rating, length range, ...)
+            
+        Returns:
+            Facet counts; every facet is empty for an unknown category
+        """
+        start_time = time.time()
+        
+        category_id = await self.film_repository.resolve_category(category) if category else None
+        if category and category_id is None:
+            return FilmFacetsResponse(total=0, rating=[], category=[], language=[], streaming_available=[])
+        
+        signature = (
+            f"c{await category_cache.version.get()}:category={category_id if category_id is not None else ''}"
+            f"&{film_filter.cache_key() if film_filter else ''}"
+        )
+        facets = await facet_cache.get_or_load(signature, lambda: self._load_facets(category_id, film_filter))
+        
+        log_service_operation(
+            logger=self.logger,
+            service="FilmService",
+            operation="get_facets",
+            duration=time.time() - start_time,
+            category=category,
+            total=facets.total
+        )
+        return facets
+    
+    async def _load_facets(self, category_id: Optional[int], film_filter: Optional[FilmFilter]) -> FilmFacetsResponse:
+        counts: Dict[str, List[FacetCount]] = {"rating": [], "category": [], "language": [], "streaming_available": []}
+        total = 0
+        for facet, value, name, count in await self.film_repository.get_facet_counts(category_id, film_filter):
+            if facet == "total":
+                total = count
+                continue
+            counts[facet].append(FacetCount(value=value, name=name, count=count))
+        
+        for values in counts.values():
+            values.sort(key=lambda facet_count: (-facet_count.count, str(facet_count.value)))
+        return FilmFacetsResponse(total=total, **counts)
+    
     async def create_film(self, film_data: CreateFilmRequest) -> FilmCreateResponse:
         """
         Create a new film.
@@ -172,12 +509,17 @@ class FilmService:
                 rating=rating_enum,
                 last_update=None,
                 special_features=film_data.special_features,
-                fulltext="",
                 streaming_available=film_data.streaming_available or False
             )
             
             # Create film through repository
             created_film = await self.film_repository.create_film(film)
+            film_search_index.upsert(created_film.film_id, created_film.title, created_film.description)
+            await film_search_index.changed()
+            await response_cache.purge(FILMS_LIST)
+            await facet_cache.invalidate()
+            await catalog_versions.films_changed()
+            catalog_view_refresher.request()
             
             response = FilmCreateResponse(
                 film_id=created_film.film_id or 0,
@@ -209,6 +551,132 @@ class FilmService:
             )
             raise
     
+    async def create_films(self, items: List[Dict[str, Any]]) -> FilmBulkResponse:
+        """
+        Create films, or replace them when an item carries a film_id, in bulk.
+        
+        Items are validated individually; invalid items, unknown languages
+        and unknown film IDs are reported without being sent to the
+        database. The rest is written ``settings.film_bulk_batch_size`` rows
+        per multi-row statement and committed per batch, with ``fulltext``
+        computed by the database. A row the database rejects fails alone
+        (see ``FilmRepository.write_films_isolated``).
+        
+        Args:
+            items: Raw film records, in request order
+            
+        Returns:
+            Counts, the film ID of every item (None where it failed) and the errors
+        """
+        start_time = time.time()
+        film_ids: List[Optional[int]] = [None] * len(items)
+        errors: List[FilmBulkError] = []
+        
+        try:
+            self.logger.debug("Bulk writing films", count=len(items))
+            
+            valid: List[Tuple[int, FilmBulkItem]] = []
+            for index, item in enumerate(items):
+                try:
+                    valid.append((index, FilmBulkItem.model_validate(item)))
+                except ValidationError as e:
+                    film_id = item.get("film_id") if isinstance(item, dict) else None
+                    errors.append(FilmBulkError(
+                        index=index, film_id=film_id if isinstance(film_id, int) else None, error=validation_message(e)
+                    ))
+            
+            unknown_languages = await self.film_repository.unknown_language_ids(
+                sorted({film.language_id for _, film in valid})
+            )
+            existing = await self.film_repository.existing_film_ids(
+                [film.film_id for _, film in valid if film.film_id is not None]
+            )
+            
+            creates: List[Tuple[int, Dict[str, Any]]] = []
+            updates: List[Tuple[int, Dict[str, Any]]] = []
+            for index, film in valid:
+                if film.language_id in unknown_languages:
+                    errors.append(FilmBulkError(index=index, film_id=film.film_id, error=f"Unknown language_id {film.language_id}"))
+                elif film.film_id is not None and film.film_id not in existing:
+                    errors.append(FilmBulkError(index=index, film_id=film.film_id, error=f"Film with ID {film.film_id} not found"))
+                else:
+                    row = film.model_dump(include=set(BULK_FILM_COLUMNS))
+                    if film.film_id is None:
+                        creates.append((index, row))
+                    else:
+                        updates.append((index, {**row, "film_id": film.film_id}))
+            
+            created = await self._write_films_in_batches(self.film_repository.insert_films, creates, film_ids, errors)
+            updated = await self._write_films_in_batches(self.film_repository.update_films, updates, film_ids, errors)
+            
+            if created or updated:
+                for index, row in creates + updates:
+                    if film_ids[index] is not None:
+                        film_search_index.upsert(film_ids[index], row["title"], row["description"])
+                await film_search_index.changed()
+                updated_ids = [film_ids[index] for index, _ in updates if film_ids[index] is not None]
+                await response_cache.purge(FILMS_LIST, *(film_key(film_id) for film_id in updated_ids))
+                await film_cache.discard(*(str(film_id) for film_id in updated_ids))
+                await facet_cache.invalidate()
+                await catalog_versions.films_changed()
+                catalog_view_refresher.request()
+            
+            errors.sort(key=lambda error: error.index)
+            
+            duration = time.time() - start_time
+            log_service_operation(
+                logger=self.logger,
+                service="FilmService",
+                operation="create_films",
+                duration=duration,
+                count=len(items),
+                created=created,
+                updated=updated,
+                failed=len(errors)
+            )
+            
+            return FilmBulkResponse(
+                created=created,
+                updated=updated,
+                failed=len(errors),
+                film_ids=film_ids,
+                errors=errors
+            )
+            
+        except Exception as e:
+            duration = time.time() - start_time
+            self.logger.error(
+                "Service operation failed",
+                service="FilmService",
+                operation="create_films",
+                count=len(items),
+                error=str(e),
+                duration_ms=round(duration * 1000, 2),
+                exc_info=True
+            )
+            raise
+    
+    async def _write_films_in_batches(
+        self,
+        write,
+        rows: List[Tuple[int, Dict[str, Any]]],
+        film_ids: List[Optional[int]],
+        errors: List[FilmBulkError]
+    ) -> int:
+        """Write (index, row) pairs batch by batch, recording film IDs and errors by index; returns rows written."""
+        written = 0
+        batch_size = settings.film_bulk_batch_size
+        for start in range(0, len(rows), batch_size):
+            batch = rows[start:start + batch_size]
+            results = await self.film_repository.write_films_isolated(write, [row for _, row in batch])
+            for (index, row), (film_id, error) in zip(batch, results):
+                if error is None:
+                    film_ids[index] = film_id
+                    written += 1
+                else:
+                    errors.append(FilmBulkError(index=index, film_id=row.get("film_id"), error=error))
+        return written
+    
     async def update_film(self, film_id: int, film_data: UpdateFilmRequest) -> Optional[FilmResponse]:
         """
         Update an existing film.
@@ -239,6 +707,13 @@ class FilmService:
             
             # Update through repository
             updated_film = await self.film_repository.update_film(film)
+            film_search_index.upsert(updated_film.film_id, updated_film.title, updated_film.description)
+            await film_search_index.changed()
+            await response_cache.purge(film_key(film_id), FILMS_LIST)
+            await film_cache.discard(str(film_id))
+            await facet_cache.invalidate()
+            await catalog_versions.films_changed()
+            catalog_view_refresher.request()
             
             response = convert_film_to_response(updated_film)
             
@@ -282,6 +757,15 @@ class FilmService:
             self.logger.debug("Deleting film", film_id=film_id)
             
             deleted = await self.film_repository.delete_film(film_id)
+            if deleted:
+                category_index.remove_film(film_id)
+                film_search_index.remove(film_id)
+                await film_search_index.changed()
+                await response_cache.purge(film_key(film_id), FILMS_LIST)
+                await film_cache.discard(str(film_id))
+                await facet_cache.invalidate()
+                await catalog_versions.films_changed()
+                catalog_view_refresher.request()
             
             duration = time.time() - start_time
             log_service_operation(
@@ -43,7 +43,7 @@ class RentalService:
         self.logger.debug("Creating rental", customer_id=customer_id, inventory_id=rental_data.inventory_id)
         
         # Validate customer exists
-        customer = await self.customer_repository.get_customer_by_id(customer_id)
+        customer = await self.customer_repository.get_customer_snapshot(customer_id)
         if not customer:
             self.logger.error("Customer not found for rental", customer_id=customer_id)
             raise ValueError(f"Customer with ID {customer_id} not found")
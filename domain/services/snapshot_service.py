@@ -0,0 +1,311 @@
+"""
+Service layer for columnar (Parquet / Arrow IPC) analytics snapshots.
+"""
+
+import json
+import os
+import shutil
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Sequence, Type
+
+import anyio
+from sqlalchemy import select, types
+from sqlalchemy.dialects.postgresql import ARRAY, DOMAIN, ENUM, TSVECTOR
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import SQLModel
+
+from core.config import settings
+from core.db import get_engine_and_session_factory
+from core.logging import get_logger, log_service_operation
+from domain.entities import Film, Inventory, Payment, Rental
+
+# Tables included in a snapshot, in write order
+SNAPSHOT_TABLES: Dict[str, Type[SQLModel]] = {
+    "film": Film,
+    "inventory": Inventory,
+    "rental": Rental,
+    "payment": Payment,
+}
+
+SNAPSHOT_FORMATS = {"parquet": "parquet", "arrow": "arrow"}  # format -> file extension
+
+MANIFEST_FILE = "_manifest.json"
+
+
+def _pyarrow():
+    try:
+        import pyarrow
+    except ImportError as e:
+        raise ImportError(
+            "Snapshots need the 'pyarrow' package, which is not installed (pip install \".[analytics]\")"
+        ) from e
+    return pyarrow
+
+
+def _arrow_type(pa, column_type: types.TypeEngine):
+    """Arrow type for a SQLAlchemy column type."""
+    if isinstance(column_type, DOMAIN):
+        return _arrow_type(pa, column_type.data_type)
+    if isinstance(column_type, ARRAY):
+        return pa.list_(_arrow_type(pa, column_type.item_type))
+    if isinstance(column_type, (ENUM, types.String)):
+        return pa.string()
+    if isinstance(column_type, types.Boolean):
+        return pa.bool_()
+    if isinstance(column_type, types.SmallInteger):
+        return pa.int16()
+    if isinstance(column_type, types.BigInteger):
+        return pa.int64()
+    if isinstance(column_type, types.Integer):
+        return pa.int32()
+    if isinstance(column_type, types.Float):
+        return pa.float64()
+    if isinstance(column_type, types.Numeric):
+        return pa.decimal128(column_type.precision or 38, column_type.scale or 0)
+    if isinstance(column_type, types.DateTime):
+        return pa.timestamp("us", tz="UTC" if column_type.timezone else None)
+    if isinstance(column_type, types.Date):
+        return pa.date32()
+    raise TypeError(f"No Arrow type for column type {column_type!r}")
+
+
+def snapshot_columns(table: str) -> List[Any]:
+    """Columns of a snapshot table (search vectors are derived data and left out)."""
+    return [column for column in SNAPSHOT_TABLES[table].__table__.c if not isinstance(column.type, TSVECTOR)]
+
+
+def arrow_schema(table: str):
+    """
+    Arrow schema for a snapshot table, derived from its entity.
+
+    Args:
+        table: Key of SNAPSHOT_TABLES
+
+    Returns:
+        pyarrow.Schema
+    """
+    pa = _pyarrow()
+    return pa.schema([
+        pa.field(column.name, _arrow_type(pa, column.type), nullable=column.nullable)
+        for column in snapshot_columns(table)
+    ])
+
+
+def new_snapshot_id() -> str:
+    """Sortable, filesystem-safe snapshot ID (UTC timestamp)."""
+    return datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S%fZ")
+
+
+class _PartitionedWriter:
+    """Writes rows as record batches to ``part-NNNNN`` files of at most ``rows_per_file`` rows."""
+
+    def __init__(self, directory: str, schema, file_format: str, rows_per_file: int):
+        self.directory = directory
+        self.schema = schema
+        self.file_format = file_format
+        self.rows_per_file = rows_per_file
+        self.files: List[str] = []
+        self.rows = 0
+        self._writer = None
+        self._file_rows = 0
+
+    def write(self, rows: Sequence[Sequence[Any]]) -> None:
+        """Append rows (tuples in schema order) as one record batch."""
+        pa = _pyarrow()
+        batch = pa.RecordBatch.from_arrays(
+            [pa.array(values, type=field.type) for values, field in zip(zip(*rows), self.schema)],
+            schema=self.schema
+        )
+        offset = 0
+        while offset < batch.num_rows:
+            if self._writer is None or self._file_rows >= self.rows_per_file:
+                self._open()
+            piece = batch.slice(offset, self.rows_per_file - self._file_rows)
+            self._writer.write_batch(piece)
+            self._file_rows += piece.num_rows
+            self.rows += piece.num_rows
+            offset += piece.num_rows
+
+    def close(self) -> None:
+        if self._writer is None:
+            # Empty tables still get a (schema-only) file
+            self._open()
+        self._writer.close()
+        self._writer = None
+
+    def _open(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+
+        path = os.path.join(self.directory, f"part-{len(self.files):05d}.{SNAPSHOT_FORMATS[self.file_format]}")
+        if self.file_format == "parquet":
+            import pyarrow.parquet as pq
+            self._writer = pq.ParquetWriter(path, self.schema, compression="zstd")
+        else:
+            pa = _pyarrow()
+            self._writer = pa.ipc.new_file(path, self.schema, options=pa.ipc.IpcWriteOptions(compression="zstd"))
+        self.files.append(path)
+        self._file_rows = 0
+
+
+class SnapshotService:
+    """
+    Writes consistent columnar snapshots of the rental data for analytics.
+
+    Each table is read through a server-side cursor in batches of
+    ``SNAPSHOT_BATCH_SIZE`` rows; every batch becomes one Arrow record batch
+    (a Parquet row group, or an IPC batch), so memory is bounded by the batch
+    size. All tables are read in one REPEATABLE READ transaction, so the
+    snapshot is consistent across tables. A snapshot is complete once its
+    manifest has been written.
+    """
+
+    def __init__(self, session_factory=None, snapshot_dir: Optional[str] = None):
+        self._session_factory = session_factory
+        self.snapshot_dir = snapshot_dir or settings.snapshot_dir
+        self.logger = get_logger(__name__)
+
+    @property
+    def session_factory(self):
+        if self._session_factory is None:
+            _, self._session_factory = get_engine_and_session_factory("film")
+        return self._session_factory
+
+    def check_available(self) -> None:
+        """Raise ImportError if pyarrow is not installed."""
+        _pyarrow()
+
+    def snapshot_path(self, snapshot_id: str) -> str:
+        return os.path.join(self.snapshot_dir, snapshot_id)
+
+    def exists(self, snapshot_id: str) -> bool:
+        """Whether a snapshot has been started (its directory exists)."""
+        return os.path.isdir(self.snapshot_path(snapshot_id))
+
+    def get_manifest(self, snapshot_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Manifest of a completed snapshot.
+
+        Returns:
+            The manifest, or None if the snapshot does not exist or is still being written
+        """
+        try:
+            with open(os.path.join(self.snapshot_path(snapshot_id), MANIFEST_FILE)) as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+
+    async def create_snapshot(
+        self,
+        snapshot_id: Optional[str] = None,
+        file_format: Optional[str] = None,
+        tables: Optional[Sequence[str]] = None
+    ) -> Dict[str, Any]:
+        """
+        Snapshot tables with a dedicated session.
+
+        Args:
+            snapshot_id: Directory name under the snapshot dir (default: new_snapshot_id())
+            file_format: "parquet" or "arrow" (default: SNAPSHOT_FORMAT)
+            tables: Keys of SNAPSHOT_TABLES (default: all)
+
+        Returns:
+            The snapshot manifest
+        """
+        async with self.session_factory() as session:
+            await session.connection(
+                execution_options={"isolation_level": "REPEATABLE READ", "postgresql_readonly": True}
+            )
+            return await self.write_snapshot(session, snapshot_id, file_format, tables)
+
+    async def write_snapshot(
+        self,
+        session: AsyncSession,
+        snapshot_id: Optional[str] = None,
+        file_format: Optional[str] = None,
+        tables: Optional[Sequence[str]] = None
+    ) -> Dict[str, Any]:
+        """
+        Snapshot tables using ``session``.
+
+        Args:
+            session: Session to read with
+            snapshot_id: Directory name under the snapshot dir (default: new_snapshot_id())
+            file_format: "parquet" or "arrow" (default: SNAPSHOT_FORMAT)
+            tables: Keys of SNAPSHOT_TABLES (default: all)
+
+        Returns:
+            The snapshot manifest
+
+        Raises:
+            ValueError: For an unknown format or table
+            ImportError: If pyarrow is not installed
+        """
+        _pyarrow()
+        snapshot_id = snapshot_id or new_snapshot_id()
+        file_format = file_format or settings.snapshot_format
+        tables = list(tables or SNAPSHOT_TABLES)
+        if file_format not in SNAPSHOT_FORMATS:
+            raise ValueError(f"Unknown snapshot format: {file_format}")
+        unknown = [table for table in tables if table not in SNAPSHOT_TABLES]
+        if unknown:
+            raise ValueError(f"Unknown snapshot tables: {', '.join(unknown)}")
+
+        start_time = time.time()
+        path = self.snapshot_path(snapshot_id)
+        manifest: Dict[str, Any] = {
+            "snapshot_id": snapshot_id,
+            "format": file_format,
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "tables": {},
+        }
+
+        os.makedirs(path, exist_ok=True)
+        try:
+            for table in tables:
+                manifest["tables"][table] = await self._write_table(session, table, path, file_format)
+        except BaseException:
+            shutil.rmtree(path, ignore_errors=True)
+            raise
+
+        manifest["duration_seconds"] = round(time.time() - start_time, 3)
+        with open(os.path.join(path, MANIFEST_FILE), "w") as f:
+            json.dump(manifest, f, indent=2)
+
+        log_service_operation(
+            logger=self.logger,
+            service="SnapshotService",
+            operation="write_snapshot",
+            duration=time.time() - start_time,
+            snapshot_id=snapshot_id,
+            format=file_format,
+            rows={table: info["rows"] for table, info in manifest["tables"].items()}
+        )
+        return manifest
+
+    async def _write_table(self, session: AsyncSession, table: str, path: str, file_format: str) -> Dict[str, Any]:
+        schema = arrow_schema(table)
+        directory = os.path.join(path, table)
+        os.makedirs(directory, exist_ok=True)
+        writer = _PartitionedWriter(directory, schema, file_format, settings.snapshot_rows_per_file)
+
+        model = SNAPSHOT_TABLES[table]
+        query = (
+            select(*snapshot_columns(table))
+            .order_by(*model.__table__.primary_key.columns)
+            .execution_options(yield_per=settings.snapshot_batch_size)
+        )
+        result = await session.stream(query)
+        try:
+            async for rows in result.partitions():
+                # Building and encoding the batch is CPU-bound; keep it off the event loop
+                await anyio.to_thread.run_sync(writer.write, rows)
+        finally:
+            writer.close()
+
+        return {
+            "rows": writer.rows,
+            "files": [os.path.relpath(file, path) for file in writer.files],
+            "bytes": sum(os.path.getsize(file) for file in writer.files),
+        }
@@ -0,0 +1,105 @@
+"""
+Service layer for admin bulk table exports via Postgres COPY.
+"""
+
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, Type
+
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlmodel import SQLModel
+
+from core.config import settings
+from core.db import get_engine_and_session_factory
+from core.logging import get_logger, log_service_operation
+from core.pg_copy import copy_query_csv
+from domain.entities import Film, Payment, Rental
+
+# Tables that may be exported, by URL name
+EXPORT_TABLES: Dict[str, Type[SQLModel]] = {
+    "film": Film,
+    "rental": Rental,
+    "payment": Payment,
+}
+
+
+def export_query(table: str) -> str:
+    """
+    SQL for a full-table export, ordered by primary key.
+
+    Search vectors (tsvector) are derived data and left out.
+
+    Args:
+        table: Key of EXPORT_TABLES
+
+    Returns:
+        SELECT statement rendered for Postgres
+
+    Raises:
+        ValueError: If the table is not exportable
+    """
+    model = EXPORT_TABLES.get(table)
+    if model is None:
+        raise ValueError(f"Unknown export table: {table}")
+
+    columns = [column for column in model.__table__.c if not isinstance(column.type, TSVECTOR)]
+    query = select(*columns).order_by(*model.__table__.primary_key.columns)
+    return str(query.compile(dialect=postgresql.dialect()))
+
+
+class TableExportService:
+    """
+    Streams whole tables as CSV straight from Postgres.
+
+    Rows never pass through SQLAlchemy or the response models: the COPY
+    output is relayed byte-for-byte, so this is the path for large pulls
+    where ORM exports would spend most of their time building objects.
+    """
+
+    def __init__(self, engine=None):
+        self._engine = engine
+        self.logger = get_logger(__name__)
+
+    @property
+    def engine(self):
+        if self._engine is None:
+            self._engine, _ = get_engine_and_session_factory("film")
+        return self._engine
+
+    @asynccontextmanager
+    async def csv(self, table: str) -> AsyncIterator[AsyncIterator[bytes]]:
+        """
+        Stream a table as CSV with a header row.
+
+        Use as ``async with service.csv(table) as chunks`` (see
+        ``core.streaming.ContextStreamingResponse``).
+
+        Args:
+            table: Key of EXPORT_TABLES
+
+        Yields:
+            CSV bytes as produced by COPY
+        """
+        query = export_query(table)
+        start_time = time.time()
+        size = 0
+
+        async def counted(chunks: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+            nonlocal size
+            async for chunk in chunks:
+                size += len(chunk)
+                yield chunk
+
+        async with copy_query_csv(self.engine, query, settings.copy_export_max_pending_chunks) as chunks:
+            yield counted(chunks)
+
+        log_service_operation(
+            logger=self.logger,
+            service="TableExportService",
+            operation="csv",
+            duration=time.time() - start_time,
+            table=table,
+            bytes=size
+        )
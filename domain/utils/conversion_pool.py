@@ -0,0 +1,96 @@
+"""
+Process pool that serialises large row sets to JSON off the event loop.
+
+Model validation and JSON encoding are pure Python and hold the GIL, so
+threads give them no parallelism. Worker processes do, but shipping
+pydantic models back costs about as much to unpickle as validating them
+inline did, so the pool only takes work whose result is bytes: plain row
+tuples go in, NDJSON comes out.
+"""
+
+from typing import Any, Dict, Sequence, Tuple, Type
+
+import anyio
+import anyio.to_process
+from anyio.lowlevel import RunVar
+from pydantic import BaseModel
+
+from core.config import settings
+from core.logging import get_logger
+from core.metrics import register_metrics
+
+logger = get_logger(__name__)
+
+# Worker processes belong to an event loop, so the limiter sharing them out does too
+_limiter: RunVar[anyio.CapacityLimiter] = RunVar("conversion_pool_limiter")
+
+
+def render_json_lines(model: Type[BaseModel], field_names: Tuple[str, ...], rows: Sequence[tuple]) -> bytes:
+    """
+    Validate row tuples as ``model`` and serialise them as NDJSON.
+
+    Runs in the worker processes, and inline when no pool is configured.
+
+    Args:
+        model: Pydantic model each row is validated as
+        field_names: Field name of each position in a row
+        rows: Plain tuples of column values
+
+    Returns:
+        One JSON line per row, each ending in a newline
+    """
+    validate = model.model_validate
+    # The same serializer call as the film fragment cache, so pooled and inline lines are identical
+    serialize = model.__pydantic_serializer__.to_json
+    return b"".join([serialize(validate(dict(zip(field_names, row)))) + b"\n" for row in rows])
+
+
+class ConversionPool:
+    """
+    Process pool for CPU-bound serialisation of large exports.
+
+    Disabled while ``settings.convert_process_workers`` is 0. Batches run on
+    anyio's worker processes, at most that many at a time. Workers start on
+    first use as fresh interpreters rather than forks, as the server process
+    runs an event loop and other threads that a fork would copy mid-flight;
+    anyio stops them once idle for a few minutes and when the event loop
+    closes.
+    """
+
+    def __init__(self):
+        self._batches = 0
+        self._rows = 0
+
+    @property
+    def enabled(self) -> bool:
+        return settings.convert_process_workers > 0
+
+    def _get_limiter(self) -> anyio.CapacityLimiter:
+        try:
+            return _limiter.get()
+        except LookupError:
+            limiter = anyio.CapacityLimiter(settings.convert_process_workers)
+            _limiter.set(limiter)
+            logger.info("Started conversion process pool", workers=settings.convert_process_workers)
+            return limiter
+
+    async def render_json_lines(
+        self, model: Type[BaseModel], field_names: Tuple[str, ...], rows: Sequence[tuple]
+    ) -> bytes:
+        """Serialise row tuples as NDJSON in a worker process (see ``render_json_lines``)."""
+        self._batches += 1
+        self._rows += len(rows)
+        return await anyio.to_process.run_sync(
+            render_json_lines, model, field_names, rows, limiter=self._get_limiter()
+        )
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "workers": settings.convert_process_workers,
+            "batches": self._batches,
+            "rows": self._rows,
+        }
+
+
+conversion_pool = ConversionPool()
+register_metrics("conversion_pool", conversion_pool.stats)
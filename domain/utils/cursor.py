@@ -0,0 +1,46 @@
+"""
+Opaque pagination cursors for keyset pagination.
+"""
+
+import base64
+import json
+
+
+def encode_cursor(film_id: int) -> str:
+    """
+    Encode the last seen film ID as an opaque cursor.
+    
+    Args:
+        film_id: ID of the last film on the current page
+        
+    Returns:
+        URL-safe cursor string
+    """
+    payload = json.dumps({"film_id": film_id}, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(payload).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> int:
+    """
+    Decode a cursor produced by encode_cursor.
+    
+    Args:
+        cursor: Cursor string from a previous response
+        
+    Returns:
+        The last seen film ID
+        
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        film_id = payload["film_id"]
+    except (ValueError, KeyError, TypeError) as e:
+        raise ValueError("Invalid pagination cursor") from e
+    
+    if not isinstance(film_id, int) or isinstance(film_id, bool) or film_id < 0:
+        raise ValueError("Invalid pagination cursor")
+    
+    return film_id
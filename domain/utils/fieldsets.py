@@ -0,0 +1,34 @@
+"""
+Sparse fieldsets (``fields=`` query parameter) for film responses.
+"""
+
+from typing import Optional, Tuple
+
+from domain.models.responses.film import FilmResponse
+
+# Fields a client may request; film_id is always returned
+FILM_FIELDS = tuple(FilmResponse.model_fields)
+
+
+def parse_film_fields(fields: Optional[str]) -> Optional[Tuple[str, ...]]:
+    """
+    Parse a comma-separated ``fields=`` value into FilmResponse field names.
+    
+    Args:
+        fields: Raw parameter value, e.g. ``"title,rating"``
+        
+    Returns:
+        Requested field names in order with film_id first, or None for all fields
+        
+    Raises:
+        ValueError: If a field is not part of FilmResponse
+    """
+    if fields is None:
+        return None
+    
+    requested = [name.strip() for name in fields.split(",") if name.strip()]
+    unknown = [name for name in requested if name not in FILM_FIELDS]
+    if unknown:
+        raise ValueError(f"Unknown film fields: {', '.join(unknown)}. Available: {', '.join(FILM_FIELDS)}")
+    
+    return tuple(dict.fromkeys(["film_id", *requested]))
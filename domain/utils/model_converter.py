@@ -2,22 +2,167 @@
 Utility functions for converting between SQLModel models and Pydantic schemas.
 """
 
-from typing import TypeVar, Generic, Type, List, Dict, Any, Callable
+import enum
+import typing
+from typing import TypeVar, Generic, Type, List, Dict, Any, Callable, Optional
 from pydantic import BaseModel
 from decimal import Decimal
+from sqlalchemy import inspect as sa_inspect
+from sqlalchemy import types as sa_types
+from sqlalchemy.exc import NoInspectionAvailable
 from sqlmodel import SQLModel
-import asyncio
+import anyio
+
+from core.config import settings
 
 T = TypeVar('T', bound=BaseModel)
 
+# Builds the complete field dict of one target model from a source object and extra fields
+FieldCopier = Callable[[Any, Dict[str, Any]], Dict[str, Any]]
+
+# Required target field that neither the source nor the extra fields supplied
+_MISSING = object()
+
+
+def _enum_class(annotation: Any) -> Optional[Type[enum.Enum]]:
+    """The Enum class of a field annotation (``MPAARating`` or ``Optional[MPAARating]``), if any."""
+    candidates = typing.get_args(annotation) if typing.get_origin(annotation) is typing.Union else (annotation,)
+    for candidate in candidates:
+        if isinstance(candidate, type) and issubclass(candidate, enum.Enum):
+            return candidate
+    return None
+
 
 class ModelConverter(Generic[T]):
-    """Generic model converter for efficient SQLModel to Pydantic conversion."""
+    """
+    Generic model converter for efficient SQLModel to Pydantic conversion.
+    
+    For every SQLModel table class it sees, the converter generates (once) a
+    function that builds the target's field dict with plain reads of the
+    loaded attribute values: relationship fields are dropped, Decimal
+    (NUMERIC) columns become float, enum-typed target fields get their Enum
+    member, and fields the entity lacks come from the extra fields or their
+    defaults, all decided from the mapper and the target annotations up
+    front instead of by probing each value. Other source objects go through
+    the generic attribute loop.
     
-    def __init__(self, pydantic_model: Type[T]):
+    Extra fields supply target fields the source object does not have (such
+    as ``language_name`` for films); they do not override copied columns.
+    
+    By default the field dict is validated with ``model_validate``. A
+    ``trusted`` converter builds models with ``model_construct`` instead,
+    skipping validation: only use it for objects loaded from the database,
+    whose column types already match the target.
+    """
+    
+    def __init__(self, pydantic_model: Type[T], trusted: Optional[bool] = None):
         self.pydantic_model = pydantic_model
+        # None follows settings.trusted_model_construct
+        self._trusted = trusted
         # Cache field names for better performance
-        self._field_names = set(pydantic_model.model_fields.keys())
+        self._field_names = list(pydantic_model.model_fields.keys())
+        self._copiers: Dict[type, FieldCopier] = {}
+    
+    @property
+    def trusted(self) -> bool:
+        return settings.trusted_model_construct if self._trusted is None else self._trusted
+    
+    def copier_for(self, source_type: type) -> FieldCopier:
+        """The field-copying function for a source class, compiled on first use."""
+        copier = self._copiers.get(source_type)
+        if copier is None:
+            copier = self._copiers[source_type] = self._compile(source_type)
+        return copier
+    
+    def _compile(self, source_type: type) -> FieldCopier:
+        try:
+            mapper = sa_inspect(source_type)
+        except NoInspectionAvailable:
+            return self._copy_generic
+        
+        columns = {attr.key: attr.columns[0] for attr in mapper.column_attrs}
+        relationships = set(mapper.relationships.keys())
+        namespace: Dict[str, Any] = {"_MISSING": _MISSING}
+        copied, required_extras = [], []
+        # model_fields order: serialization follows the order of the instance dict
+        for name, field in self.pydantic_model.model_fields.items():
+            if name in relationships or name not in columns:
+                if field.is_required():
+                    required_extras.append(name)
+                    continue
+                namespace[f"_{name}_default"] = field.get_default(call_default_factory=False)
+                value = f"extra.get({name!r}, _{name}_default)"
+                if field.default_factory is not None:
+                    namespace[f"_{name}_factory"] = field.default_factory
+                    value = f"extra[{name!r}] if {name!r} in extra else _{name}_factory()"
+                copied.append((name, value))
+                continue
+            
+            value = "{read}"
+            column_type = columns[name].type
+            enum_class = _enum_class(field.annotation)
+            if isinstance(column_type, sa_types.Numeric) and column_type.asdecimal:
+                value = f"None if (value := {value}) is None else float(value)"
+            elif enum_class is not None and getattr(column_type, "enum_class", None) is not enum_class:
+                namespace[f"_{name}_enum"] = enum_class
+                value = f"None if (value := {value}) is None else _{name}_enum(value)"
+            copied.append((name, value))
+        
+        def body(read: Callable[[str], str]) -> List[str]:
+            lines = ["    data = {"]
+            lines += [f"        {name!r}: {value.format(read=read(name))}," for name, value in copied]
+            lines += ["    }"]
+            for name in required_extras:
+                lines += [f"    if {name!r} in extra:", f"        data[{name!r}] = extra[{name!r}]"]
+            return lines + ["    return data"]
+        
+        source = "\n".join([
+            "def copy_loaded(values, extra):",
+            *body(lambda name: f"values[{name!r}]"),
+            "",
+            "def copy_attributes(obj, extra):",
+            *body(lambda name: f"obj.{name}"),
+            "",
+            "def copy_fields(obj, extra):",
+            "    try:",
+            "        return copy_loaded(obj.__dict__, extra)",
+            "    except KeyError:",
+            "        # Expired or deferred columns: read through the instrumented attributes, which load them",
+            "        return copy_attributes(obj, extra)",
+        ])
+        exec(compile(source, f"<{self.pydantic_model.__name__} from {source_type.__name__}>", "exec"), namespace)
+        return namespace["copy_fields"]
+    
+    def _copy_generic(self, sqlmodel_obj: Any, extra: Dict[str, Any]) -> Dict[str, Any]:
+        """Field copy for objects without a mapper, deciding per value."""
+        model_data = {}
+        for field_name, field in self.pydantic_model.model_fields.items():
+            value = getattr(sqlmodel_obj, field_name, _MISSING)
+            
+            # Handle SQLModel relationship objects
+            if hasattr(value.__class__, '__tablename__'):
+                value = _MISSING
+            
+            if value is _MISSING:
+                if field_name in extra:
+                    value = extra[field_name]
+                elif field.is_required():
+                    continue
+                else:
+                    value = field.get_default(call_default_factory=True)
+            
+            # Handle Decimal to float conversion automatically
+            if isinstance(value, Decimal):
+                value = float(value)
+            
+            model_data[field_name] = value
+        return model_data
+    
+    def _builder(self) -> Callable[[Dict[str, Any]], T]:
+        if not self.trusted:
+            return self.pydantic_model.model_validate
+        construct = self.pydantic_model.model_construct
+        return lambda model_data: construct(**model_data)
     
     def convert_single(self, sqlmodel_obj: Any, **extra_fields) -> T:
         """
@@ -30,29 +175,8 @@ class ModelConverter(Generic[T]):
         Returns:
             Pydantic model instance
         """
-        # Get all model fields as dict, handling type conversions
-        model_data = {}
-        
-        # Copy all attributes from SQLModel object (optimized with cached field names)
-        for field_name in self._field_names:
-            if hasattr(sqlmodel_obj, field_name):
-                value = getattr(sqlmodel_obj, field_name)
-                
-                # Handle Decimal to float conversion automatically
-                if isinstance(value, Decimal):
-                    value = float(value)
-                
-                # Handle SQLModel relationship objects
-                if hasattr(value, '__class__') and hasattr(value.__class__, '__tablename__'):
-                    # This is a SQLModel relationship object, skip it
-                    continue
-                
-                model_data[field_name] = value
-        
-        # Add any extra computed fields
-        model_data.update(extra_fields)
-        
-        return self.pydantic_model.model_validate(model_data)
+        model_data = self.copier_for(type(sqlmodel_obj))(sqlmodel_obj, extra_fields)
+        return self._builder()(model_data)
     
     def convert_many(self, sqlmodel_objects: List[Any], extra_fields_func: Callable = None) -> List[T]:
         """
@@ -68,18 +192,25 @@ class ModelConverter(Generic[T]):
         if not sqlmodel_objects:
             return []
         
-        # Use list comprehension for better performance than map()
-        return [
-            self.convert_single(
-                obj, 
-                **(extra_fields_func(obj) if extra_fields_func else {})
-            )
-            for obj in sqlmodel_objects
-        ]
+        build = self._builder()
+        copiers = self._copiers
+        no_extra: Dict[str, Any] = {}
+        results = []
+        for obj in sqlmodel_objects:
+            copy_fields = copiers.get(type(obj)) or self.copier_for(type(obj))
+            extra = extra_fields_func(obj) if extra_fields_func is not None else no_extra
+            results.append(build(copy_fields(obj, extra)))
+        return results
     
     async def convert_many_async(self, sqlmodel_objects: List[Any], extra_fields_func: Callable = None) -> List[T]:
         """
-        Convert multiple SQLModel objects asynchronously for very large datasets.
+        Convert multiple SQLModel objects without holding the event loop for long.
+        
+        Conversion is GIL-bound pure Python, so threads would add overhead
+        without parallelism. Inputs up to ``settings.convert_inline_max_rows``
+        are converted in one go; larger ones in slices of
+        ``settings.convert_slice_rows``, yielding to the event loop between
+        slices so other requests keep being served.
         
         Args:
             sqlmodel_objects: List of SQLModel instances
@@ -88,63 +219,83 @@ class ModelConverter(Generic[T]):
         Returns:
             List of Pydantic model instances
         """
-        if not sqlmodel_objects:
-            return []
-        
-        # For very large datasets, process in chunks
-        chunk_size = 1000
-        if len(sqlmodel_objects) <= chunk_size:
-            return self.convert_many(sqlmodel_objects, extra_fields_func)
-        
-        # Process in chunks asynchronously
-        tasks = []
-        for i in range(0, len(sqlmodel_objects), chunk_size):
-            chunk = sqlmodel_objects[i:i + chunk_size]
-            task = asyncio.create_task(
-                asyncio.to_thread(self.convert_many, chunk, extra_fields_func)
-            )
-            tasks.append(task)
-        
-        results = await asyncio.gather(*tasks)
+        return await convert_in_slices(
+            lambda objects: self.convert_many(objects, extra_fields_func), sqlmodel_objects
+        )
+
+
+async def convert_in_slices(convert: Callable[[List[Any]], List[T]], items: List[Any]) -> List[T]:
+    """
+    Run a list conversion inline, yielding to the event loop between slices of large inputs.
+    
+    Args:
+        convert: Converts a list of items synchronously
+        items: Items to convert
         
-        # Flatten results
-        return [item for sublist in results for item in sublist]
+    Returns:
+        The converted items in order
+    """
+    if len(items) <= settings.convert_inline_max_rows:
+        return convert(items)
+    
+    step = settings.convert_slice_rows
+    results = convert(items[:step])
+    for start in range(step, len(items), step):
+        await anyio.sleep(0)
+        results.extend(convert(items[start:start + step]))
+    return results
 
 
 # Pre-configured converters for common models
 from domain.entities.film import Film
 from domain.models.responses.film import FilmResponse
 
+from domain.catalog.reference_data import reference_data
+
 film_converter = ModelConverter(FilmResponse)
 
 
-def convert_film_to_response(film: SQLModel) -> FilmResponse:
-    """Convert Film model to FilmResponse efficiently."""
-    return film_converter.convert_single(
-        film,
-        extra_fields_func=lambda film: {
-            'language_name': film.language.name if film.language else None
-        }
-    )
+def _film_extra_fields(film: Film) -> Dict[str, Any]:
+    # The language comes from the reference data registry, not the relationship,
+    # so converting an entity never triggers a lazy load
+    return {'language_name': reference_data.language_name(film.language_id)}
 
 
-def convert_films_to_responses(films: List[Film]) -> List[FilmResponse]:
-    """Convert multiple Film models to FilmResponse list efficiently."""
+def convert_film_to_response(film: Any) -> FilmResponse:
+    """Convert a Film model or read-only film row to FilmResponse efficiently."""
+    if not isinstance(film, SQLModel):
+        return FilmResponse.model_validate(film)
+    return film_converter.convert_single(film, **_film_extra_fields(film))
+
+
+def convert_films_to_responses(films: List[Any]) -> List[FilmResponse]:
+    """Convert multiple Film models or read-only film rows to FilmResponse list efficiently."""
+    if films and not isinstance(films[0], SQLModel):
+        return convert_film_rows_to_responses(films)
     return film_converter.convert_many(
         films,
-        extra_fields_func=lambda film: {
-            'language_name': film.language.name if film.language else None
-        }
+        extra_fields_func=_film_extra_fields
     )
 
 
-async def convert_films_to_responses_async(films: List[Film]) -> List[FilmResponse]:
-    """Convert multiple Film models to FilmResponse list asynchronously (for large datasets)."""
+def convert_film_rows_to_responses(rows: List[Any]) -> List[FilmResponse]:
+    """
+    Convert read-only film rows (Core rows of the FilmResponse columns) to FilmResponse list.
+    
+    The rows already carry exactly the response fields, including
+    language_name, so they validate directly from attributes.
+    """
+    validate = FilmResponse.model_validate
+    return [validate(row) for row in rows]
+
+
+async def convert_films_to_responses_async(films: List[Any]) -> List[FilmResponse]:
+    """Convert multiple Film models or rows to FilmResponse list, yielding to the event loop for large inputs."""
+    if films and not isinstance(films[0], SQLModel):
+        return await convert_in_slices(convert_film_rows_to_responses, films)
     return await film_converter.convert_many_async(
         films,
-        extra_fields_func=lambda film: {
-            'language_name': film.language.name if film.language else None
-        }
+        extra_fields_func=_film_extra_fields
     )
 
 
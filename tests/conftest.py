@@ -13,11 +13,23 @@ from app.api.v1.film_routes import get_film_service
 from app.api.v1.customer_routes import get_rental_service
 from app.api.v1.ai_routes import get_ai_service
 from core.deps import get_auth_handler
+from core.response_cache import response_cache
+from domain.catalog.film_fragments import film_fragments
 
 # Configure pytest to use asyncio as the default async backend
 pytest_plugins = ("pytest_asyncio",)
 
 
+@pytest.fixture(autouse=True)
+def clear_response_cache():
+    """Start every test with empty response and film fragment caches."""
+    response_cache.clear()
+    film_fragments.clear()
+    yield
+    response_cache.clear()
+    film_fragments.clear()
+
+
 @pytest.fixture
 def mock_db_session():
     """Create a mock database session."""
@@ -77,4 +77,144 @@ async def test_summary_async(async_ai_client):
     assert isinstance(data["summary"], str)
     assert isinstance(data["rating"], str)
     assert isinstance(data["recommended"], bool)
-    assert len(data["summary"]) > 0 
\ No newline at end of file
+    assert len(data["summary"]) > 0
+
+
+@pytest.mark.anyio
+async def test_get_films_with_cursor_async(async_film_client, mock_film_service):
+    """Films listing in keyset mode forwards the cursor and returns next_cursor."""
+    mock_film_service.get_films.return_value = {
+        **mock_film_service.get_films.return_value,
+        "next_cursor": "eyJmaWxtX2lkIjoxfQ",
+    }
+    url = "/api/v1/films/"
+    params = {"cursor": "eyJmaWxtX2lkIjowfQ", "page_size": 10}
+    response = await async_film_client.get(url, params=params)
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+    assert data["next_cursor"] == "eyJmaWxtX2lkIjoxfQ"
+    assert mock_film_service.get_films.call_args.kwargs["cursor"] == "eyJmaWxtX2lkIjowfQ"
+    assert mock_film_service.get_films.call_args.kwargs["include_total"] is False
+
+    await async_film_client.get(url, params={**params, "include_total": "true"})
+    assert mock_film_service.get_films.call_args.kwargs["include_total"] is True
+
+
+@pytest.mark.anyio
+async def test_get_films_invalid_cursor_async(async_film_client, mock_film_service):
+    """A malformed cursor is rejected with 400."""
+    mock_film_service.get_films.side_effect = ValueError("Invalid pagination cursor")
+    response = await async_film_client.get("/api/v1/films/", params={"cursor": "not-a-cursor"})
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+@pytest.mark.anyio
+async def test_search_films_async(async_film_client, mock_film_service):
+    """Ranked full-text search returns a paginated film list."""
+    mock_film_service.search_films.return_value = mock_film_service.get_films.return_value
+    url = "/api/v1/films/search"
+    params = {"q": "action hero", "page": 1, "page_size": 10}
+    response = await async_film_client.get(url, params=params)
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+    assert isinstance(data["films"], list)
+    assert data["total"] == 1
+    mock_film_service.search_films.assert_awaited_once_with("action hero", page=1, page_size=10, mode="fulltext")
+
+
+@pytest.mark.anyio
+async def test_search_films_index_mode_async(async_film_client, mock_film_service):
+    """Search in index mode is forwarded to the service."""
+    mock_film_service.search_films.return_value = mock_film_service.get_films.return_value
+    response = await async_film_client.get("/api/v1/films/search", params={"q": "acad", "mode": "index"})
+    assert response.status_code == status.HTTP_200_OK
+    assert mock_film_service.search_films.call_args.kwargs["mode"] == "index"
+
+
+@pytest.mark.anyio
+async def test_get_films_batch_async(async_film_client, mock_film_service):
+    """Batch lookup forwards the IDs and returns films plus missing IDs."""
+    films = mock_film_service.get_films.return_value["films"]
+    mock_film_service.get_films_by_ids.return_value = {"films": films, "missing_ids": [99]}
+    response = await async_film_client.post("/api/v1/films/batch", json={"film_ids": [1, 99]})
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+    assert [film["film_id"] for film in data["films"]] == [1]
+    assert data["missing_ids"] == [99]
+    mock_film_service.get_films_by_ids.assert_awaited_once_with([1, 99], fields=None)
+
+
+@pytest.mark.anyio
+async def test_get_film_facets_async(async_film_client, mock_film_service):
+    """Facets are routed ahead of /{film_id} and take the listing's category filter."""
+    mock_film_service.get_facets.return_value = {
+        "total": 2,
+        "rating": [{"value": "PG", "count": 2}],
+        "category": [{"value": 1, "name": "Action", "count": 2}],
+        "language": [{"value": 1, "name": "English", "count": 2}],
+        "streaming_available": [{"value": False, "count": 2}],
+    }
+    response = await async_film_client.get("/api/v1/films/facets", params={"category": "Action"})
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+    assert data["total"] == 2
+    assert data["streaming_available"] == [{"value": False, "name": None, "count": 2}]
+    mock_film_service.get_facets.assert_awaited_once_with(category="Action", film_filter=None)
+
+
+@pytest.mark.anyio
+async def test_get_films_batch_rejects_oversized_batch(async_film_client):
+    """Batches beyond the configured limit are rejected."""
+    response = await async_film_client.post("/api/v1/films/batch", json={"film_ids": list(range(1, 502))})
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
+@pytest.mark.anyio
+async def test_get_films_sparse_fieldset_async(async_film_client, mock_film_service):
+    """fields= is parsed, forwarded and only the requested fields are returned."""
+    mock_film_service.get_films.return_value = {
+        "films": [{"film_id": 1, "title": "ACADEMY DINOSAUR", "rating": "PG"}],
+        "total": 1,
+        "page": 1,
+        "page_size": 10,
+        "next_cursor": None,
+    }
+    response = await async_film_client.get("/api/v1/films/", params={"fields": "title,rating"})
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["films"] == [{"film_id": 1, "title": "ACADEMY DINOSAUR", "rating": "PG"}]
+    assert mock_film_service.get_films.call_args.kwargs["fields"] == ("film_id", "title", "rating")
+    assert "etag" in response.headers
+
+
+@pytest.mark.anyio
+async def test_get_films_unknown_field_rejected(async_film_client, mock_film_service):
+    """Unknown fields are rejected with 400 before reaching the service."""
+    response = await async_film_client.get("/api/v1/films/", params={"fields": "title,fulltext"})
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert "fulltext" in response.json()["detail"]
+    mock_film_service.get_films.assert_not_awaited()
+
+
+@pytest.mark.anyio
+async def test_get_film_detail_async(async_film_client, mock_film_service):
+    """Film detail returns actors and categories with the film, and 404 for an unknown film."""
+    mock_film_service.get_film_detail.return_value = {
+        "film_id": 1,
+        "title": "ACADEMY DINOSAUR",
+        "language_id": 1,
+        "rental_duration": 6,
+        "rental_rate": 0.99,
+        "replacement_cost": 20.99,
+        "last_update": "2024-01-01T00:00:00Z",
+        "actors": [{"actor_id": 1, "first_name": "PENELOPE", "last_name": "GUINESS"}],
+        "categories": [{"category_id": 6, "name": "Documentary"}],
+    }
+    response = await async_film_client.get("/api/v1/films/1/full")
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["actors"][0]["last_name"] == "GUINESS"
+    assert response.json()["categories"] == [{"category_id": 6, "name": "Documentary"}]
+    mock_film_service.get_film_detail.assert_awaited_once_with(1)
+
+    mock_film_service.get_film_detail.return_value = None
+    response = await async_film_client.get("/api/v1/films/2/full")
+    assert response.status_code == status.HTTP_404_NOT_FOUND
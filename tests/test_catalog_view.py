@@ -0,0 +1,130 @@
+"""
+film_catalog view tests: view-mode queries and the debounced refresher.
+"""
+
+import anyio
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from sqlalchemy.dialects import postgresql
+
+from core.config import settings
+from domain.catalog.catalog_view import CatalogViewRefresher
+from domain.catalog.category_index import category_index
+from domain.models.requests.film import FilmFilter
+from domain.repositories.film_repository import FilmRepository
+
+
+def _sql(statement) -> str:
+    return str(statement.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}))
+
+
+@pytest.fixture
+def recording_repository(monkeypatch):
+    """View-mode repository over a session that records statements; category 'Action' is ID 1."""
+    monkeypatch.setattr(category_index, "ensure_loaded", AsyncMock())
+    monkeypatch.setattr(category_index, "resolve", lambda category: 1 if category == "Action" else None)
+    monkeypatch.setattr(category_index, "name", lambda category_id: "Action")
+    db = AsyncMock()
+    db.execute.return_value = MagicMock(scalar_one=MagicMock(return_value=100), all=MagicMock(return_value=[]))
+    return FilmRepository(db, use_view=True)
+
+
+@pytest.mark.anyio
+async def test_view_mode_listing_reads_only_the_view(recording_repository, monkeypatch):
+    monkeypatch.setattr(settings, "film_count_strategy", "count")
+    await recording_repository.get_films_paginated(
+        skip=0, limit=10, category="Action", film_filter=FilmFilter(ratings=["PG"], min_length=60)
+    )
+    await recording_repository.get_films_after(after_film_id=5, film_filter=FilmFilter(streaming_available=True))
+
+    statements = [_sql(call.args[0]) for call in recording_repository.db.execute.await_args_list]
+    assert len(statements) == 3
+    for sql in statements:
+        assert "FROM film_catalog" in sql
+        assert "film." not in sql
+        assert "JOIN" not in sql
+    count_sql, page_sql, keyset_sql = statements
+    assert "film_catalog.category_ids @> ARRAY[1]" in count_sql
+    assert "film_catalog.rating IN ('PG')" in page_sql
+    assert "film_catalog.language_name" in page_sql
+    assert "film_catalog.film_id > 5" in keyset_sql
+
+
+@pytest.mark.anyio
+async def test_view_mode_facets_unnest_categories(recording_repository):
+    await recording_repository.get_facet_counts(category_id=1, film_filter=FilmFilter(language_id=1))
+
+    sql = _sql(recording_repository.db.execute.await_args.args[0])
+    assert "FROM film_catalog LEFT OUTER JOIN unnest(film_catalog.category_ids) AS categories(category_id) ON true" in sql
+    assert "film_category" not in sql
+    assert "film_catalog.language_id = 1" in sql
+    assert "film_catalog.category_ids @> ARRAY[1]" in sql
+
+
+@pytest.fixture
+def view_mode(monkeypatch):
+    monkeypatch.setattr(settings, "film_read_mode", "view")
+    monkeypatch.setattr(settings, "catalog_view_refresh_debounce_seconds", 0.05)
+    monkeypatch.setattr(settings, "catalog_view_refresh_max_delay_seconds", 1.0)
+
+
+@pytest.mark.anyio
+async def test_refresh_is_debounced(view_mode):
+    refresher = CatalogViewRefresher()
+    refresher.refresh = AsyncMock()
+
+    async with anyio.create_task_group() as task_group:
+        await task_group.start(refresher.run)
+        for _ in range(5):
+            refresher.request()
+            await anyio.sleep(0.01)
+        assert refresher.stats()["pending"]
+        assert refresher.lag_seconds() > 0
+        await anyio.sleep(0.2)
+        await refresher.stop()
+
+    refresher.refresh.assert_awaited_once()
+    stats = refresher.stats()
+    assert not stats["pending"] and stats["lag_seconds"] == 0.0
+    assert stats["last_lag_seconds"] >= 0.05
+
+
+@pytest.mark.anyio
+async def test_failed_refresh_is_retried(view_mode):
+    refresher = CatalogViewRefresher()
+    refresher.refresh = AsyncMock(side_effect=[RuntimeError("view locked"), None])
+
+    async with anyio.create_task_group() as task_group:
+        await task_group.start(refresher.run)
+        refresher.request()
+        await anyio.sleep(0.3)
+        await refresher.stop()
+
+    assert refresher.refresh.await_count == 2
+    assert refresher.failures == 1
+    assert not refresher.stats()["pending"]
+
+
+@pytest.mark.anyio
+async def test_requests_wait_for_the_refresher_to_run(view_mode):
+    refresher = CatalogViewRefresher()
+    refresher.refresh = AsyncMock()
+    refresher.request()
+    await anyio.sleep(0.1)
+    refresher.refresh.assert_not_awaited()
+
+    async with anyio.create_task_group() as task_group:
+        await task_group.start(refresher.run)
+        await anyio.sleep(0.1)
+        await refresher.stop()
+
+    refresher.refresh.assert_awaited_once()
+
+
+@pytest.mark.anyio
+async def test_refresh_not_requested_outside_view_mode(monkeypatch):
+    monkeypatch.setattr(settings, "film_read_mode", "rows")
+    refresher = CatalogViewRefresher()
+    refresher.request()
+    assert not refresher.stats()["pending"]
@@ -0,0 +1,46 @@
+"""
+Category index tests.
+"""
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from domain.catalog.category_index import CategoryIndex
+
+
+def _result(rows):
+    result = MagicMock()
+    result.all.return_value = rows
+    return result
+
+
+@pytest.fixture
+async def loaded_index():
+    """Category index loaded from a mocked session."""
+    db = AsyncMock()
+    db.execute.side_effect = [
+        _result([(1, "Action"), (2, "Comedy")]),
+        _result([(1, 3), (1, 7), (1, 9), (2, 4)]),
+    ]
+    index = CategoryIndex(ttl_seconds=60)
+    await index.ensure_loaded(db)
+    return index
+
+
+@pytest.mark.anyio
+async def test_resolve_by_name_or_id(loaded_index):
+    """Categories resolve by exact case-insensitive name or by ID."""
+    assert loaded_index.resolve("action") == 1
+    assert loaded_index.resolve("2") == 2
+    assert loaded_index.resolve("Act") is None
+    assert loaded_index.resolve("42") is None
+
+
+@pytest.mark.anyio
+async def test_film_ids_are_sorted_and_maintained(loaded_index):
+    """Film ID lists stay sorted through deletions."""
+    assert list(loaded_index.film_ids(1)) == [3, 7, 9]
+    assert list(loaded_index.film_ids_after(1, 3, 1)) == [7]
+    loaded_index.remove_film(7)
+    assert list(loaded_index.film_ids(1)) == [3, 9]
+    assert list(loaded_index.film_ids_after(1, 3, 2)) == [9]
@@ -0,0 +1,115 @@
+"""
+Conditional GET (ETag / If-None-Match) tests for film resources.
+"""
+
+import pytest
+from datetime import datetime
+from fastapi import status
+
+from core.etag import etag_matches
+from domain.caches import film_cache
+from domain.catalog.reference_data import reference_data
+from domain.catalog.versions import catalog_versions
+from domain.models.responses.film import FilmResponse
+
+
+@pytest.fixture
+def film():
+    return FilmResponse(
+        film_id=7,
+        title="Airplane Sierra",
+        language_id=1,
+        rental_duration=6,
+        rental_rate=4.99,
+        replacement_cost=28.99,
+        last_update=datetime(2024, 1, 1, 12, 30),
+    )
+
+
+def test_etag_matching_follows_if_none_match_rules():
+    """Lists, weak tags and * all match; other tags do not."""
+    assert etag_matches('"a", "b"', '"b"')
+    assert etag_matches('W/"b"', '"b"')
+    assert etag_matches("*", '"b"')
+    assert not etag_matches('"a"', '"b"')
+    assert not etag_matches(None, '"b"')
+
+
+@pytest.mark.anyio
+async def test_film_revalidation_skips_the_service(async_film_client, mock_film_service, film):
+    """A known film ETag is answered from the version map."""
+    mock_film_service.get_film.return_value = film
+    headers = {"Cache-Control": "no-cache"}
+
+    response = await async_film_client.get("/api/v1/films/7", headers=headers)
+    etag = response.headers["etag"]
+    assert etag == catalog_versions.film_tag(7, film.last_update)
+
+    response = await async_film_client.get("/api/v1/films/7", headers={**headers, "If-None-Match": etag})
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+    assert response.headers["etag"] == etag
+    assert mock_film_service.get_film.await_count == 1
+
+
+@pytest.mark.anyio
+async def test_film_etag_changes_after_write(async_film_client, mock_film_service, film):
+    """Film writes drop the version map, so old tags are re-checked."""
+    mock_film_service.get_film.return_value = film
+    headers = {"Cache-Control": "no-cache"}
+    etag = (await async_film_client.get("/api/v1/films/7", headers=headers)).headers["etag"]
+
+    await film_cache.discard("7")
+    mock_film_service.get_film.return_value = film.model_copy(update={"last_update": datetime(2024, 2, 1)})
+
+    response = await async_film_client.get("/api/v1/films/7", headers={**headers, "If-None-Match": etag})
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["etag"] != etag
+
+
+@pytest.mark.anyio
+async def test_film_etag_expires_after_ttl(async_film_client, mock_film_service, film, monkeypatch):
+    """A remembered tag is re-checked after the cache TTL, so writes made outside the API show up."""
+    mock_film_service.get_film.return_value = film
+    headers = {"Cache-Control": "no-cache"}
+    etag = (await async_film_client.get("/api/v1/films/7", headers=headers)).headers["etag"]
+    assert await catalog_versions.film_etag(7) == etag
+
+    monkeypatch.setattr(catalog_versions, "ttl_seconds", 0)
+    catalog_versions.remember_film(7, etag, catalog_versions.generation)
+    assert await catalog_versions.film_etag(7) is None
+
+    response = await async_film_client.get("/api/v1/films/7", headers={**headers, "If-None-Match": etag})
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+    assert mock_film_service.get_film.await_count == 2
+
+
+@pytest.mark.anyio
+async def test_list_etag_follows_catalog_version(async_film_client, mock_film_service):
+    """Listings revalidate until the catalog version moves."""
+    headers = {"Cache-Control": "no-cache"}
+    etag = (await async_film_client.get("/api/v1/films/?page=2", headers=headers)).headers["etag"]
+
+    response = await async_film_client.get("/api/v1/films/?page=2", headers={**headers, "If-None-Match": etag})
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+    assert mock_film_service.get_films.await_count == 1
+
+    await catalog_versions.films_changed()
+    response = await async_film_client.get("/api/v1/films/?page=2", headers={**headers, "If-None-Match": etag})
+    assert response.status_code == status.HTTP_200_OK
+
+
+@pytest.mark.anyio
+async def test_reference_data_invalidation_retires_film_and_list_tags(async_film_client, mock_film_service, film):
+    """An unchanged film gets a new tag once the language names it carries may have changed."""
+    mock_film_service.get_film.return_value = film
+    film_tag = (await async_film_client.get("/api/v1/films/7")).headers["etag"]
+    list_tag = (await async_film_client.get("/api/v1/films/?page=2")).headers["etag"]
+
+    await reference_data.invalidate()
+
+    response = await async_film_client.get("/api/v1/films/7", headers={"If-None-Match": film_tag})
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["x-cache"] == "MISS"
+    assert response.headers["etag"] != film_tag
+    response = await async_film_client.get("/api/v1/films/?page=2", headers={"If-None-Match": list_tag})
+    assert response.status_code == status.HTTP_200_OK
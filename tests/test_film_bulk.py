@@ -0,0 +1,137 @@
+"""
+Bulk film write tests: validation, batching and per-row error isolation.
+"""
+
+import pytest
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock
+
+from fastapi import status
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.exc import IntegrityError
+
+import core.security
+from core.config import settings
+from domain.repositories.film_repository import FilmRepository
+from domain.services.film_service import FilmService
+
+
+def _item(title: str, **extra):
+    return {"title": title, "language_id": 1, **extra}
+
+
+def _integrity_error(message: str) -> IntegrityError:
+    return IntegrityError("INSERT INTO film ...", {}, Exception(f"{message}\nDETAIL: ..."))
+
+
+@pytest.mark.anyio
+async def test_bulk_write_reports_errors_by_position(monkeypatch):
+    monkeypatch.setattr(settings, "film_bulk_batch_size", 2)
+    repository = AsyncMock()
+    repository.unknown_language_ids.return_value = {9}
+    repository.existing_film_ids.return_value = {5}
+    next_id = iter(range(100, 200))
+
+    async def write_films_isolated(write, rows):
+        results = []
+        for row in rows:
+            if row["title"] == "REJECTED":
+                results.append((None, "check constraint violated"))
+            else:
+                results.append((row.get("film_id") or next(next_id), None))
+        return results
+
+    repository.write_films_isolated.side_effect = write_films_isolated
+    service = FilmService(repository)
+
+    result = await service.create_films([
+        _item("A"),
+        _item("", rating="PG"),
+        _item("B", language_id=9),
+        _item("C", film_id=5),
+        _item("D", film_id=6),
+        _item("REJECTED"),
+        _item("E"),
+    ])
+
+    assert result.film_ids == [100, None, None, 5, None, None, 101]
+    assert (result.created, result.updated, result.failed) == (2, 1, 4)
+    assert [(error.index, error.film_id) for error in result.errors] == [(1, None), (2, None), (4, 6), (5, None)]
+    assert result.errors[0].error.startswith("title:")
+    assert result.errors[1].error == "Unknown language_id 9"
+    assert result.errors[2].error == "Film with ID 6 not found"
+
+    # Creates in batches of two, then the one replacement
+    calls = repository.write_films_isolated.await_args_list
+    assert [len(call.args[1]) for call in calls] == [2, 1, 1]
+    assert calls[0].args[0] is repository.insert_films
+    assert calls[-1].args[0] is repository.update_films
+    assert calls[-1].args[1] == [{**calls[-1].args[1][0], "film_id": 5}]
+
+
+@pytest.mark.anyio
+async def test_failed_batch_is_retried_row_by_row():
+    db = AsyncMock()
+
+    @asynccontextmanager
+    async def savepoint():
+        yield
+
+    db.begin_nested = MagicMock(side_effect=lambda: savepoint())
+    repository = FilmRepository(db)
+
+    async def write(rows):
+        if any(row["title"] == "BAD" for row in rows):
+            raise _integrity_error("violates foreign key constraint")
+        return [len(row["title"]) for row in rows]
+
+    results = await repository.write_films_isolated(write, [{"title": "ONE"}, {"title": "BAD"}, {"title": "THREE"}])
+
+    assert results == [(3, None), (None, "violates foreign key constraint"), (5, None)]
+    assert db.begin_nested.call_count == 4
+    db.commit.assert_awaited_once()
+
+
+@pytest.mark.anyio
+async def test_insert_is_one_statement_with_server_side_fulltext():
+    db = AsyncMock()
+    db.execute.return_value = MagicMock(scalars=MagicMock(return_value=iter([7, 8])))
+    repository = FilmRepository(db)
+
+    ids = await repository.insert_films([
+        {"title": "ONE", "description": None, "language_id": 1},
+        {"title": "TWO", "description": "second", "language_id": 1},
+    ])
+
+    assert ids == [7, 8]
+    statement, params = db.execute.await_args.args
+    sql = str(statement.compile(dialect=postgresql.dialect()))
+    assert sql.startswith("INSERT INTO film")
+    assert "to_tsvector('pg_catalog.english'::regconfig, concat_ws(" in sql
+    assert sql.endswith("RETURNING film.film_id")
+    assert params[1]["fulltext_title"] == "TWO" and params[1]["fulltext_description"] == "second"
+
+
+@pytest.mark.anyio
+async def test_bulk_endpoint(async_film_client, mock_film_service, monkeypatch):
+    monkeypatch.setattr(core.security, "ADMIN_TOKEN", "secret")
+    mock_film_service.create_films.return_value = {
+        "created": 1,
+        "updated": 0,
+        "failed": 1,
+        "film_ids": [1001, None],
+        "errors": [{"index": 1, "film_id": None, "error": "title: Field required"}],
+    }
+    films = [_item("NEW FILM"), {"language_id": 1}]
+
+    response = await async_film_client.post("/api/v1/films/bulk", json={"films": films})
+    assert response.status_code in (status.HTTP_401_UNAUTHORIZED, status.HTTP_403_FORBIDDEN)
+
+    headers = {"Authorization": "Bearer secret"}
+    response = await async_film_client.post("/api/v1/films/bulk", json={"films": films}, headers=headers)
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["film_ids"] == [1001, None]
+    mock_film_service.create_films.assert_awaited_once_with(films)
+
+    response = await async_film_client.post("/api/v1/films/bulk", json={"films": []}, headers=headers)
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
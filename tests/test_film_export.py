@@ -0,0 +1,160 @@
+"""
+Film catalog export tests.
+"""
+
+import gzip
+import json
+import pytest
+from collections import namedtuple
+from contextlib import asynccontextmanager
+from datetime import datetime
+from unittest.mock import MagicMock
+
+from fastapi import status
+
+import core.security
+from app.main import app
+from core.streaming import accepts_gzip, gzip_stream
+from domain.services.deps import get_film_export_service
+from domain.catalog.film_fragments import film_fragments
+from domain.services.film_export_service import FilmExportService
+from domain.utils import conversion_pool as pool_module
+from domain.utils.fieldsets import FILM_FIELDS
+
+
+ADMIN_HEADERS = {"Authorization": "Bearer secret"}
+
+# Read-only rows of the FilmResponse columns, as FilmRepository.stream_films yields them
+FilmRow = namedtuple("FilmRow", FILM_FIELDS)
+
+
+def _film(film_id: int) -> FilmRow:
+    values = {
+        "film_id": film_id,
+        "title": f"FILM {film_id}",
+        "language_id": 1,
+        "language_name": "English",
+        "rental_duration": 3,
+        "rental_rate": 4.99,
+        "replacement_cost": 19.99,
+        "last_update": datetime(2024, 1, 1),
+    }
+    return FilmRow(**{name: values.get(name) for name in FILM_FIELDS})
+
+
+class _StreamResult:
+    def __init__(self, rows):
+        self._rows = rows
+
+    async def __aiter__(self):
+        for row in self._rows:
+            yield row
+
+
+def _session_factory(rows):
+    """Session factory whose sessions stream ``rows`` for any query."""
+    session = MagicMock()
+
+    async def stream(query):
+        session.query = query
+        return _StreamResult(rows)
+
+    session.stream = stream
+
+    @asynccontextmanager
+    async def factory():
+        yield session
+
+    return factory, session
+
+
+@pytest.fixture
+async def export_client(async_film_client, monkeypatch):
+    monkeypatch.setattr(core.security, "ADMIN_TOKEN", "secret")
+    factory, session = _session_factory([_film(1), _film(2), _film(3)])
+    app.dependency_overrides[get_film_export_service] = lambda: FilmExportService(factory)
+    yield async_film_client, session
+
+
+@pytest.mark.anyio
+async def test_export_streams_ndjson(export_client):
+    """Every film is one JSON line; the export is never cached."""
+    client, _ = export_client
+    response = await client.get("/api/v1/films/export", headers=ADMIN_HEADERS)
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    assert response.headers["cache-control"] == "no-store"
+    lines = response.content.decode().splitlines()
+    assert [json.loads(line)["film_id"] for line in lines] == [1, 2, 3]
+
+
+@pytest.mark.anyio
+async def test_export_requires_the_admin_token(export_client):
+    """The export dumps the whole catalog, so it is an admin endpoint."""
+    client, _ = export_client
+    response = await client.get("/api/v1/films/export")
+    assert response.status_code in (status.HTTP_401_UNAUTHORIZED, status.HTTP_403_FORBIDDEN)
+    response = await client.get("/api/v1/films/export", headers={"Authorization": "Bearer wrong"})
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+@pytest.mark.anyio
+async def test_export_gzip_and_since_filter(export_client):
+    """gzip is used when accepted, and since= becomes a last_update filter."""
+    client, session = export_client
+    response = await client.get(
+        "/api/v1/films/export",
+        params={"since": "2024-01-01T00:00:00"},
+        headers={**ADMIN_HEADERS, "Accept-Encoding": "gzip"},
+    )
+    assert response.headers["content-encoding"] == "gzip"
+    # httpx has already decoded the body
+    assert len(response.content.splitlines()) == 3
+    assert "film.last_update >=" in str(session.query)
+
+
+@pytest.mark.anyio
+async def test_export_hands_large_exports_to_the_process_pool(monkeypatch):
+    """Rows past the inline threshold go to the pool as tuples; output order is unchanged."""
+    rows = [_film(i) for i in range(1, 12)]
+    batches = []
+
+    async def render_in_pool(model, field_names, batch):
+        batches.append(batch)
+        return pool_module.render_json_lines(model, field_names, batch)
+
+    monkeypatch.setattr(pool_module.settings, "convert_process_workers", 2)
+    monkeypatch.setattr(pool_module.settings, "convert_process_min_rows", 3)
+    monkeypatch.setattr(pool_module.settings, "film_export_batch_size", 3)
+    monkeypatch.setattr(pool_module.conversion_pool, "render_json_lines", render_in_pool)
+
+    factory, _ = _session_factory(rows)
+    async with FilmExportService(factory).ndjson() as chunks:
+        body = b"".join([chunk async for chunk in chunks])
+
+    assert [json.loads(line)["film_id"] for line in body.splitlines()] == list(range(1, 12))
+    # Pooled lines are byte-identical to the inline (fragment cache) ones
+    assert body == b"".join(film_fragments.row_fragment(row) + b"\n" for row in rows)
+    # Batches may reach the pool in any order once several are in flight
+    assert sorted(len(batch) for batch in batches) == [2, 3, 3]
+    assert all(type(row) is tuple for batch in batches for row in batch)
+
+
+@pytest.mark.anyio
+async def test_gzip_stream_round_trips():
+    """The incremental compressor produces one valid gzip member."""
+    async def chunks():
+        for i in range(1000):
+            yield f'{{"film_id": {i}}}\n'.encode()
+
+    compressed = b"".join([chunk async for chunk in gzip_stream(chunks())])
+    assert gzip.decompress(compressed).count(b"\n") == 1000
+
+
+def test_accepts_gzip():
+    """gzip is accepted unless absent or given q=0."""
+    assert accepts_gzip("gzip, deflate, br")
+    assert accepts_gzip("br;q=1.0, gzip;q=0.5")
+    assert not accepts_gzip("gzip;q=0")
+    assert not accepts_gzip("identity")
+    assert not accepts_gzip(None)
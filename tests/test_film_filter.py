@@ -0,0 +1,166 @@
+"""
+Film filter tests: query building, validation and (with a database) index use.
+"""
+
+import pytest
+from itertools import combinations
+from unittest.mock import AsyncMock, MagicMock
+
+from fastapi import status
+from sqlalchemy import text
+from sqlalchemy.dialects import postgresql
+
+from core.config import settings
+from domain.catalog.category_index import category_index
+from domain.catalog.reference_data import reference_data
+from domain.models.requests.film import FilmFilter
+from domain.repositories.film_repository import FilmRepository
+
+# One example value per criterion, with the index expected to serve it alone
+CRITERIA = {
+    "ratings": ({"ratings": ["PG", "R"]}, "idx_film_rating"),
+    "language_id": ({"language_id": 1}, "idx_fk_language_id"),
+    "length": ({"min_length": 60, "max_length": 90}, "idx_film_length"),
+    "rental_rate": ({"min_rental_rate": 0.99, "max_rental_rate": 2.99}, "idx_film_rental_rate"),
+    "release_year": ({"min_release_year": 2005, "max_release_year": 2006}, "idx_film_release_year"),
+    "special_features": ({"special_features": ["Trailers", "Deleted Scenes"]}, "idx_film_special_features"),
+    "streaming_available": ({"streaming_available": True}, "idx_film_streaming_available"),
+    "category": ({}, "film_pkey"),
+}
+
+# Films added (and rolled back) by the EXPLAIN test; none match a criterion above
+PADDING_FILMS = 100_000
+
+
+@pytest.fixture
+def action_category(monkeypatch):
+    """Category 'Action' (ID 1) holding films 1-3, without a database."""
+    monkeypatch.setattr(reference_data, "ensure_loaded", AsyncMock())
+    monkeypatch.setattr(category_index, "ensure_loaded", AsyncMock())
+    monkeypatch.setattr(category_index, "resolve", lambda category: 1 if category == "Action" else None)
+    monkeypatch.setattr(category_index, "film_ids", lambda category_id: [1, 2, 3])
+
+
+def _recording_session():
+    """Session that records statements and returns an empty result with a count of 100."""
+    db = AsyncMock()
+    db.execute.return_value = MagicMock(scalar_one=MagicMock(return_value=100), all=MagicMock(return_value=[]))
+    return db
+
+
+def _sql(statement) -> str:
+    return str(statement.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}))
+
+
+async def _listing_statements(names):
+    """The statements a filtered listing (count, then page) runs for the given criteria."""
+    criteria = {}
+    for name in names:
+        criteria.update(CRITERIA[name][0])
+    db = _recording_session()
+    repository = FilmRepository(db, read_only=True)
+    await repository.get_films_paginated(
+        skip=0,
+        limit=10,
+        category="Action" if "category" in names else None,
+        film_filter=FilmFilter(**criteria)
+    )
+    return [_sql(call.args[0]) for call in db.execute.await_args_list]
+
+
+@pytest.mark.anyio
+async def test_all_criteria_compile_to_one_where_clause(action_category, monkeypatch):
+    """Every criterion, the category included, lands in the WHERE clause of the same queries."""
+    monkeypatch.setattr(settings, "film_count_strategy", "count")
+    count_sql, page_sql = await _listing_statements(list(CRITERIA))
+
+    for sql in (count_sql, page_sql):
+        assert "film.rating IN ('PG', 'R')" in sql
+        assert "film.language_id = 1" in sql
+        assert "film.length >= 60 AND film.length <= 90" in sql
+        assert "film.rental_rate >= 0.99 AND film.rental_rate <= 2.99" in sql
+        assert "film.release_year >= 2005 AND film.release_year <= 2006" in sql
+        assert "film.special_features @> ARRAY['Trailers', 'Deleted Scenes']" in sql
+        assert "film.streaming_available = true" in sql
+        assert "film.film_id = ANY (ARRAY[1, 2, 3])" in sql
+        assert "film_category" not in sql
+    assert count_sql.startswith("SELECT count(*) AS count_1 \nFROM film")
+    assert "ORDER BY film.film_id" in page_sql
+
+
+@pytest.mark.anyio
+async def test_unknown_category_short_circuits(action_category):
+    db = _recording_session()
+    films, total = await FilmRepository(db).get_films_paginated(
+        category="Nope", film_filter=FilmFilter(min_length=60)
+    )
+    assert (films, total) == ([], 0)
+    db.execute.assert_not_awaited()
+
+
+def test_filter_validation_and_cache_key():
+    assert FilmFilter().is_empty()
+    assert FilmFilter(special_features=["b", "a"], ratings=["R"]).cache_key() == "ratings=R&special_features=a,b"
+    with pytest.raises(ValueError):
+        FilmFilter(min_length=120, max_length=60)
+    with pytest.raises(ValueError):
+        FilmFilter(ratings=["X"])
+
+
+@pytest.mark.anyio
+async def test_listing_parses_filter_parameters(async_film_client, mock_film_service):
+    response = await async_film_client.get(
+        "/api/v1/films/",
+        params={"rating": "PG,R", "min_length": 60, "special_features": "Trailers", "streaming_available": "true"},
+    )
+    assert response.status_code == status.HTTP_200_OK
+    film_filter = mock_film_service.get_films.call_args.kwargs["film_filter"]
+    assert film_filter == FilmFilter(
+        ratings=["PG", "R"], min_length=60, special_features=["Trailers"], streaming_available=True
+    )
+
+    response = await async_film_client.get("/api/v1/films/", params={"min_length": 90, "max_length": 60})
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    await async_film_client.get("/api/v1/films/")
+    assert mock_film_service.get_films.call_args.kwargs["film_filter"] is None
+
+
+@pytest.mark.anyio
+@pytest.mark.skipif(not settings.film_database_url, reason="FILM_DATABASE_URL not set")
+async def test_filter_combinations_use_the_filter_indexes(action_category, monkeypatch):
+    """
+    EXPLAIN every combination of criteria under normal planner settings, on
+    a film table padded with films that match none of them so that every
+    criterion is selective. No plan may scan the whole table, and every
+    count must be served by the index of one of its criteria (from migration
+    36c38fed7a29, or film_pkey for a category). The padding is rolled back.
+    """
+    from core.db import get_engine_and_session_factory
+
+    monkeypatch.setattr(settings, "film_count_strategy", "count")
+    engine, _ = get_engine_and_session_factory("film")
+
+    async with engine.connect() as connection:
+        transaction = await connection.begin()
+        try:
+            await connection.execute(text(
+                "INSERT INTO film (title, release_year, language_id, rental_duration, rental_rate, length, "
+                "replacement_cost, rating, special_features, streaming_available, fulltext) "
+                "SELECT 'PADDING ' || g, 2015, (SELECT min(language_id) FROM language WHERE language_id <> 1), "
+                "3, 4.99, 180, 19.99, 'NC-17', ARRAY['Commentaries'], false, to_tsvector('padding') "
+                f"FROM generate_series(1, {PADDING_FILMS}) AS g"
+            ))
+            await connection.execute(text("ANALYZE film"))
+
+            for size in range(1, len(CRITERIA) + 1):
+                for names in combinations(CRITERIA, size):
+                    expected = [CRITERIA[name][1] for name in names]
+                    for sql in await _listing_statements(names):
+                        plan = "\n".join((await connection.execute(text(f"EXPLAIN {sql}"))).scalars())
+                        assert "Seq Scan on film" not in plan, f"{names}:\n{plan}"
+                        # The page query may walk film_pkey in film_id order until it has a page
+                        if sql.startswith("SELECT count(*)"):
+                            assert any(index in plan for index in expected), f"{names}:\n{plan}"
+        finally:
+            await transaction.rollback()
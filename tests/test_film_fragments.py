@@ -0,0 +1,132 @@
+"""
+Film fragment cache tests: byte-identical assembly, versioned keys and bounds.
+"""
+
+import pytest
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+from core.responses import FastJSONResponse
+from domain.catalog.film_fragments import FilmFragmentCache, film_fragments
+from domain.catalog.reference_data import ReferenceDataRegistry
+from domain.catalog.reference_data import reference_data
+from domain.caches import reference_cache
+from domain.entities import Film
+from domain.models.responses.film import FilmBatchResponse, FilmListResponse, FilmResponse
+from domain.utils.fieldsets import FILM_FIELDS
+from domain.utils.model_converter import convert_film_to_response
+
+LAST_UPDATE = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def _film(film_id: int, last_update: datetime = LAST_UPDATE, **overrides) -> FilmResponse:
+    values = dict(
+        film_id=film_id,
+        title=f"FILM {film_id}",
+        language_id=1,
+        language_name="English",
+        rental_duration=3,
+        rental_rate=4.99,
+        replacement_cost=19.99,
+        rating="PG",
+        special_features=["Trailers"],
+        last_update=last_update,
+    )
+    values.update(overrides)
+    return FilmResponse(**values)
+
+
+@pytest.mark.parametrize("content", [
+    FilmListResponse(films=[_film(1), _film(2)], total=2, page=1, page_size=10),
+    FilmListResponse(films=[_film(1)], total=5, page=1, page_size=1, next_cursor="abc"),
+    FilmListResponse(films=[], total=0, page=1, page_size=10),
+    FilmBatchResponse(films=[_film(2), _film(1)], missing_ids=[7]),
+    _film(3),
+])
+def test_assembled_responses_match_the_model_serializer(content):
+    expected = content.model_dump_json().encode()
+
+    assert FastJSONResponse(content).body == expected
+    # Second render is joined from cached fragments
+    assert FastJSONResponse(content).body == expected
+
+
+def test_fragments_are_keyed_by_film_version():
+    cache = FilmFragmentCache(max_bytes=1024 * 1024)
+
+    first = cache.fragment(_film(1))
+    assert cache.fragment(_film(1)) is first
+    updated = cache.fragment(_film(1, LAST_UPDATE + timedelta(seconds=1), title="RENAMED"))
+
+    assert b"RENAMED" in updated and b"RENAMED" not in first
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["entries"]) == (1, 2, 2)
+    assert stats["hit_ratio"] == round(1 / 3, 4)
+
+
+def test_cache_is_bounded_by_bytes():
+    size = len(_film(1).model_dump_json())
+    cache = FilmFragmentCache(max_bytes=size * 2 + size // 2)
+
+    for film_id in range(1, 6):
+        cache.fragment(_film(film_id))
+
+    stats = cache.stats()
+    assert stats["entries"] == 2 and stats["bytes"] <= stats["max_bytes"]
+    assert stats["evictions"] == 3
+
+
+def test_cached_rows_skip_validation():
+    cache = FilmFragmentCache(max_bytes=1024 * 1024)
+    row = SimpleNamespace(**_film(1).model_dump())
+    fragment = cache.row_fragment(row)
+
+    # A second row of the same version is served without being validated
+    assert cache.row_fragment(SimpleNamespace(film_id=1, last_update=LAST_UPDATE)) == fragment
+    assert fragment == _film(1).model_dump_json().encode()
+
+
+def test_entity_and_row_paths_cache_the_same_bytes(monkeypatch):
+    # The registry and film_select both trim the CHAR(20) language name
+    monkeypatch.setattr(reference_data, "language_name", lambda language_id: "English")
+    values = dict(
+        film_id=1,
+        title="ACADEMY DINOSAUR",
+        description="An epic drama",
+        release_year=2006,
+        language_id=1,
+        rental_duration=6,
+        rental_rate=Decimal("0.99"),
+        length=86,
+        replacement_cost=Decimal("20.99"),
+        rating="PG",
+        special_features=["Deleted Scenes"],
+        streaming_available=False,
+        last_update=LAST_UPDATE,
+    )
+    row = SimpleNamespace(**{name: values.get(name, "English") for name in FILM_FIELDS})
+
+    from_entity = FilmFragmentCache(max_bytes=1024 * 1024)
+    fragment = from_entity.fragment(convert_film_to_response(Film(**values)))
+    assert from_entity.row_fragment(row) is fragment
+
+    assert FilmFragmentCache(max_bytes=1024 * 1024).row_fragment(row) == fragment
+    assert b'"language_name":"English"' in fragment
+
+
+@pytest.mark.anyio
+async def test_new_reference_data_version_clears_fragments(monkeypatch):
+    snapshot = {"languages": [[1, "English"]], "categories": [], "stores": []}
+    monkeypatch.setattr(ReferenceDataRegistry, "_read_snapshot", staticmethod(AsyncMock(return_value=snapshot)))
+    registry = ReferenceDataRegistry()
+    await registry.load(AsyncMock())
+
+    film_fragments.fragment(_film(1))
+    await registry.load(AsyncMock())
+    assert film_fragments.stats()["entries"] == 1
+
+    await reference_cache.invalidate()
+    await registry.load(AsyncMock())
+    assert film_fragments.stats()["entries"] == 0
@@ -0,0 +1,289 @@
+"""
+Film catalog import tests: parsing, chunk validation, COPY chunks and resume.
+"""
+
+import io
+import pytest
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock
+
+from fastapi import status
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.sql import Delete, Insert, Select, Update
+from sqlalchemy.schema import CreateTable
+
+import core.security
+from app.main import app
+from domain.catalog.reference_data import reference_data
+from domain.entities import FilmImportJob
+from domain.services.deps import get_film_import_service
+from domain.services.film_import_service import (
+    FilmImportService, ImportProgress, copy_record, parse_text_array, read_records, validate_chunk,
+)
+
+CSV_FILE = (
+    "title,description,language_id,rental_rate,rating,special_features,streaming_available\n"
+    'ALPHA,First,1,0.99,PG,"{Trailers,""Deleted Scenes""}",t\n'
+    "BETA,,1,,,,\n"
+    ",No title,1,,,,\n"
+    "GAMMA,,9,,,,\n"
+    "DELTA,,1,,XXX,,\n"
+    "EPSILON,,1,,,[\"Commentaries\"],f\n"
+)
+
+
+@pytest.fixture(autouse=True)
+def languages(monkeypatch):
+    monkeypatch.setattr(reference_data, "language_name", lambda language_id: "English" if language_id == 1 else None)
+
+
+def test_parse_text_array():
+    assert parse_text_array('{Trailers,"Deleted Scenes"}') == ["Trailers", "Deleted Scenes"]
+    assert parse_text_array("{}") == []
+    assert parse_text_array('["Commentaries"]') == ["Commentaries"]
+    with pytest.raises(ValueError):
+        parse_text_array("Trailers")
+
+
+def test_csv_rows_are_validated_like_create_film():
+    records = list(read_records(io.StringIO(CSV_FILE), "csv"))
+    valid, rejects = validate_chunk(records)
+    films = [film for _, film in valid]
+
+    assert [line for line, _ in valid] == [2, 3, 7]
+    assert [film.title for film in films] == ["ALPHA", "BETA", "EPSILON"]
+    assert films[0].special_features == ["Trailers", "Deleted Scenes"] and films[0].streaming_available
+    # Empty cells fall back to the request defaults
+    assert films[1].description is None and films[1].rental_rate == 4.99
+    assert [line for line, _ in rejects] == [4, 5, 6]
+    assert rejects[0][1].startswith("title:")
+    assert rejects[1][1] == "Unknown language_id 9"
+    assert rejects[2][1].startswith("rating:")
+
+    record = copy_record(films[0])
+    assert record[0] == "ALPHA" and str(record[6]) == "0.99"
+
+
+def test_jsonl_reports_bad_lines():
+    stream = io.StringIO('{"title": "ALPHA", "language_id": 1}\n\n{oops\n[1]\n{"title": "BETA", "language_id": 1}\n')
+    films, rejects = validate_chunk(list(read_records(stream, "jsonl")))
+
+    assert [film.title for _, film in films] == ["ALPHA", "BETA"]
+    assert [line for line, _ in rejects] == [3, 4]
+    assert rejects[0][1].startswith("Invalid JSON")
+
+
+def test_rows_that_do_not_fit_the_film_columns_are_rejected():
+    stream = io.StringIO(
+        '{"title": "ALPHA", "language_id": 1, "rental_rate": 99.99}\n'
+        '{"title": "BETA", "language_id": 1, "rental_rate": 150}\n'
+        '{"title": "GAMMA", "language_id": 1, "rental_rate": 99.995}\n'
+        '{"title": "DELTA", "language_id": 1, "replacement_cost": 999.99}\n'
+        '{"title": "EPSILON\\u0000", "language_id": 1}\n'
+        '{"title": "ZETA", "language_id": 1, "special_features": ["Trailers\\u0000"]}\n'
+    )
+    films, rejects = validate_chunk(list(read_records(stream, "jsonl")))
+
+    assert [film.title for _, film in films] == ["ALPHA", "DELTA"]
+    assert rejects == [
+        (2, "rental_rate: must be at most 99.99"),
+        (3, "rental_rate: must be at most 99.99"),
+        (5, "title: must not contain NUL characters"),
+        (6, "special_features: must not contain NUL characters"),
+    ]
+
+
+class FakeImportConnection:
+    """Stands in for a pooled connection: COPY into staging, merge, checkpoint, all transactional."""
+
+    def __init__(self, checkpoint: dict, fail_on_copy: int = -1, rejected_titles=()):
+        self.checkpoint = checkpoint
+        self.fail_on_copy = fail_on_copy
+        self.rejected_titles = set(rejected_titles)
+        self.copied = []
+        self.films = []
+        self._staged = []
+        self._pending = None
+        self.driver_connection = MagicMock(copy_records_to_table=AsyncMock(side_effect=self._copy))
+
+    async def _copy(self, table, records, columns):
+        if len(self.copied) == self.fail_on_copy:
+            raise ConnectionError("connection lost")
+        self.copied.append([record[0] for record in records])
+        self._staged = self._staged + list(records)
+
+    async def execute(self, statement):
+        if isinstance(statement, Select):
+            return MagicMock(scalar_one=MagicMock(return_value=self.checkpoint["rows_committed"]))
+        if isinstance(statement, Insert):
+            rejected = [record[0] for record in self._staged if record[0] in self.rejected_titles]
+            if rejected:
+                raise DBAPIError("INSERT INTO film", {}, Exception(f"check constraint violated by {rejected[0]}"))
+            start = len(self.films)
+            rows = [(start + i + 1, record[0], record[1]) for i, record in enumerate(self._staged)]
+            self.films.extend(rows)
+            return MagicMock(all=MagicMock(return_value=rows))
+        if isinstance(statement, Update):
+            self._pending = statement.compile().params
+        if isinstance(statement, Delete):
+            self._staged = []
+        assert isinstance(statement, (Update, Delete, CreateTable))
+
+    async def commit(self):
+        pass
+
+    async def get_raw_connection(self):
+        return self
+
+    @asynccontextmanager
+    async def begin(self):
+        films = len(self.films)
+        try:
+            yield
+        except BaseException:
+            del self.films[films:]
+            raise
+        finally:
+            self._staged = []
+        self.checkpoint["rows_committed"] = self._pending["rows_committed"]
+        self.checkpoint["rows_rejected"] = self.checkpoint.get("rows_rejected", 0) + self._pending["rows_rejected_1"]
+
+    @asynccontextmanager
+    async def begin_nested(self):
+        films, staged = len(self.films), self._staged
+        try:
+            yield
+        except BaseException:
+            del self.films[films:]
+            self._staged = staged
+            raise
+
+
+def _engine(connection):
+    @asynccontextmanager
+    async def connect():
+        yield connection
+
+    return MagicMock(connect=connect)
+
+
+@pytest.mark.anyio
+async def test_import_resumes_after_last_committed_chunk(tmp_path, monkeypatch):
+    path = tmp_path / "films.jsonl"
+    path.write_text("".join(f'{{"title": "FILM {i}", "language_id": {1 if i != 4 else 9}}}\n' for i in range(10)))
+    job = FilmImportJob(job_id="job", source=str(path), file_format="jsonl", status="running", rows_committed=0)
+    checkpoint = {"rows_committed": 0}
+
+    service = FilmImportService(engine=_engine(FakeImportConnection(checkpoint, fail_on_copy=2)))
+    monkeypatch.setattr(service, "_films_imported", AsyncMock())
+    progress = ImportProgress("job", path.stat().st_size)
+
+    with pytest.raises(ConnectionError):
+        await service._import(job, progress, chunk_size=3)
+    assert checkpoint["rows_committed"] == 6
+    assert (progress.rows_imported, progress.rows_rejected) == (5, 1)
+    assert progress.sample_errors == [{"line": 5, "error": "Unknown language_id 9"}]
+
+    connection = FakeImportConnection(checkpoint)
+    service._engine = _engine(connection)
+    job.rows_committed = checkpoint["rows_committed"]
+    resumed = ImportProgress("job", path.stat().st_size, resumed_from=job.rows_committed)
+    await service._import(job, resumed, chunk_size=3)
+
+    assert connection.copied == [["FILM 6", "FILM 7", "FILM 8"], ["FILM 9"]]
+    assert checkpoint["rows_committed"] == 10
+    stats = resumed.stats()
+    assert stats["rows_read"] == 4 and stats["chunks"] == 2 and stats["percent"] == 100.0
+
+
+@pytest.mark.anyio
+async def test_rows_rejected_by_the_database_are_skipped(tmp_path, monkeypatch):
+    path = tmp_path / "films.jsonl"
+    path.write_text("".join(f'{{"title": "FILM {i}", "language_id": 1}}\n' for i in range(5)))
+    job = FilmImportJob(job_id="job", source=str(path), file_format="jsonl", status="running", rows_committed=0)
+    checkpoint = {"rows_committed": 0}
+    connection = FakeImportConnection(checkpoint, rejected_titles={"FILM 1"})
+
+    service = FilmImportService(engine=_engine(connection))
+    monkeypatch.setattr(service, "_films_imported", AsyncMock())
+    progress = ImportProgress("job", path.stat().st_size)
+    await service._import(job, progress, chunk_size=3)
+
+    assert [title for _, title, _ in connection.films] == ["FILM 0", "FILM 2", "FILM 3", "FILM 4"]
+    assert checkpoint == {"rows_committed": 5, "rows_rejected": 1}
+    assert (progress.rows_imported, progress.rows_rejected, progress.chunks) == (4, 1, 2)
+    assert progress.sample_errors == [{"line": 2, "error": "check constraint violated by FILM 1"}]
+
+
+@pytest.mark.anyio
+async def test_import_refuses_a_moved_checkpoint(tmp_path, monkeypatch):
+    path = tmp_path / "films.jsonl"
+    path.write_text('{"title": "FILM", "language_id": 1}\n')
+    job = FilmImportJob(job_id="job", source=str(path), file_format="jsonl", status="running", rows_committed=0)
+    connection = FakeImportConnection({"rows_committed": 1})
+
+    service = FilmImportService(engine=_engine(connection))
+    with pytest.raises(RuntimeError, match="being run elsewhere"):
+        await service._import(job, ImportProgress("job", 1), chunk_size=3)
+    assert connection.copied == []
+
+
+class _StubImportService:
+    def __init__(self):
+        self.uploads = []
+        self.runs = []
+
+    async def save_upload(self, job_id, file_format, chunks):
+        body = b"".join([chunk async for chunk in chunks])
+        self.uploads.append(body)
+        return f"imports/{job_id}.{file_format}", len(body)
+
+    async def run(self, job_id, path=None, file_format=None):
+        self.runs.append((job_id, path, file_format))
+
+    async def get_job(self, job_id):
+        if job_id == "missing":
+            return None
+        return {"job_id": job_id, "status": "completed" if job_id == "done" else "failed", "rows_committed": 5000}
+
+    def is_running(self, job_id):
+        return False
+
+
+@pytest.fixture
+async def admin_client(async_film_client, monkeypatch):
+    monkeypatch.setattr(core.security, "ADMIN_TOKEN", "secret")
+    service = _StubImportService()
+    app.dependency_overrides[get_film_import_service] = lambda: service
+    async_film_client.import_service = service
+    yield async_film_client
+
+
+@pytest.mark.anyio
+async def test_admin_import_endpoints(admin_client):
+    headers = {"Authorization": "Bearer secret"}
+    service = admin_client.import_service
+
+    response = await admin_client.post("/api/v1/admin/imports?format=csv", content=CSV_FILE.encode(), headers=headers)
+    assert response.status_code == status.HTTP_202_ACCEPTED
+    job_id = response.json()["job_id"]
+    assert response.json()["bytes"] == len(CSV_FILE)
+    assert service.uploads == [CSV_FILE.encode()]
+    assert service.runs == [(job_id, f"imports/{job_id}.csv", "csv")]
+
+    response = await admin_client.post("/api/v1/admin/imports?format=xlsx", content=b"", headers=headers)
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+    response = await admin_client.get("/api/v1/admin/imports/missing", headers=headers)
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    response = await admin_client.post("/api/v1/admin/imports/failed/resume", headers=headers)
+    assert response.status_code == status.HTTP_202_ACCEPTED
+    assert response.json()["resume_from"] == 5000
+    assert service.runs[-1] == ("failed", None, None)
+
+    response = await admin_client.post("/api/v1/admin/imports/done/resume", headers=headers)
+    assert response.status_code == status.HTTP_409_CONFLICT
+
+    response = await admin_client.post("/api/v1/admin/imports?format=csv", content=b"")
+    assert response.status_code in (status.HTTP_401_UNAUTHORIZED, status.HTTP_403_FORBIDDEN)
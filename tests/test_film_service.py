@@ -0,0 +1,201 @@
+"""
+Film service tests against a mocked repository.
+"""
+
+import pytest
+from collections import namedtuple
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock
+from sqlalchemy import create_engine, literal, select
+from sqlalchemy.dialects import postgresql
+
+from domain.caches import facet_cache
+from domain.catalog.category_index import category_index
+from domain.entities.film import Film
+from domain.repositories.film_repository import FilmRepository, film_detail_select, film_select
+from domain.services.film_service import FilmService
+from domain.utils.model_converter import convert_films_to_responses
+
+
+def _film(film_id: int) -> Film:
+    return Film(
+        film_id=film_id,
+        title=f"FILM {film_id}",
+        language_id=1,
+        rental_duration=3,
+        rental_rate=4.99,
+        replacement_cost=19.99,
+        last_update=datetime(2024, 1, 1),
+    )
+
+
+@pytest.mark.anyio
+async def test_get_films_by_ids_preserves_order_and_reports_missing():
+    """Films come back in request order; unknown IDs are listed once."""
+    repository = AsyncMock()
+    repository.get_films_by_ids.return_value = [_film(1), _film(5), _film(3)]
+    service = FilmService(repository)
+
+    result = await service.get_films_by_ids([5, 42, 1, 5, 3])
+
+    assert [film.film_id for film in result.films] == [5, 1, 3]
+    assert result.missing_ids == [42]
+    repository.get_films_by_ids.assert_awaited_once_with([5, 42, 1, 3], fields=None)
+
+
+@pytest.mark.anyio
+async def test_cursor_pages_count_only_on_request():
+    """Keyset pages skip the COUNT unless the caller asks for the total."""
+    repository = AsyncMock()
+    repository.get_films_after.return_value = ([_film(11), _film(12)], True)
+    repository.count_films.return_value = 40
+    service = FilmService(repository)
+
+    result = await service.get_films(cursor="eyJmaWxtX2lkIjoxMH0", page_size=2)
+    assert result.total is None
+    assert result.next_cursor is not None
+    repository.count_films.assert_not_awaited()
+
+    result = await service.get_films(cursor="eyJmaWxtX2lkIjoxMH0", page_size=2, include_total=True)
+    assert result.total == 40
+
+
+def test_sparse_select_projects_only_requested_columns():
+    """A fieldset selects just those columns and joins language only when asked."""
+    sql = str(film_select(("film_id", "title")).compile(dialect=postgresql.dialect()))
+    assert sql.startswith("SELECT film.film_id, film.title \nFROM film")
+    assert "language" not in sql
+
+    sql = str(film_select(("film_id", "language_name")).compile(dialect=postgresql.dialect()))
+    assert "rtrim(language.name) AS language_name" in sql
+    assert "LEFT OUTER JOIN language" in sql
+
+
+def test_read_only_select_returns_response_columns():
+    """Read-only mode selects the FilmResponse columns with the language joined."""
+    repository = FilmRepository(AsyncMock(), read_only=True)
+    sql = str(repository._select().compile(dialect=postgresql.dialect()))
+    assert "film.fulltext" not in sql
+    assert "rtrim(language.name) AS language_name" in sql
+
+    repository = FilmRepository(AsyncMock(), read_only=False)
+    sql = str(repository._select().compile(dialect=postgresql.dialect()))
+    assert "film.fulltext" in sql
+
+
+def test_rows_convert_directly_to_responses():
+    """Core rows of the response columns validate straight into FilmResponse."""
+    engine = create_engine("sqlite://")
+    with engine.connect() as connection:
+        row = connection.execute(select(
+            literal(1).label("film_id"),
+            literal("ACADEMY DINOSAUR").label("title"),
+            literal(1).label("language_id"),
+            literal("English").label("language_name"),
+            literal(6).label("rental_duration"),
+            literal(0.99).label("rental_rate"),
+            literal(20.99).label("replacement_cost"),
+            literal(datetime(2024, 1, 1)).label("last_update"),
+        )).one()
+
+    [response] = convert_films_to_responses([row])
+    assert response.title == "ACADEMY DINOSAUR"
+    assert response.language_name == "English"
+
+
+@pytest.mark.anyio
+async def test_facet_counts_come_from_one_grouping_sets_query(monkeypatch):
+    """Every facet and the total are read with a single GROUPING SETS query."""
+    monkeypatch.setattr(category_index, "ensure_loaded", AsyncMock())
+    monkeypatch.setattr(category_index, "_names_by_id", {1: "Action"})
+    row = namedtuple("Row", "grouping rating category_id language_id name streaming_available count")
+    db = AsyncMock()
+    db.execute.return_value = MagicMock(all=MagicMock(return_value=[
+        row(0b0111, "PG", None, None, None, None, 3),
+        row(0b1011, None, 1, None, None, None, 2),
+        row(0b1101, None, None, 1, "English             ", None, 5),
+        row(0b1110, None, None, None, None, True, 4),
+        row(0b1111, None, None, None, None, None, 5),
+    ]))
+
+    facets = await FilmRepository(db).get_facet_counts(category_id=1)
+
+    assert db.execute.await_count == 1
+    sql = str(db.execute.await_args.args[0].compile(dialect=postgresql.dialect()))
+    assert "GROUP BY GROUPING SETS(film.rating, film_category.category_id, (film.language_id, rtrim(language.name)), film.streaming_available, ())" in sql
+    assert "count(DISTINCT film.film_id)" in sql
+    assert "film_category.category_id = " in sql
+    assert facets == [
+        ("rating", "PG", None, 3),
+        ("category", 1, "Action", 2),
+        ("language", 1, "English", 5),
+        ("streaming_available", True, None, 4),
+        ("total", None, None, 5),
+    ]
+
+
+@pytest.mark.anyio
+async def test_facets_are_cached_until_films_change():
+    """Facets are cached per filter signature and reloaded after a film write."""
+    await facet_cache.invalidate()
+    repository = AsyncMock()
+    repository.resolve_category.return_value = 7
+    repository.get_facet_counts.return_value = [
+        ("rating", "G", None, 2), ("rating", "R", None, 3), ("total", None, None, 5),
+    ]
+    repository.delete_film.return_value = True
+    service = FilmService(repository)
+
+    facets = await service.get_facets(category="Drama")
+    assert facets.total == 5
+    assert [(facet.value, facet.count) for facet in facets.rating] == [("R", 3), ("G", 2)]
+
+    await service.get_facets(category="drama")
+    assert repository.get_facet_counts.await_count == 1
+    await service.get_facets()
+    assert repository.get_facet_counts.await_count == 2
+
+    await service.delete_film(99)
+    await service.get_facets(category="Drama")
+    assert repository.get_facet_counts.await_count == 3
+
+    await category_index.invalidate()
+    await service.get_facets(category="Drama")
+    assert repository.get_facet_counts.await_count == 4
+
+    repository.resolve_category.return_value = None
+    assert (await service.get_facets(category="Nope")).total == 0
+    assert repository.get_facet_counts.await_count == 4
+
+
+def test_film_detail_is_one_statement():
+    """Actors and categories are aggregated into the film document by correlated subqueries."""
+    sql = str(film_detail_select(7).compile(dialect=postgresql.dialect()))
+    assert sql.startswith("SELECT CAST(json_build_object('film_id', film.film_id")
+    assert "json_agg(json_build_object('actor_id', actor.actor_id" in sql
+    assert "ORDER BY actor.last_name, actor.first_name, actor.actor_id" in sql
+    assert "json_agg(json_build_object('category_id', category.category_id" in sql
+    assert "WHERE film_actor.film_id = film.film_id" in sql
+    assert "'language_name', rtrim(language.name)" in sql
+    assert "fulltext" not in sql
+
+
+@pytest.mark.anyio
+async def test_film_detail_validates_document():
+    repository = AsyncMock()
+    repository.get_film_detail_json.return_value = (
+        '{"film_id": 7, "title": "FILM 7", "language_id": 1, "language_name": "English",'
+        ' "rental_duration": 3, "rental_rate": 4.99, "replacement_cost": 19.99,'
+        ' "special_features": ["Trailers"], "last_update": "2024-01-01T00:00:00+00:00",'
+        ' "actors": [{"actor_id": 2, "first_name": "NICK", "last_name": "WAHLBERG"}],'
+        ' "categories": [{"category_id": 1, "name": "Action"}]}'
+    )
+    service = FilmService(repository)
+
+    detail = await service.get_film_detail(7)
+    assert detail.language_name == "English"
+    assert [actor.last_name for actor in detail.actors] == ["WAHLBERG"]
+    assert [category.name for category in detail.categories] == ["Action"]
+
+    repository.get_film_detail_json.return_value = None
+    assert await service.get_film_detail(8) is None
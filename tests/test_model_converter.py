@@ -0,0 +1,106 @@
+"""
+ModelConverter tests: generated per-class copiers and the trusted construct path.
+"""
+
+import anyio
+import pytest
+from datetime import datetime, timezone
+from decimal import Decimal
+from types import SimpleNamespace
+
+from domain.entities import Film, Language
+from domain.entities.base import MPAARating
+from domain.models.responses.film import FilmResponse
+from domain.utils import model_converter
+from domain.utils.model_converter import ModelConverter
+
+
+def _film(**overrides) -> Film:
+    values = dict(
+        film_id=7,
+        title="ACADEMY DINOSAUR",
+        description="An epic drama",
+        release_year=2006,
+        language_id=1,
+        rental_duration=6,
+        rental_rate=Decimal("0.99"),
+        length=86,
+        replacement_cost=Decimal("20.99"),
+        rating="PG",
+        special_features=["Deleted Scenes"],
+        last_update=datetime(2026, 1, 1, tzinfo=timezone.utc),
+        streaming_available=True,
+    )
+    values.update(overrides)
+    return Film(**values)
+
+
+@pytest.mark.parametrize("trusted", [False, True])
+def test_compiled_copy_matches_validated_response(trusted):
+    converter = ModelConverter(FilmResponse, trusted=trusted)
+    film = _film(language=Language(language_id=1, name="English"))
+
+    response = converter.convert_single(film, language_name="English")
+
+    assert isinstance(response, FilmResponse)
+    assert response.rental_rate == 0.99 and type(response.rental_rate) is float
+    assert response.rating is MPAARating.PG
+    assert response.model_dump_json() == FilmResponse.model_validate({
+        **{name: getattr(film, name) for name in FilmResponse.model_fields if name != "language_name"},
+        "language_name": "English",
+    }).model_dump_json()
+
+
+def test_copier_is_compiled_once_per_source_class():
+    converter = ModelConverter(FilmResponse)
+    responses = converter.convert_many([_film(film_id=1), _film(film_id=2, rating=None)], lambda film: {})
+
+    assert [response.film_id for response in responses] == [1, 2]
+    assert responses[1].rating is None and responses[0].language_name is None
+    assert list(converter._copiers) == [Film]
+
+
+def test_unloaded_columns_are_read_through_attributes():
+    converter = ModelConverter(FilmResponse, trusted=True)
+    film = _film()
+    del film.__dict__["description"]
+
+    assert converter.convert_single(film).description is None
+
+
+def test_trusted_path_skips_validation():
+    film = _film(length=-1)
+    with pytest.raises(ValueError):
+        ModelConverter(FilmResponse, trusted=False).convert_single(film.model_copy(update={"title": None}))
+
+    assert ModelConverter(FilmResponse, trusted=True).convert_single(film).length == -1
+
+
+def test_objects_without_a_mapper_use_the_generic_copy():
+    source = SimpleNamespace(**{name: getattr(_film(), name) for name in FilmResponse.model_fields if name != "language_name"})
+    response = ModelConverter(FilmResponse).convert_single(source, language_name="English")
+
+    assert response.language_name == "English" and response.replacement_cost == 20.99
+
+
+@pytest.mark.anyio
+async def test_large_async_conversions_yield_between_slices(monkeypatch):
+    monkeypatch.setattr(model_converter.settings, "convert_inline_max_rows", 4)
+    monkeypatch.setattr(model_converter.settings, "convert_slice_rows", 3)
+    converter = ModelConverter(FilmResponse)
+    yields = []
+
+    async def sleep(delay):
+        yields.append(delay)
+        await anyio.sleep(delay)
+
+    monkeypatch.setattr(model_converter, "anyio", SimpleNamespace(sleep=sleep))
+    small = await converter.convert_many_async([_film(film_id=i) for i in range(4)])
+    yields_after_small = len(yields)
+    large = await converter.convert_many_async([_film(film_id=i) for i in range(10)])
+
+    assert [response.film_id for response in small] == list(range(4))
+    assert [response.film_id for response in large] == list(range(10))
+    # The small conversion ran in one go; the large one yielded after each of its 4 slices but the last
+    assert yields_after_small == 0
+    assert yields == [0, 0, 0]
@@ -0,0 +1,109 @@
+"""
+Reference data registry tests: loading, invalidation and film conversion.
+"""
+
+import pytest
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock
+
+from fastapi import status
+from sqlalchemy.dialects import postgresql
+
+import core.security
+from domain.caches import reference_cache
+from domain.catalog.category_index import category_index
+from domain.catalog.reference_data import ReferenceDataRegistry, reference_data
+from domain.entities.film import Film
+from domain.repositories.film_repository import FilmRepository, film_select
+from domain.utils.model_converter import convert_film_to_response, convert_films_to_responses
+
+SNAPSHOT = {
+    "languages": [[1, "English"], [2, "Italian"]],
+    "categories": [[1, "Action"], [2, "Animation"]],
+    "stores": [[1, 1, 1], [2, 2, 2]],
+}
+
+
+def _session():
+    """Session answering the three reference-table queries."""
+    db = AsyncMock()
+    db.execute.side_effect = lambda *args, **kwargs: MagicMock(all=MagicMock(return_value=[]))
+    return db
+
+
+@pytest.fixture
+def loaded_registry(monkeypatch):
+    """The shared registry, loaded from SNAPSHOT without a database."""
+    monkeypatch.setattr(ReferenceDataRegistry, "_read_snapshot", staticmethod(AsyncMock(return_value=SNAPSHOT)))
+    registry = ReferenceDataRegistry()
+    monkeypatch.setattr("domain.utils.model_converter.reference_data", registry)
+    return registry
+
+
+def _film(film_id: int, language_id: int) -> Film:
+    return Film(
+        film_id=film_id,
+        title=f"Film {film_id}",
+        language_id=language_id,
+        rental_duration=3,
+        rental_rate=4.99,
+        replacement_cost=19.99,
+        streaming_available=False,
+        last_update=datetime(2024, 1, 1, tzinfo=timezone.utc),
+    )
+
+
+@pytest.mark.anyio
+async def test_converter_fills_language_name_from_registry(loaded_registry):
+    await loaded_registry.load(_session())
+
+    response = convert_film_to_response(_film(1, 2))
+    assert response.language_name == "Italian"
+    assert [film.language_name for film in convert_films_to_responses([_film(1, 1), _film(2, 3)])] == ["English", None]
+    assert loaded_registry.store(2) == {"manager_staff_id": 2, "address_id": 2}
+    assert loaded_registry.category_names() == ["Action", "Animation"]
+
+
+@pytest.mark.anyio
+async def test_registry_reloads_after_invalidation_or_ttl(loaded_registry):
+    db = _session()
+    await loaded_registry.ensure_loaded(db)
+    await loaded_registry.ensure_loaded(db)
+    assert loaded_registry.loads == 1
+
+    await loaded_registry.invalidate()
+    await loaded_registry.ensure_loaded(db)
+    assert loaded_registry.loads == 2
+    assert loaded_registry.stats()["version"] == reference_cache.version.value
+
+    loaded_registry._ttl_seconds = 0
+    await loaded_registry.ensure_loaded(db)
+    assert loaded_registry.loads == 3
+
+
+@pytest.mark.anyio
+async def test_entity_reads_skip_the_language_table(loaded_registry, monkeypatch):
+    """Entity selects no longer load the language relationship in a second query."""
+    sql = str(film_select().compile(dialect=postgresql.dialect()))
+    assert "language" not in sql.replace("language_id", "")
+
+    monkeypatch.setattr("domain.repositories.film_repository.reference_data", loaded_registry)
+    db = AsyncMock()
+    db.execute.return_value = MagicMock(scalars=MagicMock(return_value=MagicMock(all=MagicMock(return_value=[]))))
+    await FilmRepository(db, read_only=False).get_films_by_ids([1, 2])
+    assert loaded_registry.is_loaded
+    assert db.execute.await_count == 1
+
+
+@pytest.mark.anyio
+async def test_admin_invalidation_hook(async_film_client, monkeypatch):
+    monkeypatch.setattr(core.security, "ADMIN_TOKEN", "secret")
+    version = reference_cache.version.value
+
+    response = await async_film_client.post(
+        "/api/v1/admin/reference-data/invalidate", headers={"Authorization": "Bearer secret"}
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == {"version": version + 1}
+    assert not reference_data.is_fresh()
+    assert not category_index.is_fresh()
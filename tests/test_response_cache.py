@@ -0,0 +1,103 @@
+"""
+Response cache middleware tests.
+"""
+
+import pytest
+from datetime import datetime
+from fastapi import status
+
+from core.cache import InMemoryCacheBackend, SharedVersion
+from core.response_cache import CachedResponse, ResponseCache, response_cache
+from domain.catalog.cache_keys import FILMS_LIST, film_key
+from domain.models.responses.film import FilmResponse
+
+
+@pytest.fixture
+def film_payload():
+    return FilmResponse(
+        film_id=1,
+        title="Test Action Film",
+        language_id=1,
+        rental_duration=3,
+        rental_rate=4.99,
+        replacement_cost=19.99,
+        last_update=datetime(2024, 1, 1),
+    )
+
+
+@pytest.mark.anyio
+async def test_film_detail_served_from_cache_until_purged(async_film_client, mock_film_service, film_payload):
+    """A tagged GET is cached and purging its surrogate key drops it."""
+    mock_film_service.get_film.return_value = film_payload
+    url = "/api/v1/films/1"
+
+    first = await async_film_client.get(url)
+    second = await async_film_client.get(url)
+    assert first.status_code == second.status_code == status.HTTP_200_OK
+    assert first.headers["x-cache"] == "MISS"
+    assert second.headers["x-cache"] == "HIT"
+    assert second.json() == first.json()
+    assert mock_film_service.get_film.await_count == 1
+
+    assert await response_cache.purge(film_key(1)) == 1
+    third = await async_film_client.get(url)
+    assert third.headers["x-cache"] == "MISS"
+    assert mock_film_service.get_film.await_count == 2
+
+
+@pytest.mark.anyio
+async def test_list_cache_key_normalises_query(async_film_client, mock_film_service):
+    """Query parameter order does not create separate entries."""
+    await async_film_client.get("/api/v1/films/?page=1&page_size=10")
+    response = await async_film_client.get("/api/v1/films/?page_size=10&page=1")
+    assert response.headers["x-cache"] == "HIT"
+    assert mock_film_service.get_films.await_count == 1
+
+    await response_cache.purge(FILMS_LIST)
+    response = await async_film_client.get("/api/v1/films/?page=1&page_size=10")
+    assert response.headers["x-cache"] == "MISS"
+
+
+@pytest.mark.anyio
+async def test_errors_are_not_cached(async_film_client, mock_film_service):
+    """Error responses always reach the service."""
+    mock_film_service.get_film.return_value = None
+    for _ in range(2):
+        response = await async_film_client.get("/api/v1/films/404")
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+    assert mock_film_service.get_film.await_count == 2
+
+
+@pytest.mark.anyio
+async def test_cached_response_answers_conditional_request(async_film_client, mock_film_service, film_payload):
+    """A cached response with a matching ETag is answered with a bodiless 304."""
+    mock_film_service.get_film.return_value = film_payload
+    first = await async_film_client.get("/api/v1/films/1")
+
+    response = await async_film_client.get("/api/v1/films/1", headers={"If-None-Match": first.headers["etag"]})
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+    assert response.headers["x-cache"] == "HIT"
+    assert response.content == b""
+
+
+@pytest.mark.anyio
+async def test_purge_reaches_other_workers():
+    """A purge on one worker retires every entry on the others; its own untagged entries stay."""
+    backend = InMemoryCacheBackend()
+    worker_a, worker_b = (
+        ResponseCache(1024 * 1024, 1024, 60, SharedVersion("responses:version", check_seconds=0, backend=backend))
+        for _ in range(2)
+    )
+    for cache in (worker_a, worker_b):
+        await cache.sync()
+        cache.store("GET /films/1?", CachedResponse(200, [], b"{}", (film_key(1),)), cache.generation)
+        cache.store("GET /films/2?", CachedResponse(200, [], b"{}", (film_key(2),)), cache.generation)
+
+    assert await worker_a.purge(film_key(1)) == 1
+    assert worker_a.get("GET /films/1?") is None
+    assert worker_a.get("GET /films/2?") is not None
+
+    assert worker_b.get("GET /films/2?") is not None
+    await worker_b.sync()
+    assert worker_b.get("GET /films/1?") is None
+    assert worker_b.get("GET /films/2?") is None
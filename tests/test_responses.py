@@ -0,0 +1,103 @@
+"""
+Fast JSON response rendering tests.
+"""
+
+import pytest
+from datetime import datetime, timezone
+from decimal import Decimal
+
+import fastapi.routing
+from fastapi import Response, status
+
+from core import responses
+from core.responses import FastJSONResponse, model_response
+from domain.entities.base import MPAARating
+from domain.models.responses.film import FilmListResponse, FilmResponse
+
+
+def _film_list() -> FilmListResponse:
+    film = FilmResponse(
+        film_id=1,
+        title="ACADEMY DINOSAUR",
+        language_id=1,
+        language_name="English",
+        rental_duration=6,
+        rental_rate=0.99,
+        replacement_cost=20.99,
+        rating=MPAARating.PG,
+        special_features=["Deleted Scenes"],
+        last_update=datetime(2024, 1, 1, tzinfo=timezone.utc),
+    )
+    return FilmListResponse(films=[film], total=1, page=1, page_size=10)
+
+
+@pytest.fixture
+def serialize_spy(monkeypatch):
+    """Counts FastAPI's response_model validation and encoding passes."""
+    calls = []
+    original = fastapi.routing.serialize_response
+
+    async def serialize_response(*args, **kwargs):
+        calls.append(kwargs.get("field"))
+        return await original(*args, **kwargs)
+
+    monkeypatch.setattr(fastapi.routing, "serialize_response", serialize_response)
+    return calls
+
+
+@pytest.mark.anyio
+async def test_service_models_skip_response_model_validation(async_film_client, mock_film_service, serialize_spy, monkeypatch):
+    """The same body and headers come back either way; only the fast mode skips the second pass."""
+    mock_film_service.get_films.return_value = _film_list()
+
+    fast = await async_film_client.get("/api/v1/films/")
+    assert len(serialize_spy) == 0
+
+    monkeypatch.setattr(responses.settings, "fast_json_responses", False)
+    standard = await async_film_client.get("/api/v1/films/", headers={"Cache-Control": "no-cache"})
+    assert len(serialize_spy) == 1
+
+    assert fast.status_code == standard.status_code == status.HTTP_200_OK
+    assert fast.json() == standard.json()
+    assert fast.json()["films"][0]["last_update"] == "2024-01-01T00:00:00Z"
+    assert fast.headers["etag"] == standard.headers["etag"]
+    assert fast.headers["surrogate-key"] == standard.headers["surrogate-key"]
+    assert fast.headers["content-type"] == "application/json"
+
+
+@pytest.mark.anyio
+async def test_other_content_is_still_validated(async_film_client, mock_film_service, serialize_spy):
+    """Dicts (and anything not exactly the response model) go through response_model filtering."""
+    # The conftest mock listing is a dict with fields FilmResponse does not have
+    response = await async_film_client.get("/api/v1/films/")
+
+    assert response.status_code == status.HTTP_200_OK
+    assert len(serialize_spy) == 1
+    assert "categories" not in response.json()["films"][0]
+
+
+def test_model_response_keeps_headers_and_status():
+    sub_response = Response()
+    del sub_response.headers["content-length"]
+    sub_response.headers["ETag"] = '"1"'
+    sub_response.status_code = status.HTTP_201_CREATED
+
+    rendered = model_response(_film_list(), FilmListResponse, sub_response)
+
+    assert rendered.status_code == status.HTTP_201_CREATED
+    assert rendered.headers["etag"] == '"1"'
+    assert rendered.body == _film_list().model_dump_json().encode()
+    assert model_response(None, FilmResponse, sub_response) is None
+
+
+def test_fast_json_response_encodes_plain_content():
+    body = FastJSONResponse({
+        "rental_rate": Decimal("0.99"),
+        "rating": MPAARating.PG,
+        "last_update": datetime(2024, 1, 1),
+        "film": _film_list().films[0],
+    }).body
+
+    assert FastJSONResponse(None).body == b"null"
+    assert b'"rental_rate":0.99' in body and b'"rating":"PG"' in body
+    assert b'"last_update":"2024-01-01T00:00:00"' in body and b'"title":"ACADEMY DINOSAUR"' in body
@@ -0,0 +1,111 @@
+"""
+In-process BM25 film search index tests.
+"""
+
+import time
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from core.cache import InMemoryCacheBackend, SharedVersion
+from domain.catalog import search_index as search_index_module
+from domain.catalog.search_index import FilmSearchIndex
+
+
+@pytest.fixture
+def search_index():
+    """Search index with a handful of films."""
+    index = FilmSearchIndex()
+    index._loaded = True
+    index.upsert(1, "ACADEMY DINOSAUR", "A Epic Drama of a Feminist And a Mad Scientist", "PENELOPE GUINESS", "Documentary")
+    index.upsert(2, "ACE GOLDFINGER", "A Astounding Epistle of a Database Administrator", "BOB FAWCETT", "Horror")
+    index.upsert(3, "ADAPTATION HOLES", "A Astounding Reflection of a Lumberjack", "NICK WAHLBERG", "Documentary")
+    return index
+
+
+def test_search_ranks_title_matches_first(search_index):
+    """Terms in the title outweigh the same terms elsewhere."""
+    search_index.upsert(4, "DRAMA QUEEN", "A Boring Story", "", "Drama")
+    results, total = search_index.search("drama ", limit=10)
+    assert [film_id for film_id, _ in results] == [4, 1]
+    assert total == 2
+
+
+def test_search_expands_last_term_as_prefix(search_index):
+    """The last term matches as a prefix for search-as-you-type."""
+    results, _ = search_index.search("documentary acad")
+    assert results[0][0] == 1
+    assert search_index.search("acad ")[1] == 0
+
+
+def test_upsert_and_remove_update_results(search_index):
+    """Updates re-index titles while keeping actor and category terms."""
+    search_index.upsert(1, "ZEPHYR RISING", "Nothing to see")
+    assert search_index.search("academy ")[1] == 0
+    assert search_index.search("zephyr")[0][0][0] == 1
+    assert search_index.search("penelope")[0][0][0] == 1
+
+    search_index.remove(2)
+    search_index.remove(3)
+    assert len(search_index) == 1
+    assert search_index.search("documentary")[0] and search_index.search("bob")[1] == 0
+
+
+def _worker_index(backend, ttl_seconds=60):
+    """Loaded index of one worker, with a version shared through ``backend`` and a recorded ``load``."""
+    version = SharedVersion("search-index:version", check_seconds=0, backend=backend)
+    index = FilmSearchIndex(ttl_seconds=ttl_seconds, version=version)
+    index._loaded = True
+    index._loaded_at = time.monotonic()
+    index._loaded_version = 0
+    index.load = AsyncMock()
+    return index
+
+
+@pytest.fixture
+def film_session(monkeypatch):
+    monkeypatch.setattr(search_index_module, "get_engine_and_session_factory", lambda name: (None, MagicMock()))
+
+
+@pytest.mark.anyio
+async def test_other_workers_rebuild_after_a_write(film_session):
+    """A write reaches the other workers' indexes through the shared version; the writer does not rebuild."""
+    backend = InMemoryCacheBackend()
+    writer, reader = _worker_index(backend), _worker_index(backend)
+
+    writer.upsert(1, "ZEPHYR RISING", "Nothing to see")
+    await writer.changed()
+
+    await writer.ensure_fresh()
+    writer.load.assert_not_awaited()
+    await reader.ensure_fresh()
+    reader.load.assert_awaited_once()
+
+
+@pytest.mark.anyio
+async def test_concurrent_writes_rebuild_the_writer(film_session):
+    """A writer that missed another worker's write does not skip the rebuild."""
+    backend = InMemoryCacheBackend()
+    first, second = _worker_index(backend), _worker_index(backend)
+
+    await first.changed()
+    await second.changed()
+
+    await first.ensure_fresh()
+    first.load.assert_awaited_once()
+    await second.ensure_fresh()
+    second.load.assert_awaited_once()
+
+
+@pytest.mark.anyio
+async def test_stale_index_rebuilds_and_unloaded_index_stays_unloaded(film_session):
+    """The TTL bounds how long changes made outside the API go unseen; a disabled index is never built."""
+    stale = _worker_index(None, ttl_seconds=0)
+    await stale.ensure_fresh()
+    stale.load.assert_awaited_once()
+
+    unloaded = FilmSearchIndex()
+    unloaded.load = AsyncMock()
+    await unloaded.ensure_fresh()
+    await unloaded.changed()
+    unloaded.load.assert_not_awaited()
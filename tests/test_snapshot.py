@@ -0,0 +1,158 @@
+"""
+Columnar snapshot tests.
+"""
+
+import os
+import pytest
+from datetime import datetime, timezone
+from decimal import Decimal
+
+from fastapi import status
+
+import core.security
+from app.main import app
+from core.config import settings
+from domain.services.deps import get_snapshot_service
+from domain.services.snapshot_service import SnapshotService, arrow_schema
+
+pa = pytest.importorskip("pyarrow")
+pq = pytest.importorskip("pyarrow.parquet")
+
+RENTED = datetime(2005, 5, 24, 22, 53, 30, tzinfo=timezone.utc)
+
+
+def _rental(rental_id: int) -> tuple:
+    return (rental_id, RENTED, 367, 130, None if rental_id % 2 else RENTED, 1, RENTED)
+
+
+def _payment(payment_id: int) -> tuple:
+    return (payment_id, 130, 1, payment_id, Decimal("2.99"), RENTED)
+
+
+class _StreamResult:
+    def __init__(self, partitions):
+        self._partitions = partitions
+
+    async def partitions(self):
+        for rows in self._partitions:
+            yield rows
+
+
+class _Session:
+    """Streams fixed row partitions per table."""
+
+    def __init__(self, partitions_by_table):
+        self.partitions_by_table = partitions_by_table
+        self.queries = []
+
+    async def stream(self, query):
+        self.queries.append(query)
+        table = query.get_final_froms()[0].name
+        return _StreamResult(self.partitions_by_table[table])
+
+
+@pytest.fixture
+def rental_session():
+    return _Session({
+        "rental": [[_rental(i) for i in range(1, 5)], [_rental(i) for i in range(5, 8)]],
+        "payment": [[_payment(1)]],
+    })
+
+
+def test_arrow_schema_follows_entities():
+    """Column types map to Arrow types, tsvector columns are dropped."""
+    schema = arrow_schema("film")
+    assert "fulltext" not in schema.names
+    assert schema.field("rental_rate").type == pa.decimal128(4, 2)
+    assert schema.field("length").type == pa.int16()
+    assert schema.field("release_year").type == pa.int32()
+    assert schema.field("special_features").type == pa.list_(pa.string())
+    assert schema.field("last_update").type == pa.timestamp("us", tz="UTC")
+    assert not schema.field("title").nullable
+
+
+@pytest.mark.anyio
+async def test_parquet_snapshot_is_partitioned(tmp_path, rental_session, monkeypatch):
+    """Tables roll over to new part files and the manifest records every file."""
+    monkeypatch.setattr(settings, "snapshot_rows_per_file", 3)
+    service = SnapshotService(snapshot_dir=str(tmp_path))
+
+    manifest = await service.write_snapshot(rental_session, "snap", "parquet", ["rental", "payment"])
+
+    rental = manifest["tables"]["rental"]
+    assert rental["rows"] == 7
+    assert rental["files"] == ["rental/part-00000.parquet", "rental/part-00001.parquet", "rental/part-00002.parquet"]
+    table = pq.read_table(tmp_path / "snap" / "rental")
+    assert table.num_rows == 7
+    assert sorted(table.column("rental_id").to_pylist()) == list(range(1, 8))
+    assert table.column("return_date").null_count == 4
+
+    assert pq.read_table(tmp_path / "snap" / "payment").column("amount").to_pylist() == [Decimal("2.99")]
+    assert service.get_manifest("snap") == manifest
+    # Server-side cursor, batched
+    assert rental_session.queries[0].get_execution_options()["yield_per"] == settings.snapshot_batch_size
+
+
+@pytest.mark.anyio
+async def test_arrow_snapshot_round_trips(tmp_path, rental_session):
+    service = SnapshotService(snapshot_dir=str(tmp_path))
+
+    manifest = await service.write_snapshot(rental_session, "snap", "arrow", ["rental"])
+
+    path = tmp_path / "snap" / manifest["tables"]["rental"]["files"][0]
+    with pa.ipc.open_file(path) as reader:
+        assert reader.num_record_batches == 2
+        assert reader.read_all().num_rows == 7
+
+
+@pytest.mark.anyio
+async def test_failed_snapshot_leaves_nothing_behind(tmp_path):
+    """A snapshot that fails part-way is removed rather than left incomplete."""
+    session = _Session({"rental": [[_rental(1)]], "payment": [[("not", "a", "payment")]]})
+    service = SnapshotService(snapshot_dir=str(tmp_path))
+
+    with pytest.raises(Exception):
+        await service.write_snapshot(session, "snap", "parquet", ["rental", "payment"])
+    assert not os.path.exists(tmp_path / "snap")
+    assert service.get_manifest("snap") is None
+
+
+class _StubSnapshotService(SnapshotService):
+    started = []
+
+    async def create_snapshot(self, snapshot_id=None, file_format=None, tables=None):
+        self.started.append((snapshot_id, file_format))
+
+
+@pytest.fixture
+async def admin_client(async_film_client, monkeypatch, tmp_path):
+    monkeypatch.setattr(core.security, "ADMIN_TOKEN", "secret")
+    service = _StubSnapshotService(snapshot_dir=str(tmp_path))
+    app.dependency_overrides[get_snapshot_service] = lambda: service
+    async_film_client.headers["Authorization"] = "Bearer secret"
+    yield async_film_client, tmp_path
+
+
+@pytest.mark.anyio
+async def test_admin_snapshot_endpoints(admin_client):
+    client, snapshot_dir = admin_client
+
+    response = await client.post("/api/v1/admin/snapshots", params={"format": "arrow"})
+    assert response.status_code == status.HTTP_202_ACCEPTED
+    snapshot_id = response.json()["snapshot_id"]
+    assert _StubSnapshotService.started[-1] == (snapshot_id, "arrow")
+
+    response = await client.get(f"/api/v1/admin/snapshots/{snapshot_id}")
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    os.makedirs(snapshot_dir / snapshot_id)
+    response = await client.get(f"/api/v1/admin/snapshots/{snapshot_id}")
+    assert response.status_code == status.HTTP_202_ACCEPTED
+
+    (snapshot_dir / snapshot_id / "_manifest.json").write_text('{"snapshot_id": "%s", "tables": {}}' % snapshot_id)
+    response = await client.get(f"/api/v1/admin/snapshots/{snapshot_id}")
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["status"] == "complete"
+
+    response = await client.post("/api/v1/admin/snapshots", params={"format": "csv"})
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
@@ -0,0 +1,246 @@
+"""
+Admin COPY export tests.
+"""
+
+import tracemalloc
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock
+
+import anyio
+import pytest
+
+from fastapi import status
+
+import core.security
+from app.main import app
+from core.config import settings
+from core.pg_copy import copy_out, copy_query_csv
+from core.streaming import ContextStreamingResponse
+from domain.services.deps import get_table_export_service
+from domain.services.table_export_service import export_query
+
+RENTAL_ROWS = 3_000_000
+ROWS_PER_CHUNK = 1_000
+RENTAL_ROW = b"%d,2005-05-24 22:53:30+00,367,130,2005-05-26 22:04:30+00,1,2006-02-15 21:30:53+00\n"
+
+
+class SyntheticRentalConnection:
+    """Stands in for an asyncpg connection copying out a large rental table."""
+
+    def __init__(self, rows: int, fail_after_chunks: int = -1):
+        self.rows = rows
+        self.fail_after_chunks = fail_after_chunks
+        self.chunks_sent = 0
+        self.cancelled = False
+        self.options = None
+        self._chunk = bytearray(b"".join(RENTAL_ROW % i for i in range(ROWS_PER_CHUNK)))
+
+    async def copy_from_query(self, query, output, **options):
+        self.options = options
+        try:
+            await output(b"rental_id,rental_date,inventory_id,customer_id,return_date,staff_id,last_update\n")
+            for _ in range(0, self.rows, ROWS_PER_CHUNK):
+                if self.chunks_sent == self.fail_after_chunks:
+                    raise RuntimeError("connection lost")
+                # A fresh buffer per chunk, like data read off the socket
+                await output(bytes(self._chunk))
+                self.chunks_sent += 1
+        except anyio.get_cancelled_exc_class():
+            self.cancelled = True
+            raise
+
+
+@pytest.mark.anyio
+async def test_copy_out_memory_is_bounded():
+    """Millions of rows stream through with memory bounded by the queue, not the table."""
+    connection = SyntheticRentalConnection(RENTAL_ROWS)
+    chunk_size = len(connection._chunk)
+    total = 0
+
+    tracemalloc.start()
+    try:
+        async with copy_out(connection, "SELECT 1", max_pending_chunks=8, format="csv", header=True) as chunks:
+            async for chunk in chunks:
+                total += len(chunk)
+                # Slow consumer: let the producer run ahead as far as it can
+                await anyio.sleep(0)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert connection.chunks_sent == RENTAL_ROWS // ROWS_PER_CHUNK
+    assert total > 200 * 1024 * 1024
+    assert peak < 16 * chunk_size
+    assert connection.options == {"format": "csv", "header": True}
+
+
+@pytest.mark.anyio
+async def test_copy_out_abandoned_cancels_copy():
+    """A consumer that stops early cancels the copy instead of leaving it running."""
+    connection = SyntheticRentalConnection(RENTAL_ROWS)
+    async with copy_out(connection, "SELECT 1", max_pending_chunks=2) as chunks:
+        async for _ in chunks:
+            break
+
+    assert connection.cancelled
+    assert connection.chunks_sent < 10
+
+
+@pytest.mark.anyio
+async def test_copy_out_raises_producer_errors():
+    """A failed copy surfaces to the consumer after the chunks already produced."""
+    connection = SyntheticRentalConnection(RENTAL_ROWS, fail_after_chunks=3)
+    received = 0
+    with pytest.raises(RuntimeError, match="connection lost"):
+        async with copy_out(connection, "SELECT 1") as chunks:
+            async for _ in chunks:
+                received += 1
+    assert received == 4  # header + 3 chunks
+
+
+def _engine(connection):
+    """Engine whose pooled connection wraps an asyncpg stand-in."""
+    pooled = MagicMock(
+        get_raw_connection=AsyncMock(return_value=MagicMock(driver_connection=connection)),
+        invalidate=AsyncMock(),
+    )
+
+    @asynccontextmanager
+    async def connect():
+        yield pooled
+
+    return MagicMock(connect=connect), pooled
+
+
+@pytest.mark.anyio
+async def test_abandoned_copy_invalidates_the_connection():
+    """A connection left mid-COPY by an abandoned export is not returned to the pool."""
+    connection = SyntheticRentalConnection(RENTAL_ROWS)
+    engine, pooled = _engine(connection)
+    async with copy_query_csv(engine, "SELECT 1", max_pending_chunks=2) as chunks:
+        async for chunk in chunks:
+            assert chunk.startswith(b"rental_id,")
+            break
+
+    assert connection.cancelled
+    pooled.invalidate.assert_awaited_once()
+    assert connection.options == {"format": "csv", "header": True}
+
+
+@pytest.mark.anyio
+async def test_completed_copy_keeps_the_connection():
+    connection = SyntheticRentalConnection(ROWS_PER_CHUNK * 2)
+    engine, pooled = _engine(connection)
+    async with copy_query_csv(engine, "SELECT 1") as chunks:
+        received = [chunk async for chunk in chunks]
+
+    assert len(received) == 3
+    pooled.invalidate.assert_not_awaited()
+
+
+@pytest.mark.anyio
+async def test_client_disconnect_mid_copy_invalidates_the_connection():
+    """The response closes the COPY body in its own task when the client goes away."""
+    connection = SyntheticRentalConnection(RENTAL_ROWS)
+    engine, pooled = _engine(connection)
+    disconnected = anyio.Event()
+    bodies = []
+
+    async def receive():
+        await disconnected.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        if message["type"] == "http.response.body":
+            bodies.append(message["body"])
+            disconnected.set()
+
+    response = ContextStreamingResponse(lambda: copy_query_csv(engine, "SELECT 1", max_pending_chunks=2))
+    await response({"type": "http", "asgi": {"spec_version": "2.0"}}, receive, send)
+
+    assert bodies and bodies[0].startswith(b"rental_id,")
+    # The copy stopped (cancelled, or its output stream closed) instead of running to the end
+    assert connection.chunks_sent < 10
+    pooled.invalidate.assert_awaited_once()
+
+
+def test_export_query_is_whitelisted():
+    """Only known tables export, ordered by key and without tsvector columns."""
+    query = export_query("film")
+    assert query.startswith("SELECT film.film_id")
+    assert "fulltext" not in query
+    assert query.endswith("ORDER BY film.film_id")
+    with pytest.raises(ValueError):
+        export_query("staff")
+
+
+class _StubExportService:
+    @asynccontextmanager
+    async def csv(self, table):
+        yield _chunks([f"{table}_id\n".encode(), b"1\n2\n"])
+
+
+async def _chunks(chunks):
+    for chunk in chunks:
+        yield chunk
+
+
+@pytest.fixture
+async def admin_client(async_film_client, monkeypatch):
+    monkeypatch.setattr(core.security, "ADMIN_TOKEN", "secret")
+    app.dependency_overrides[get_table_export_service] = lambda: _StubExportService()
+    yield async_film_client
+
+
+@pytest.mark.anyio
+async def test_admin_export_streams_csv(admin_client):
+    response = await admin_client.get(
+        "/api/v1/admin/export/rental.csv", headers={"Authorization": "Bearer secret"}
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"].startswith("text/csv")
+    assert response.headers["cache-control"] == "no-store"
+    assert response.content == b"rental_id\n1\n2\n"
+
+
+@pytest.mark.anyio
+async def test_admin_export_requires_token_and_known_table(admin_client):
+    response = await admin_client.get("/api/v1/admin/export/rental.csv")
+    assert response.status_code in (status.HTTP_401_UNAUTHORIZED, status.HTTP_403_FORBIDDEN)
+
+    response = await admin_client.get(
+        "/api/v1/admin/export/rental.csv", headers={"Authorization": "Bearer wrong"}
+    )
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    response = await admin_client.get(
+        "/api/v1/admin/export/customer.csv", headers={"Authorization": "Bearer secret"}
+    )
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
+@pytest.mark.anyio
+@pytest.mark.skipif(not settings.film_database_url, reason="FILM_DATABASE_URL not set")
+async def test_copy_query_csv_against_postgres_is_bounded():
+    """A multi-million-row synthetic rental result streams from Postgres in bounded memory."""
+    from core.db import get_engine_and_session_factory
+
+    engine, _ = get_engine_and_session_factory("film")
+    query = (
+        f"SELECT g AS rental_id, now() AS rental_date, g % 4581 + 1 AS inventory_id, "
+        f"g % 599 + 1 AS customer_id, NULL::timestamptz AS return_date, 1 AS staff_id, now() AS last_update "
+        f"FROM generate_series(1, {RENTAL_ROWS}) AS g"
+    )
+    lines = 0
+
+    tracemalloc.start()
+    try:
+        async with copy_query_csv(engine, query, max_pending_chunks=8) as chunks:
+            async for chunk in chunks:
+                lines += chunk.count(b"\n")
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert lines == RENTAL_ROWS + 1
+    assert peak < 32 * 1024 * 1024
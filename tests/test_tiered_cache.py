@@ -0,0 +1,111 @@
+"""
+Two-tier read-through cache tests.
+"""
+
+import pytest
+from unittest.mock import AsyncMock
+
+from core.cache import CacheBackend, InMemoryCacheBackend, TieredCache
+
+
+def _worker_cache(backend: CacheBackend) -> TieredCache:
+    """A cache as one worker would hold it, sharing ``backend`` with others."""
+    return TieredCache(
+        "film",
+        dumps=lambda value: value.encode(),
+        loads=lambda data: data.decode(),
+        ttl_seconds=60,
+        local_max_bytes=1024,
+        version_check_seconds=0,
+        backend=backend,
+    )
+
+
+@pytest.mark.anyio
+async def test_read_through_shares_loads_between_workers():
+    """The first worker loads from the database; the second reads L2."""
+    backend = InMemoryCacheBackend()
+    worker_a, worker_b = _worker_cache(backend), _worker_cache(backend)
+    loader = AsyncMock(return_value="Academy Dinosaur")
+
+    assert await worker_a.get_or_load("1", loader) == "Academy Dinosaur"
+    assert await worker_a.get_or_load("1", loader) == "Academy Dinosaur"
+    assert await worker_b.get_or_load("1", loader) == "Academy Dinosaur"
+
+    assert loader.await_count == 1
+    assert worker_b.l2_hits == 1
+
+
+@pytest.mark.anyio
+async def test_invalidation_reaches_other_workers():
+    """Bumping the namespace version retires other workers' local copies."""
+    backend = InMemoryCacheBackend()
+    worker_a, worker_b = _worker_cache(backend), _worker_cache(backend)
+    await worker_b.get_or_load("1", AsyncMock(return_value="old title"))
+
+    await worker_a.invalidate()
+
+    assert await worker_b.get_or_load("1", AsyncMock(return_value="new title")) == "new title"
+
+
+@pytest.mark.anyio
+async def test_discard_retires_only_that_key_on_other_workers():
+    """A single-key discard reaches other workers without dropping their other entries."""
+    backend = InMemoryCacheBackend()
+    worker_a, worker_b = _worker_cache(backend), _worker_cache(backend)
+    await worker_b.get_or_load("1", AsyncMock(return_value="old title"))
+    await worker_b.get_or_load("2", AsyncMock(return_value="other film"))
+    dropped = []
+    worker_b.add_listener(dropped.append)
+
+    await worker_a.discard("1")
+
+    loader = AsyncMock(return_value="new title")
+    assert await worker_b.get_or_load("1", loader) == "new title"
+    assert await worker_b.get_or_load("2", AsyncMock()) == "other film"
+    assert loader.await_count == 1
+    assert dropped == ["1"]
+    assert worker_b.stats()["version"] == 0
+
+
+@pytest.mark.anyio
+async def test_worker_missing_the_change_log_drops_its_local_tier():
+    """Changes that can no longer be read retire every local entry."""
+    backend = InMemoryCacheBackend()
+    worker_a, worker_b = _worker_cache(backend), _worker_cache(backend)
+    await worker_b.get_or_load("2", AsyncMock(return_value="other film"))
+    dropped = []
+    worker_b.add_listener(dropped.append)
+
+    await worker_a.discard("1")
+    await backend.delete("film:change:1")
+    await worker_b.sync()
+
+    assert dropped == [None]
+    assert worker_b.stats()["local"]["entries"] == 0
+
+
+@pytest.mark.anyio
+async def test_missing_values_are_not_cached():
+    """None from the loader is returned but never stored."""
+    cache = _worker_cache(InMemoryCacheBackend())
+    loader = AsyncMock(return_value=None)
+
+    assert await cache.get_or_load("404", loader) is None
+    assert await cache.get_or_load("404", loader) is None
+    assert loader.await_count == 2
+
+
+@pytest.mark.anyio
+async def test_backend_failures_fall_through_to_loader():
+    """An unreachable L2 backend degrades to local cache plus loader."""
+    backend = AsyncMock(spec=CacheBackend)
+    backend.get.side_effect = ConnectionError("redis down")
+    backend.set.side_effect = ConnectionError("redis down")
+    cache = _worker_cache(backend)
+    loader = AsyncMock(return_value="Academy Dinosaur")
+
+    assert await cache.get_or_load("1", loader) == "Academy Dinosaur"
+    assert await cache.get_or_load("1", loader) == "Academy Dinosaur"
+    assert loader.await_count == 1
+    assert cache.l2_errors > 0